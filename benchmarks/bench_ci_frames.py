@@ -0,0 +1,149 @@
+"""
+Payload-size and build-time benchmark for the confidence-interval animation.
+
+Compares the former frame builder (one complete go.Frame with ~23 traces and
+three annotations per sample) with the delta-encoded build_ci_figure from
+utils.animation_utils. Reports the time to build the figure, the time to
+serialize it to JSON and the JSON size. The "arrays" row times only the
+vectorized simulation and frame arrays, without Plotly's object model; the
+"client" row measures the numeric payload of the browser-side animation.
+The page only uses the Plotly figure up to MAX_PLOTLY_FRAMES samples, where
+it stays under 100 ms; larger batches use the browser-side animation.
+Run from the repository root:
+
+    python -m benchmarks.bench_ci_frames [--n 30]
+"""
+import argparse
+import json
+import time
+from collections import deque
+
+import numpy as np
+import plotly.graph_objects as go
+from scipy.stats import norm
+
+import stats_core as sc
+from utils.animation_utils import build_ci_figure, ci_payload, window_frames
+from utils.constants import *
+
+BATCH_SIZES = [10, 100, 1_000, 10_000]
+
+
+def legacy_traces(intervals, means, contains, sample, xbar, mu, sigma):
+    traces = [
+        go.Scatter(x=[mu - 4 * sigma, mu + 4 * sigma], y=[1, 1],
+                   mode="markers", marker=dict(opacity=0), showlegend=False),
+        go.Scatter(x=sample, y=[-1] * len(sample), mode="markers",
+                   marker=dict(size=8, color=OBSERVATION_COLOR), showlegend=False),
+        go.Scatter(x=[xbar], y=[-1], mode="markers",
+                   marker=dict(size=14, color=SAMPLE_MEAN_COLOR), showlegend=False),
+    ]
+    for i, (l, r) in enumerate(intervals):
+        if (l, r) == (mu, mu):
+            traces += [
+                go.Scatter(x=[mu, mu], y=[i, i], mode="markers",
+                           marker=dict(size=0, opacity=0), showlegend=False),
+                go.Scatter(x=[mu], y=[i], mode="markers",
+                           marker=dict(size=0, opacity=0), showlegend=False),
+            ]
+        else:
+            color = ACCEPTABLE_COLOR if contains[i] else CRITICAL_COLOR
+            traces += [
+                go.Scatter(x=[l, r], y=[i, i], mode="lines",
+                           line=dict(color=color, width=3), showlegend=False),
+                go.Scatter(x=[means[i]], y=[i], mode="markers",
+                           marker=dict(size=9, color=SAMPLE_MEAN_COLOR), showlegend=False),
+            ]
+    return traces
+
+
+def legacy_annotations(intervals, means, contains, mu):
+    l, r = intervals[0]
+    if (l, r) == (mu, mu):
+        return []
+    color = ACCEPTABLE_COLOR if contains[0] else CRITICAL_COLOR
+    font  = dict(size=10 + ANNOTATION_FONT_SIZE, family=FONT_FAMILY)
+    return [
+        dict(x=means[0], y=0.40, xanchor="center", xref="x", yref="y", text=f"{means[0]:.2f}",
+             showarrow=False, font=dict(font, color=SAMPLE_MEAN_COLOR)),
+        dict(x=l, y=0.40, xref="x", xanchor="right", text=f"{l:.2f}",
+             showarrow=False, font=dict(font, color=color)),
+        dict(x=r, y=0.40, xref="x", xanchor="left", text=f"{r:.2f}",
+             showarrow=False, font=dict(font, color=color)),
+    ]
+
+
+def legacy_build_figure(mu, sigma, n, alpha, batch_size, frame_duration):
+    z  = norm.ppf(1 - alpha / 2)
+    se = sigma / np.sqrt(n)
+
+    all_samples = [np.random.normal(mu, sigma, n) for _ in range(batch_size)]
+    all_xbars   = np.array([s.mean() for s in all_samples])
+    lefts, rights = all_xbars - z * se, all_xbars + z * se
+    hits = (lefts <= mu) & (mu <= rights)
+
+    intervals = deque([(mu, mu)] * 10, maxlen=10)
+    means     = deque([mu] * 10, maxlen=10)
+    contains  = deque([False] * 10, maxlen=10)
+
+    frames = []
+    for k in range(batch_size):
+        intervals.appendleft((lefts[k], rights[k]))
+        means.appendleft(all_xbars[k])
+        contains.appendleft(hits[k])
+        frames.append(go.Frame(
+            data=legacy_traces(intervals, means, contains, all_samples[k], all_xbars[k], mu, sigma),
+            name=str(k),
+            layout=go.Layout(annotations=legacy_annotations(intervals, means, contains, mu)),
+        ))
+
+    fig = go.Figure(data=frames[0].data, frames=frames,
+                    layout=go.Layout(annotations=frames[0].layout.annotations))
+    return fig, int(hits.sum())
+
+
+def measure(build, n: int, batch_size: int) -> tuple[float, float, int]:
+    t0 = time.perf_counter()
+    fig, _ = build(0.0, 2.0, n, 0.05, batch_size, 500)
+    t_build = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    payload = fig.to_json()
+    t_json = time.perf_counter() - t0
+    return t_build, t_json, len(payload)
+
+
+def measure_arrays(n: int, batch_size: int) -> float:
+    t0 = time.perf_counter()
+    window_frames(sc.simulate_z_intervals(0.0, 2.0, n, 0.05, batch_size, rng=0))
+    return time.perf_counter() - t0
+
+
+def measure_client(n: int, batch_size: int) -> tuple[float, int]:
+    t0 = time.perf_counter()
+    sim     = sc.simulate_z_intervals(0.0, 2.0, n, 0.05, batch_size, rng=0)
+    payload = json.dumps(ci_payload(sim, 0.0, 2.0, 500))
+    return time.perf_counter() - t0, len(payload)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--n", type=int, default=30, help="sample size per interval")
+    parser.add_argument("--figure-max", type=int, default=1_000,
+                        help="largest batch size to build Plotly figures for")
+    args = parser.parse_args()
+
+    print(f"{'batch':>6} | {'builder':>7} | {'build (s)':>9} | {'to_json (s)':>11} | {'JSON (kB)':>10}")
+    print("-" * 57)
+    for batch_size in BATCH_SIZES:
+        if batch_size <= args.figure_max:
+            for label, build in (("legacy", legacy_build_figure), ("delta", build_ci_figure)):
+                t_build, t_json, size = measure(build, args.n, batch_size)
+                print(f"{batch_size:6d} | {label:>7} | {t_build:9.3f} | {t_json:11.3f} | {size / 1024:10.1f}")
+        print(f"{batch_size:6d} | {'arrays':>7} | {measure_arrays(args.n, batch_size):9.3f} |")
+        t_client, size = measure_client(args.n, batch_size)
+        print(f"{batch_size:6d} | {'client':>7} | {t_client:9.3f} | {'':>11} | {size / 1024:10.1f}")
+
+
+if __name__ == "__main__":
+    main()
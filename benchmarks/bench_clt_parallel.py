@@ -0,0 +1,47 @@
+"""
+Scaling benchmark for the parallel CLT sampler.
+
+Runs parallel_sample_means with 1..N worker threads on the same seed, reports
+wall time and speed-up relative to one worker, and checks that every worker
+count produces bit-identical sample means. Run from the repository root:
+
+    python -m benchmarks.bench_clt_parallel [--max-workers 8] [--n-samples 2000000]
+"""
+import argparse
+import os
+import time
+
+import numpy as np
+
+import stats_core as sc
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--n-samples", type=int, default=2_000_000)
+    parser.add_argument("--sample-size", type=int, default=100)
+    parser.add_argument("--engine", choices=sc.ENGINES, default=sc.REFERENCE)
+    parser.add_argument("--seed", type=int, default=2024)
+    args = parser.parse_args()
+
+    dist = sc.exponential(1.0)
+    print(f"os.cpu_count() = {os.cpu_count()}, n_samples = {args.n_samples:,}, "
+          f"sample_size = {args.sample_size}, engine = {args.engine}\n")
+    print(f"{'workers':>7} | {'time (s)':>8} | {'speed-up':>8} | identical")
+    print("-" * 42)
+
+    reference, t_single = None, None
+    for workers in range(1, args.max_workers + 1):
+        t0    = time.perf_counter()
+        means = sc.parallel_sample_means(dist, args.sample_size, args.n_samples,
+                                         seed=args.seed, workers=workers, engine=args.engine)
+        elapsed = time.perf_counter() - t0
+        if reference is None:
+            reference, t_single = means, elapsed
+        print(f"{workers:7d} | {elapsed:8.2f} | {t_single / elapsed:8.2f} | "
+              f"{np.array_equal(means, reference)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Peak-memory and wall-time benchmark for the CLT sample-mean sampler.
+
+Compares the former implementation (one full (sample_size, n_samples) matrix
+from scipy's rvs, then .mean(axis=0)) with the chunked stats_core sampler,
+using both its reference (per-observation) and fast (exact sum) engines.
+Every scenario runs in a fresh interpreter so its peak RSS can be read from
+getrusage. Run from the repository root:
+
+    python -m benchmarks.bench_clt_sampling [--n-samples 100000] [--legacy-max-gb 2]
+"""
+import argparse
+import subprocess
+import sys
+
+SAMPLE_SIZES = [10, 100, 1_000, 10_000]
+
+SETUP = """
+import resource, time
+import numpy as np
+"""
+
+LEGACY = """
+from scipy.stats import expon
+_t0 = time.perf_counter()
+means = expon.rvs(scale=1.0, size=({sample_size}, {n_samples})).mean(axis=0)
+"""
+
+CHUNKED = """
+import stats_core as sc
+_t0 = time.perf_counter()
+means = sc.sample_means(sc.exponential(1.0), {sample_size}, {n_samples},
+                        rng=0, memory_budget={budget}, engine={engine!r})
+"""
+
+REPORT = """
+elapsed = time.perf_counter() - _t0
+print(elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+
+def run_once(body: str) -> tuple[float, float]:
+    out = subprocess.run(
+        [sys.executable, "-c", SETUP + body + REPORT],
+        check=True, capture_output=True, text=True,
+    )
+    elapsed, max_rss_kb = out.stdout.split()
+    return float(elapsed), int(max_rss_kb) / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--n-samples", type=int, default=100_000)
+    parser.add_argument("--budget-mb", type=int, default=64,
+                        help="memory budget of the chunked sampler")
+    parser.add_argument("--legacy-max-gb", type=float, default=2.0,
+                        help="skip the legacy run when its matrix would exceed this")
+    args = parser.parse_args()
+
+    print(f"n_samples = {args.n_samples:,}, budget = {args.budget_mb} MB\n")
+    print(f"{'sample_size':>11} | {'legacy (s)':>10} {'peak MB':>8} | {'chunked (s)':>11} {'peak MB':>8}"
+          f" | {'fast (s)':>8} {'peak MB':>8}")
+    print("-" * 78)
+    for sample_size in SAMPLE_SIZES:
+        matrix_gb = 8 * sample_size * args.n_samples / 2**30
+        if matrix_gb <= args.legacy_max_gb:
+            t_old, m_old = run_once(LEGACY.format(sample_size=sample_size, n_samples=args.n_samples))
+            old = f"{t_old:10.2f} {m_old:8.0f}"
+        else:
+            old = f"{'skipped':>10} {f'~{1024 * matrix_gb:.0f}':>8}"
+        t_new, m_new = run_once(CHUNKED.format(
+            sample_size=sample_size, n_samples=args.n_samples, budget=args.budget_mb * 2**20,
+            engine="reference",
+        ))
+        t_fast, m_fast = run_once(CHUNKED.format(
+            sample_size=sample_size, n_samples=args.n_samples, budget=args.budget_mb * 2**20,
+            engine="fast",
+        ))
+        print(f"{sample_size:11d} | {old} | {t_new:11.2f} {m_new:8.0f} | {t_fast:8.3f} {m_fast:8.0f}")
+
+
+if __name__ == "__main__":
+    main()
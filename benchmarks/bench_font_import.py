@@ -0,0 +1,69 @@
+"""
+Cold-import benchmark for the font registration.
+
+Every scenario runs in a fresh interpreter, so each measurement is a cold
+start of the Matplotlib font manager as a new Streamlit worker would see it.
+Run from the repository root:
+
+    python -m benchmarks.bench_font_import [--repeat 5]
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+FONT_PATH = "./styles/JetBrainsMono-Regular.ttf"
+
+LEGACY = f"""
+import matplotlib.font_manager as fm
+fm.fontManager.addfont({FONT_PATH!r})
+fm._load_fontmanager(try_read_cache=False)
+"""
+
+# Load font_utils by path: importing the `utils` package would also pull in
+# Streamlit.
+REGISTER = """
+import importlib.util
+spec = importlib.util.spec_from_file_location("font_utils", "./utils/font_utils.py")
+font_utils = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(font_utils)
+font_utils.register_fonts()
+"""
+
+TIMED = """
+import time
+_t0 = time.perf_counter()
+{body}
+print(time.perf_counter() - _t0)
+"""
+
+
+def run_once(body: str) -> float:
+    out = subprocess.run(
+        [sys.executable, "-c", TIMED.format(body=body)],
+        check=True, capture_output=True, text=True,
+    )
+    return float(out.stdout.strip().splitlines()[-1])
+
+
+def measure(label: str, make_body, repeat: int) -> None:
+    timings = [run_once(make_body()) for _ in range(repeat)]
+    print(f"{label:<34} median {1000 * statistics.median(timings):8.1f} ms"
+          f"   min {1000 * min(timings):8.1f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    measure("import font_manager only", lambda: "import matplotlib.font_manager", args.repeat)
+    measure("legacy (addfont + full rescan)", lambda: LEGACY, args.repeat)
+    measure("register_fonts (addfont only)", lambda: REGISTER, args.repeat)
+    print(f"\ntotal benchmark time: {time.perf_counter() - t0:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
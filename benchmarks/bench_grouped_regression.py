@@ -0,0 +1,60 @@
+"""
+Timing benchmark for the per-group regression fits.
+
+Compares fitting every group with a boolean mask per group, O(n · groups),
+with stats_core.grouped_regression, which reduces all groups in a fixed
+number of np.bincount passes, O(n) whatever the number of groups. Both
+produce the same RegressionStats. Run from the repository root:
+
+    python -m benchmarks.bench_grouped_regression [--n 1000000]
+"""
+import argparse
+import time
+
+import numpy as np
+
+import stats_core as sc
+
+GROUPS = [2, 5, 10, 50, 200]
+
+
+def data(n: int, n_groups: int):
+    rng   = np.random.default_rng(0)
+    codes = rng.integers(0, n_groups, n)
+    x     = rng.uniform(0, 100, n)
+    return codes, x, (1 + codes / n_groups) * x + rng.normal(0, 8, n)
+
+
+def masked(codes, x, y, n_groups):
+    return [sc.RegressionStats.from_arrays(x[codes == g], y[codes == g]) for g in range(n_groups)]
+
+
+def best_of(fn, *args, repeat: int = 3) -> float:
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(*args)
+        times.append(time.perf_counter() - t0)
+    return min(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--n", type=int, default=1_000_000, help="number of points")
+    args = parser.parse_args()
+
+    print(f"n = {args.n:,}\n")
+    print(f"{'groups':>6} | {'masked (s)':>10} | {'bincount (s)':>12} | {'speed-up':>8} | {'max |Δslope|':>12}")
+    print("-" * 62)
+    for n_groups in GROUPS:
+        codes, x, y = data(args.n, n_groups)
+        t_masked    = best_of(masked, codes, x, y, n_groups)
+        t_bincount  = best_of(sc.grouped_regression, codes, x, y, n_groups)
+        slopes      = [(a.fit().slope, b.fit().slope) for a, b in
+                       zip(masked(codes, x, y, n_groups), sc.grouped_regression(codes, x, y, n_groups))]
+        error       = max(abs(a - b) for a, b in slopes)
+        print(f"{n_groups:6d} | {t_masked:10.3f} | {t_bincount:12.3f} | {t_masked / t_bincount:7.1f}x | {error:12.2e}")
+
+
+if __name__ == "__main__":
+    main()
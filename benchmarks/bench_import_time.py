@@ -0,0 +1,97 @@
+"""
+Cold-start import benchmark for the pages.
+
+Every page runs in a fresh interpreter under `python -X importtime`, as on a
+newly started Streamlit worker. Streamlit itself is imported before the
+measurement starts, because every page needs it anyway; the report covers
+what a page adds on top of that, split over the heavy packages.
+
+Two stages are measured per page:
+
+    import   the page's top-level import statements only
+    render   a full first run of the page (streamlit.testing AppTest), which
+             also counts modules that are imported lazily on first use
+
+Run from the repository root:
+
+    python -m benchmarks.bench_import_time [page.py ...]
+"""
+import argparse
+import ast
+import subprocess
+import sys
+from pathlib import Path
+
+HEAVY  = ["scipy", "sklearn", "matplotlib", "pandas", "plotly", "PIL"]
+MARKER = "--- measurement starts ---"
+
+IMPORTS = """
+import sys
+import streamlit
+print({marker!r}, file=sys.stderr, flush=True)
+{body}
+"""
+
+RENDER = """
+import sys
+import streamlit
+from streamlit.testing.v1 import AppTest
+print({marker!r}, file=sys.stderr, flush=True)
+AppTest.from_file({page!r}, default_timeout=300).run()
+"""
+
+
+def page_imports(page: str) -> str:
+    """The top-level import statements of a page, as source."""
+    source = Path(page).read_text()
+    tree   = ast.parse(source)
+    nodes  = [node for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))]
+    return "\n".join(ast.get_source_segment(source, node) for node in nodes)
+
+
+def importtime(code: str) -> dict[str, int]:
+    """
+    Run `code` under -X importtime and return microseconds per top-level package.
+
+    Self times are summed per package, so a package's own cost is not charged
+    to whichever module happened to import it first. Key "total" holds the sum.
+    """
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        check=True, capture_output=True, text=True,
+    )
+    lines   = out.stderr.splitlines()
+    started = False
+    totals  = {"total": 0}
+    for line in lines:
+        if line == MARKER:
+            started = True
+            continue
+        if not started or not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        package = name.split(".")[0]
+        totals[package]  = totals.get(package, 0) + int(self_us)
+        totals["total"] += int(self_us)
+    return totals
+
+
+def report(page: str, stage: str, totals: dict[str, int]) -> None:
+    heavy = "  ".join(f"{name} {totals[name] / 1000:6.0f}" for name in HEAVY if name in totals)
+    print(f"{page:<36} {stage:<7} {totals['total'] / 1000:7.0f} ms   {heavy}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("pages", nargs="*", help="pages to measure (default: all)")
+    args = parser.parse_args()
+
+    pages = args.pages or sorted(str(p) for p in Path(".").glob("interactive*.py"))
+    print(f"{'page':<36} {'stage':<7} {'total':>10}   heavy packages (ms)")
+    for page in pages:
+        report(page, "import", importtime(IMPORTS.format(marker=MARKER, body=page_imports(page))))
+        report(page, "render", importtime(RENDER.format(marker=MARKER, page=page)))
+
+
+if __name__ == "__main__":
+    main()
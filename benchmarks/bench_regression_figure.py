@@ -0,0 +1,100 @@
+"""
+Payload-size and build-time benchmark for the regression plot.
+
+Compares the former figure (one go.Scatter trace per residual) with
+regression_traces from utils.regression_utils in both of its display modes:
+"points" draws every point and all residuals as one NaN-separated trace
+(Scattergl from WEBGL_THRESHOLD points on), "density" bins the points into a
+heatmap and draws residuals for a stratified sample only. Reports the trace
+count, the time to build the figure, the time to serialize it to JSON (what
+st.plotly_chart sends) and the JSON size. Browser render time is not
+measured here; it grows with the number of markers and line segments, which
+the density mode caps at the heatmap size and the residual sample.
+Run from the repository root:
+
+    python -m benchmarks.bench_regression_figure [--legacy-max 10000]
+"""
+import argparse
+import time
+
+import numpy as np
+import plotly.graph_objects as go
+
+import stats_core as sc
+from utils.constants import *
+from utils.regression_utils import DENSITY_THRESHOLD, WEBGL_THRESHOLD, regression_traces
+
+SIZES = [10, 100, 1_000, 10_000, 100_000, 1_000_000]
+
+
+def points(n: int):
+    rng = np.random.default_rng(0)
+    x   = rng.uniform(0, 100, n)
+    return x, 0.8 * x + 10 + rng.normal(0, 8, n)
+
+
+def x_range_for(x):
+    margin = max(0.5, 0.15 * (x.max() - x.min()))
+    return np.linspace(x.min() - margin, x.max() + margin, 1_000)
+
+
+def legacy_figure(x, y, fit):
+    x_range = x_range_for(x)
+    fig     = go.Figure()
+    for xi, yi, yh in zip(x.tolist(), y.tolist(), fit.predict(x)):
+        fig.add_trace(go.Scatter(
+            x=[xi, xi], y=[yi, float(yh)], mode="lines",
+            line=dict(color=RESIDUAL_COLOR, width=1.5, dash="dash"), showlegend=False,
+        ))
+    fig.add_trace(go.Scatter(x=x_range, y=fit.predict(x_range), mode="lines",
+                             line=dict(color=REGRESSION_COLOR, width=3), showlegend=False))
+    fig.add_trace(go.Scatter(x=x.tolist(), y=y.tolist(), mode="markers",
+                             marker=dict(color=POINT_COLOR, size=12, line=dict(color="white", width=1)),
+                             showlegend=False))
+    return fig
+
+
+def points_figure(x, y, fit):
+    fig = go.Figure()
+    fig.add_traces(regression_traces(x, y, fit, x_range_for(x), 95, density_threshold=np.inf))
+    return fig
+
+
+def density_figure(x, y, fit):
+    fig = go.Figure()
+    fig.add_traces(regression_traces(x, y, fit, x_range_for(x), 95, density_threshold=0))
+    return fig
+
+
+def measure(build, x, y) -> tuple[int, float, float, int]:
+    fit = sc.RegressionStats.from_arrays(x, y).fit()
+
+    t0 = time.perf_counter()
+    fig = build(x, y, fit)
+    t_build = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    payload = fig.to_json()
+    t_json = time.perf_counter() - t0
+    return len(fig.data), t_build, t_json, len(payload)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--legacy-max", type=int, default=10_000,
+                        help="largest n to build the per-residual figure for")
+    args = parser.parse_args()
+
+    print(f"WebGL from {WEBGL_THRESHOLD} points on, density display from {DENSITY_THRESHOLD} on\n")
+    print(f"{'n':>7} | {'figure':>7} | {'traces':>6} | {'build (s)':>9} | {'to_json (s)':>11} | {'JSON (kB)':>10}")
+    print("-" * 66)
+    for n in SIZES:
+        x, y = points(n)
+        builders = [("legacy", legacy_figure)] if n <= args.legacy_max else []
+        for label, build in builders + [("points", points_figure), ("density", density_figure)]:
+            traces, t_build, t_json, size = measure(build, x, y)
+            print(f"{n:7d} | {label:>7} | {traces:6d} | {t_build:9.3f} | {t_json:11.3f} | {size / 1024:10.1f}")
+
+
+if __name__ == "__main__":
+    main()
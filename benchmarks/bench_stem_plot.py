@@ -0,0 +1,67 @@
+"""
+Render-time benchmark for the stem (needle) plot.
+
+Compares the former per-point renderer (one ax.plot and one ax.scatter per k)
+with the batched stem_plot from utils.streamlit_utils. The timing covers
+building the artists and drawing the figure with the Agg backend.
+Run from the repository root:
+
+    python -m benchmarks.bench_stem_plot [--legacy-max 10000]
+"""
+import argparse
+import time
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import numpy as np
+
+from utils.streamlit_utils import stem_plot, get_highlighted
+
+SIZES = [10, 100, 1_000, 10_000, 100_000]
+
+
+def legacy_stem_plot(ax, k, y, color, highlighted=None, highlight_color=None):
+    for xi, yi in zip(k, y):
+        c = highlight_color if (highlighted is not None and xi in highlighted) else color
+        ax.plot([xi, xi], [0, yi], color=c, linewidth=1.8)
+        ax.scatter(xi, yi, color=c, s=40, zorder=3)
+
+
+def render(draw, n: int) -> tuple[float, int]:
+    k = np.arange(0, n + 1)
+    y = np.exp(-0.5 * ((k - n / 2) / max(np.sqrt(n) / 2, 1)) ** 2)
+    mask = get_highlighted(r"P(X ≤ b)", None, n // 2, k)
+    highlighted = set(k[mask]) if draw is legacy_stem_plot else mask
+
+    t0 = time.perf_counter()
+    fig, ax = plt.subplots(figsize=(10, 5))
+    draw(ax, k, y, color="gold", highlighted=highlighted, highlight_color="mediumspringgreen")
+    fig.canvas.draw()
+    elapsed = time.perf_counter() - t0
+
+    n_artists = len(ax.lines) + len(ax.collections)
+    plt.close(fig)
+    return elapsed, n_artists
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--legacy-max", type=int, default=10_000,
+                        help="largest n to run the per-point renderer for")
+    args = parser.parse_args()
+
+    print(f"{'n':>8} | {'legacy (s)':>10} {'artists':>8} | {'batched (s)':>11} {'artists':>8}")
+    print("-" * 56)
+    for n in SIZES:
+        if n <= args.legacy_max:
+            t_old, a_old = render(legacy_stem_plot, n)
+            old = f"{t_old:10.3f} {a_old:8d}"
+        else:
+            old = f"{'skipped':>10} {'':>8}"
+        t_new, a_new = render(stem_plot, n)
+        print(f"{n:8d} | {old} | {t_new:11.3f} {a_new:8d}")
+
+
+if __name__ == "__main__":
+    main()
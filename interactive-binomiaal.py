@@ -2,10 +2,10 @@ import streamlit as st
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.ticker as mticker
-from scipy.stats import binom
 
+import stats_core as sc
 from utils.explanation_utils import show_explanation
-from utils.streamlit_utils import load_css, page_header, apply_dark_style, stem_plot, get_highlighted, add_cdf_markers
+from utils.streamlit_utils import load_css, page_header, apply_dark_style, stem_plot, step_cdf_plot, get_highlighted, add_cdf_markers
 from utils.constants import *
 
 st.set_page_config(
@@ -36,22 +36,18 @@ with st.sidebar:
         [r"Geen", r"P(X ≤ b)", r"P(X ≥ a)", r"P(a ≤ X ≤ b)"]
     )
 
-    lo_val, hi_val, prob = None, None, None
+    lo_val, hi_val = None, None
 
     if show_mode == r"P(X ≤ b)":
         hi_val = st.number_input(r"$b$:", min_value=0, max_value=n_val, value=min(n_val, int(n_val * p_val)))
-        prob   = binom.cdf(hi_val, n_val, p_val)
 
     elif show_mode == r"P(X ≥ a)":
         lo_val = st.number_input(r"$a$:", min_value=0, max_value=n_val, value=max(0, int(n_val * p_val)))
-        prob   = 1 - binom.cdf(lo_val - 1, n_val, p_val)
 
     elif show_mode == r"P(a ≤ X ≤ b)":
         lo_val = st.number_input(r"$a$:", min_value=0, max_value=n_val, value=max(0, int(n_val * p_val) - 2))
         hi_val = st.number_input(r"$b$:", min_value=0, max_value=n_val, value=min(n_val, int(n_val * p_val) + 2))
-        if lo_val <= hi_val:
-            prob = binom.cdf(hi_val, n_val, p_val) - binom.cdf(lo_val - 1, n_val, p_val)
-        else:
+        if lo_val > hi_val:
             st.warning(r"$a$ moet kleiner zijn dan of gelijk zijn aan $b$.")
 
     st.divider()
@@ -60,9 +56,10 @@ with st.sidebar:
 # ----------------------------------
 # COMPUTATIONS
 # ----------------------------------
-k     = np.arange(0, n_val + 1)
-pmf_y = binom.pmf(k, n_val, p_val)
-cdf_y = binom.cdf(k, n_val, p_val)
+dist  = sc.binomial(n_val, p_val)
+table = sc.discrete_table(dist, n_val)
+k, pmf_y, cdf_y = table.k, table.pmf, table.cdf
+prob  = sc.region_probability(dist, show_mode, lo_val, hi_val)
 
 mu_val    = n_val * p_val
 sigma_val = np.sqrt(n_val * p_val * (1 - p_val))
@@ -137,11 +134,7 @@ if show_pmf:
 # --- CDF axes ---
 if show_cdf:
     # Draw as step function
-    ax_cdf.step(k, cdf_y, where="post", color=H1_COLOR, linestyle=':', linewidth=2.5,
-                label=r"$F(k) = P(X \leq k)$")
-    for j in k[:-1]:
-        ax_cdf.plot([j, j+1], [cdf_y[j], cdf_y[j]], color=H1_COLOR, linestyle='-', linewidth=2.5,
-                label=r"$F(k) = P(X \leq k)$")
+    step_cdf_plot(ax_cdf, k, cdf_y, color=H1_COLOR, label=r"$F(k) = P(X \leq k)$")
 
     add_cdf_markers(ax_cdf, k, cdf_y, show_mode, lo_val, hi_val)
 
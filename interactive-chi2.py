@@ -2,8 +2,8 @@ import streamlit as st
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.ticker as mticker
-from scipy.stats import chi2
 
+import stats_core as sc
 from utils.explanation_utils import show_explanation
 from utils.streamlit_utils import load_css, page_header, apply_dark_style
 from utils.constants import *
@@ -42,13 +42,15 @@ if method == "Plot":
 else:
     x_max = max(10, df + 5 * np.sqrt(df), toets)
 
-x     = np.linspace(0, x_max, 10_000)
-y     = chi2.pdf(x, df)
+dist  = sc.chi_squared(df)
 
 grens, p_waarde = None, None
 if method != "Plot":
-    grens    = chi2.ppf(1 - alpha, df)
-    p_waarde = 1 - chi2.cdf(toets, df=df)
+    grens    = sc.critical_region(dist, alpha, sc.RIGHT).right
+    p_waarde = sc.p_value(dist, toets, sc.RIGHT)
+
+curve = sc.cached_curve(dist, sc.adaptive_grid(0, x_max), anchors=(grens, toets))
+x, y  = curve.x, curve.pdf
 
 vg_label = "vrijheidsgraad" if df == 1 else "vrijheidsgraden"
 
@@ -145,12 +147,12 @@ if method == "Kritiek gebied":
     ax.fill_between(x, y, where=(x >= grens), color=CRITICAL_SHADE_COLOR)
 
     # Critical value line
-    ax.plot([grens, grens], [0, chi2.pdf(grens, df)],
+    ax.plot([grens, grens], [0, sc.pdf(dist, grens)],
             color=CRITICAL_COLOR, linewidth=1.5, linestyle="--",
             label=rf"$\\chi^2_{{\mathrm{{crit}}}} = {grens:.4f}$")
 
     # Test statistic line
-    ax.plot([toets, toets], [0, chi2.pdf(toets, df)],
+    ax.plot([toets, toets], [0, sc.pdf(dist, toets)],
             color=H0_COLOR, linewidth=1.5, linestyle=":",
             label=rf"$\\chi^2$$")
     ax.text(toets,  ytext, f"$\\chi^2$",
@@ -169,15 +171,15 @@ elif method == "p-waarde":
                     label=rf"Kritiek gebied $(\alpha={alpha})$")
 
     # Lines
-    ax.plot([toets, toets], [0, chi2.pdf(toets, df)],
+    ax.plot([toets, toets], [0, sc.pdf(dist, toets)],
             color=H0_COLOR,      linewidth=1.5, linestyle=":",
             label=rf"$\chi^2$")
-    ax.plot([grens, grens], [0, chi2.pdf(grens, df)],
+    ax.plot([grens, grens], [0, sc.pdf(dist, grens)],
             color=CRITICAL_COLOR, linewidth=1.5, linestyle="--",
             label=rf"$\chi^2_{{\mathrm{{crit}}}} = {grens:.4f}$")
     
     # Test statistic line
-    ax.plot([toets, toets], [0, chi2.pdf(toets, df)],
+    ax.plot([toets, toets], [0, sc.pdf(dist, toets)],
             color=H0_COLOR, linewidth=1.5, linestyle=":",
             label=rf"$\chi^2$")
     ax.text(toets,  1/2*ytext, f"$\\chi^2$",
@@ -371,10 +373,10 @@ Het aantal vrijheidsgraden is gelijk aan df = $(\#\text{{aantal rijen}}-1)(\#\te
 
 Bij een significantieniveau van $\alpha = 0.05$ berekenen we de grens van het kritieke gebied als volgt:
 $$
-    \chi^2\text{{cdf}}(\text{{lower}}=X, \text{{upper}}=10^{{99}}, \text{{df}}=1) = \frac{{\alpha}}{{2}}=0.025 \Rightarrow X \approx {chi2.ppf(q=0.95, df=1):.2f}.
+    \chi^2\text{{cdf}}(\text{{lower}}=X, \text{{upper}}=10^{{99}}, \text{{df}}=1) = \frac{{\alpha}}{{2}}=0.025 \Rightarrow X \approx {sc.quantile(sc.chi_squared(1), 0.95):.2f}.
 $$
 
-Het kritieke gebied is dus $({chi2.ppf(q=0.95, df=1):.2f}, \infty)$.
+Het kritieke gebied is dus $({sc.quantile(sc.chi_squared(1), 0.95):.2f}, \infty)$.
 Omdat $9.52$ wel in het kritieke gebied ligt, wordt $H_0$ verworpen.
 Op basis van de steekproefdata is er voldoende bewijs om aan te nemen dat de variabelen **rookgedrag** en **lijden aan een longziekte** afhankelijk zijn van elkaar.
 Als we de waargenomen frequenties bekijken, zien we dat rokers relatief gezien veel vaker aan een longziekte lijden (40/100, oftewel 40%) vergeleken met niet-rokers (20/100, oftewel 20%).
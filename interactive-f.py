@@ -2,8 +2,8 @@ import streamlit as st
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.ticker as mticker
-from scipy.stats import f as f_dist
 
+import stats_core as sc
 from utils.explanation_utils import show_explanation
 from utils.streamlit_utils import load_css, page_header, apply_dark_style
 from utils.constants import *
@@ -38,20 +38,23 @@ with st.sidebar:
 # ----------------------------------
 # COMPUTATIONS
 # ----------------------------------
-x_max = f_dist.ppf(0.99, dfn=df1, dfd=df2)
-x     = np.linspace(1e-6, x_max, 10_000)
-y     = f_dist.pdf(x, df1, df2)
+dist  = sc.fisher_f(df1, df2)
+x_max = sc.quantile(dist, 0.99)
 
 linkergrens = rechtergrens = p_waarde = None
 inside_critical = False
 
 if method != "Plot":
-    linkergrens   = f_dist.ppf(alpha / 2,       dfn=df1, dfd=df2)
-    rechtergrens  = f_dist.ppf(1 - alpha / 2,   dfn=df1, dfd=df2)
-    p_value_left  = f_dist.cdf(toets,            dfn=df1, dfd=df2)
-    p_value_right = 1 - f_dist.cdf(toets,        dfn=df1, dfd=df2)
-    p_waarde      = min(p_value_left, p_value_right)
-    inside_critical = (toets < linkergrens) or (toets > rechtergrens)
+    region        = sc.critical_region(dist, alpha, sc.TWO_SIDED)
+    linkergrens   = region.left
+    rechtergrens  = region.right
+    p_value_left, p_value_right = sc.tail_probabilities(dist, toets)
+    p_waarde      = sc.p_value(dist, toets, sc.TWO_SIDED)
+    inside_critical = region.contains(toets)
+
+curve = sc.cached_curve(dist, sc.adaptive_grid(1e-6, x_max),
+                        anchors=(linkergrens, rechtergrens, toets))
+x, y  = curve.x, curve.pdf
 
 # ----------------------------------
 # STAT CARDS
@@ -147,7 +150,7 @@ if method == "Kritiek gebied":
         (rechtergrens, CRITICAL_COLOR,   rf"$f_{{1-\alpha/2}} = {rechtergrens:.4f}$"),
         (toets,        H0_COLOR,         rf"$f = {toets:.4f}$"),
     ]:
-        ax.plot([xv, xv], [0, f_dist.pdf(xv, df1, df2)],
+        ax.plot([xv, xv], [0, sc.pdf(dist, xv)],
                 color=color, linewidth=1.5, linestyle="--", label=lbl)
     
     # Add annotation for the test statistics
@@ -173,13 +176,13 @@ elif method == "p-waarde":
     ax.fill_between(x, y, where=(x >= rechtergrens), color=CRITICAL_COLOR, alpha=0.25)
 
     # Boundary lines
-    ax.plot([toets, toets], [0, f_dist.pdf(toets, df1, df2)],
+    ax.plot([toets, toets], [0, sc.pdf(dist, toets)],
             color=H0_COLOR,      linewidth=1.5, linestyle=":",
             label=rf"$f$")
-    ax.plot([linkergrens,  linkergrens],  [0, f_dist.pdf(linkergrens,  df1, df2)],
+    ax.plot([linkergrens,  linkergrens],  [0, sc.pdf(dist, linkergrens)],
             color=CRITICAL_COLOR, linewidth=1.5, linestyle="--",
             label=rf"$f_{{\alpha/2}} = {linkergrens:.4f}$")
-    ax.plot([rechtergrens, rechtergrens], [0, f_dist.pdf(rechtergrens, df1, df2)],
+    ax.plot([rechtergrens, rechtergrens], [0, sc.pdf(dist, rechtergrens)],
             color=CRITICAL_COLOR, linewidth=1.5, linestyle="--",
             label=rf"$f_{{1-\alpha/2}} = {rechtergrens:.4f}$")
     
@@ -2,9 +2,10 @@ import streamlit as st
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.ticker as mticker
-from scipy.stats import norm
 from dataclasses import dataclass
 
+import stats_core as sc
+
 from utils.explanation_utils import show_explanation
 from utils.streamlit_utils import load_css, page_header, apply_dark_style
 from utils.constants import *
@@ -39,25 +40,26 @@ def generate_distributions(mu0, mu1, sigma, n, points=600):
     sample_std = sigma / np.sqrt(n)
     spread     = abs(mu1 - mu0) + 4 * sample_std
     x          = np.linspace(mu0 - spread, mu0 + spread, points)
-    return x, norm.pdf(x, mu0, sample_std), norm.pdf(x, mu1, sample_std), sample_std
+    return x, sc.pdf(sc.normal(mu0, sample_std), x), sc.pdf(sc.normal(mu1, sample_std), x), sample_std
 
 
 def compute_regions(test_type, mu0, mu1, sample_std, alpha):
+    h1 = sc.normal(mu1, sample_std)
     if test_type == "tweezijdig":
-        z     = norm.ppf(1 - alpha / 2)
+        z     = sc.quantile(sc.normal(0, 1), 1 - alpha / 2)
         left  = mu0 - z * sample_std
         right = mu0 + z * sample_std
-        beta  = norm.cdf(right, mu1, sample_std) - norm.cdf(left, mu1, sample_std)
+        beta  = sc.cdf(h1, right) - sc.cdf(h1, left)
     elif test_type == "rechtszijdig":
-        z     = norm.ppf(1 - alpha)
+        z     = sc.quantile(sc.normal(0, 1), 1 - alpha)
         left  = None
         right = mu0 + z * sample_std
-        beta  = norm.cdf(right, mu1, sample_std)
+        beta  = sc.cdf(h1, right)
     else:  # linkszijdig
-        z     = norm.ppf(1 - alpha)
+        z     = sc.quantile(sc.normal(0, 1), 1 - alpha)
         left  = mu0 - z * sample_std
         right = None
-        beta  = 1 - norm.cdf(left, mu1, sample_std)
+        beta  = 1 - sc.cdf(h1, left)
     return TestRegions(left, right, beta)
 
 # ----------------------------------
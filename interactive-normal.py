@@ -2,8 +2,8 @@ import streamlit as st
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.ticker as mticker
-from scipy.stats import norm
 
+import stats_core as sc
 from utils.explanation_utils import show_explanation
 from utils.streamlit_utils import load_css, page_header, apply_dark_style
 from utils.constants import *
@@ -36,22 +36,18 @@ with st.sidebar:
         [r"Geen", r"P(X ≤ b)", r"P(X ≥ a)", r"P(a ≤ X ≤ b)"]
     )
 
-    a_val, b_val, prob = None, None, None
+    a_val, b_val = None, None
 
     if show_mode == r"P(X ≤ b)":
         b_val = st.number_input(r"$b$:", value=float(round(mu_val + sigma_val, 2)), step=0.1)
-        prob  = norm.cdf(b_val, loc=mu_val, scale=sigma_val)
 
     elif show_mode == r"P(X ≥ a)":
         a_val = st.number_input(r"$a$:", value=float(round(mu_val - sigma_val, 2)), step=0.1)
-        prob  = 1 - norm.cdf(a_val, loc=mu_val, scale=sigma_val)
 
     elif show_mode == r"P(a ≤ X ≤ b)":
         a_val = st.number_input(r"$a$:", value=float(round(mu_val - sigma_val, 2)), step=0.1)
         b_val = st.number_input(r"$b$:", value=float(round(mu_val + sigma_val, 2)), step=0.1)
-        if a_val < b_val:
-            prob = norm.cdf(b_val, loc=mu_val, scale=sigma_val) - norm.cdf(a_val, loc=mu_val, scale=sigma_val)
-        else:
+        if a_val >= b_val:
             st.warning(r"$a$ moet kleiner zijn dan $b$.")
 
     st.divider()
@@ -60,10 +56,13 @@ with st.sidebar:
 # ----------------------------------
 # COMPUTATIONS
 # ----------------------------------
+dist    = sc.normal(mu_val, sigma_val)
 x_range = max(4 * sigma_val, 1.0)
-x       = np.linspace(mu_val - x_range, mu_val + x_range, 500)
-pdf_y   = norm.pdf(x, loc=mu_val, scale=sigma_val)
-cdf_y   = norm.cdf(x, loc=mu_val, scale=sigma_val)
+curve   = sc.cached_curve(dist, sc.adaptive_grid(mu_val - x_range, mu_val + x_range),
+                          anchors=(mu_val, a_val, b_val))
+x, pdf_y, cdf_y = curve.x, curve.pdf, curve.cdf
+
+prob    = sc.region_probability(dist, show_mode, a_val, b_val)
 
 # ----------------------------------
 # STAT CARDS
@@ -94,37 +93,37 @@ st.markdown(f"""
 </div>
 """, unsafe_allow_html=True)
 
-def add_shading(ax, x, mu, sigma, mode, a, b, prob):
+def add_shading(ax, x, dist, mode, a, b, prob):
     """Fill the selected probability region on a PDF axes."""
     if mode == r"P(X ≤ b)" and b is not None:
         xf = x[x <= b]
-        ax.fill_between(xf, norm.pdf(xf, mu, sigma),
+        ax.fill_between(xf, sc.pdf(dist, xf),
                         color=FILL_COLOR, label=rf"$P(X \leq {b:.2f}) = {prob:.4f}$")
-        ax.plot([b, b], [0, norm.pdf(b, mu, sigma)], color=H0_COLOR, linewidth=1.4, linestyle=":")
+        ax.plot([b, b], [0, sc.pdf(dist, b)], color=H0_COLOR, linewidth=1.4, linestyle=":")
 
     elif mode == r"P(X ≥ a)" and a is not None:
         xf = x[x >= a]
-        ax.fill_between(xf, norm.pdf(xf, mu, sigma),
+        ax.fill_between(xf, sc.pdf(dist, xf),
                         color=FILL_COLOR, label=rf"$P(X \geq {a:.2f}) = {prob:.4f}$")
-        ax.plot([a, a], [0, norm.pdf(a, mu, sigma)], color=H0_COLOR, linewidth=1.4, linestyle=":")
+        ax.plot([a, a], [0, sc.pdf(dist, a)], color=H0_COLOR, linewidth=1.4, linestyle=":")
 
     elif mode == r"P(a ≤ X ≤ b)" and a is not None and b is not None and a < b:
         xf = x[(x >= a) & (x <= b)]
-        ax.fill_between(xf, norm.pdf(xf, mu, sigma),
+        ax.fill_between(xf, sc.pdf(dist, xf),
                         color=FILL_COLOR, label=rf"$P({a:.2f} \leq X \leq {b:.2f}) = {prob:.4f}$")
-        ax.plot([a, a], [0, norm.pdf(a, mu, sigma)], color=H0_COLOR, linewidth=1.4, linestyle=":")
-        ax.plot([b, b], [0, norm.pdf(b, mu, sigma)], color=H0_COLOR, linewidth=1.4, linestyle=":")
+        ax.plot([a, a], [0, sc.pdf(dist, a)], color=H0_COLOR, linewidth=1.4, linestyle=":")
+        ax.plot([b, b], [0, sc.pdf(dist, b)], color=H0_COLOR, linewidth=1.4, linestyle=":")
 
 
-def add_cdf_markers(ax, mu, sigma, mode, a, b):
+def add_cdf_markers(ax, dist, mode, a, b):
     """Mark the queried CDF value(s) with a dot and dashed drop-lines."""
     points = []
     if mode == r"P(X ≤ b)" and b is not None:
-        points = [(b, norm.cdf(b, mu, sigma))]
+        points = [(b, sc.cdf(dist, b))]
     elif mode == r"P(X ≥ a)" and a is not None:
-        points = [(a, norm.cdf(a, mu, sigma))]
+        points = [(a, sc.cdf(dist, a))]
     elif mode == r"P(a ≤ X ≤ b)" and a is not None and b is not None:
-        points = [(a, norm.cdf(a, mu, sigma)), (b, norm.cdf(b, mu, sigma))]
+        points = [(a, sc.cdf(dist, a)), (b, sc.cdf(dist, b))]
 
     for xv, yv in points:
         ax.plot([xv, xv], [0, yv], color=H0_COLOR, linewidth=1.2, linestyle=":")
@@ -160,8 +159,8 @@ ax_cdf = axes[1] if view_mode == "PDF + CDF" else (axes[0] if show_cdf else None
 if show_pdf:
     ax_pdf.plot(x, pdf_y, color=H0_COLOR, linewidth=2.5,
                 label=rf"$f(x)$ — $\mathcal{{N}}(\mu={mu_val},\, \sigma={sigma_val})$")
-    ax_pdf.plot([mu_val, mu_val], [0, norm.pdf(mu_val, mu_val, sigma_val)], color=H0_COLOR, linewidth=1.0, linestyle="--", alpha=0.5)
-    add_shading(ax_pdf, x, mu_val, sigma_val, show_mode, a_val, b_val, prob)
+    ax_pdf.plot([mu_val, mu_val], [0, sc.pdf(dist, mu_val)], color=H0_COLOR, linewidth=1.0, linestyle="--", alpha=0.5)
+    add_shading(ax_pdf, x, dist, show_mode, a_val, b_val, prob)
     apply_dark_style(
         fig=fig,
         ax=ax_pdf,
@@ -173,8 +172,8 @@ if show_pdf:
 # --- CDF axes ---
 if show_cdf:
     ax_cdf.plot(x, cdf_y, color=H1_COLOR, linewidth=2.5, label=r"$F(x) = P(X \leq x)$")
-    ax_cdf.plot([mu_val, mu_val, x[0]], [0, norm.cdf(mu_val, mu_val, sigma_val), norm.cdf(mu_val, mu_val, sigma_val)], color=H1_COLOR, linewidth=1.0, linestyle="--", alpha=0.5)
-    add_cdf_markers(ax_cdf, mu_val, sigma_val, show_mode, a_val, b_val)
+    ax_cdf.plot([mu_val, mu_val, x[0]], [0, sc.cdf(dist, mu_val), sc.cdf(dist, mu_val)], color=H1_COLOR, linewidth=1.0, linestyle="--", alpha=0.5)
+    add_cdf_markers(ax_cdf, dist, show_mode, a_val, b_val)
     apply_dark_style(
         fig=fig,
         ax=ax_cdf,
@@ -1,15 +1,17 @@
 import streamlit as st
 import numpy as np
 import plotly.graph_objects as go
-import pandas as pd
-from scipy.stats import t as t_dist
-from sklearn.linear_model import LinearRegression
 
+import stats_core as sc
 from utils.explanation_utils import show_explanation
 from utils.streamlit_utils import load_css, page_header, css_to_rgba
+from utils.regression_utils import DENSITY_THRESHOLD, GROUP_SAMPLE, RESIDUAL_SAMPLE, group_traces, regression_traces
+from utils.upload_utils import (
+    MissingColumnsError, NonNumericColumnError, UnsupportedFormatError,
+    ingest_upload, points_csv, points_parquet, upload_digest,
+)
 from utils.constants import *
 
-
 # ----------------------------------
 # PAGE CONFIG
 # ----------------------------------
@@ -29,42 +31,10 @@ load_css("./styles/style.css")
 # HELPERS
 # ----------------------------------
 
+# Points are kept in a PointStore: float64 columns plus running regression
+# statistics, so adding, removing and refitting never rescans the data.
 if "points" not in st.session_state:
-    st.session_state["points"] = {"x": [], "y": []}
-
-def compute_intervals(X_flat, y, x_range, alpha):
-    """
-    Returns CI and PI bounds over x_range.
-
-    CI (confidence interval for E[Y|X=x]):
-        ŷ ± t * s * sqrt(1/n + (x - x̄)² / Sxx)
-
-    PI (prediction interval for a new Y given X=x):
-        ŷ ± t * s * sqrt(1 + 1/n + (x - x̄)² / Sxx)
-    """
-    n    = len(X_flat)
-    x_mean = np.mean(X_flat)
-    Sxx  = np.sum((X_flat - x_mean) ** 2)
-
-    X_mat = np.column_stack([np.ones(n), X_flat])
-    beta  = np.linalg.lstsq(X_mat, y, rcond=None)[0]
-    y_hat = X_mat @ beta
-    SSE   = np.sum((y - y_hat) ** 2)
-    s2    = SSE / (n - 2)
-    s     = np.sqrt(s2)
-
-    t_crit = t_dist.ppf(1 - alpha / 2, df=n - 2)
-
-    y_pred_range = beta[0] + beta[1] * x_range
-    se_mean = s * np.sqrt(1 / n + (x_range - x_mean) ** 2 / Sxx)
-    se_pred = s * np.sqrt(1 + 1 / n + (x_range - x_mean) ** 2 / Sxx)
-
-    ci_lower = y_pred_range - t_crit * se_mean
-    ci_upper = y_pred_range + t_crit * se_mean
-    pi_lower = y_pred_range - t_crit * se_pred
-    pi_upper = y_pred_range + t_crit * se_pred
-
-    return ci_lower, ci_upper, pi_lower, pi_upper
+    st.session_state["points"] = sc.PointStore()
 
 # ----------------------------------
 # PARAMETERS
@@ -75,26 +45,47 @@ page_header("📊 Lineaire regressie", "Statistiek · Visualisatie")
 with st.sidebar:
     st.header("Parameters")
 
-    # ----- Excel upload -----
+    # ----- File upload -----
     st.subheader("📂 Bestand uploaden")
     uploaded_file = st.file_uploader(
-        "Upload een Excel-bestand met kolommen X en Y",
-        type=["xlsx", "xls", "csv"],
+        "Upload een Excel-, CSV- of Parquet-bestand met kolommen X en Y",
+        type=["xlsx", "xls", "csv", "parquet"],
         help="Het bestand moet minimaal twee kolommen bevatten met de namen 'X' en 'Y' (hoofdlettergevoelig)."
     )
 
-    if uploaded_file is not None:
-        try:
-            df_upload = pd.read_csv(uploaded_file)
-            if "X" not in df_upload.columns or "Y" not in df_upload.columns:
-                st.error("Het bestand moet kolommen met de namen 'X' en 'Y' bevatten.")
-            else:
-                df_upload = df_upload[["X", "Y"]].dropna()
-                st.session_state["points"]["x"] = df_upload["X"].tolist()
-                st.session_state["points"]["y"] = df_upload["Y"].tolist()
-                st.success(f"{len(df_upload)} datapunten geladen.")
-        except Exception as e:
-            st.error(f"Fout bij het lezen van het bestand: {e}")
+    # The file stays in the uploader across reruns. It is parsed, and the
+    # points replaced, only when a file with different contents is uploaded,
+    # so manually added points survive every later rerun.
+    if uploaded_file is None:
+        st.session_state.pop("upload", None)
+    else:
+        data   = uploaded_file.getvalue()
+        digest = upload_digest(data)
+        upload = st.session_state.get("upload")
+        if upload is None or upload["digest"] != digest:
+            upload = {"digest": digest, "rows": 0, "error": None}
+            bar    = st.progress(0.0, text="Bestand inlezen...")
+            try:
+                st.session_state["points"] = ingest_upload(
+                    data, lambda fraction, rows: bar.progress(fraction, text=f"{rows:,} datapunten ingelezen...")
+                )
+                upload["rows"] = len(st.session_state["points"])
+            except MissingColumnsError:
+                upload["error"] = "Het bestand moet kolommen met de namen 'X' en 'Y' bevatten."
+            except NonNumericColumnError as e:
+                upload["error"] = (f"Kolom '{e.column}' bevat waarden die geen getal zijn. "
+                                   "Gebruik een punt als decimaalteken en laat lege cellen leeg.")
+            except UnsupportedFormatError as e:
+                upload["error"] = f"Dit bestandsformaat wordt niet ondersteund: {e}."
+            except Exception as e:
+                upload["error"] = f"Fout bij het lezen van het bestand: {e}"
+            bar.empty()
+            st.session_state["upload"] = upload
+
+        if upload["error"]:
+            st.error(upload["error"])
+        else:
+            st.success(f"{upload['rows']} datapunten geladen.")
 
     st.divider()
 
@@ -108,17 +99,15 @@ with st.sidebar:
     if add_point_button:
         try:
             x_val, y_val = map(float, point_input.split(","))
-            st.session_state["points"]["x"].append(x_val)
-            st.session_state["points"]["y"].append(y_val)
+            st.session_state["points"].append(x_val, y_val)
         except ValueError:
             st.error("Schrijf het punt als twee getallen gescheiden door een komma. Gebruik een punt voor decimalen.")
 
-    if remove_point_button and st.session_state["points"]["x"]:
-        st.session_state["points"]["x"].pop()
-        st.session_state["points"]["y"].pop()
+    if remove_point_button and len(st.session_state["points"]):
+        st.session_state["points"].pop()
 
     if st.button("🗑️ Alles wissen", width="stretch"):
-        st.session_state["points"] = {"x": [], "y": []}
+        st.session_state["points"].clear()
 
     st.divider()
 
@@ -142,50 +131,60 @@ with st.sidebar:
     )
     conf_pct = int(100 * (1 - alpha_interval))
 
+    # ----- Grouping -----
+    # Offered for the categorical columns of an uploaded file, e.g. gender.
+    group_by = None
+    if st.session_state["points"].categories:
+        st.divider()
+        st.subheader("👥 Groeperen")
+        group_by = st.selectbox(
+            "Groeperen op",
+            [None] + st.session_state["points"].categories,
+            format_func=lambda c: "Geen" if c is None else c,
+            help="Past per groep een eigen regressielijn toe. Het betrouwbaarheidsinterval wordt per groep getoond; "
+                 "het voorspellingsinterval alleen zonder groepering."
+        )
+
 # ----------------------------------
 # COMPUTATION
 # ----------------------------------
 
-xcoords  = st.session_state["points"]["x"]
-ycoords  = st.session_state["points"]["y"]
-n_points = len(xcoords)
+points   = st.session_state["points"]
+xcoords  = points.x
+ycoords  = points.y
+fit      = points.fit()
+n_points = len(points)
 
 slope, intercept, r_squared = None, None, None
 
 if n_points >= 2:
-    X      = np.array(xcoords).reshape(-1, 1)
-    y      = np.array(ycoords)
-    X_flat = np.array(xcoords)
-
-    model = LinearRegression()
-    model.fit(X, y)
-
-    slope       = model.coef_[0]
-    intercept   = model.intercept_
-    r_squared   = model.score(X, y)
-    pearson_r   = np.corrcoef(X_flat, y)[0, 1]
-
-    margin      = max(0.5, 0.15 * (max(xcoords) - min(xcoords)))
-    xmin        = min(xcoords) - margin
-    xmax        = max(xcoords) + margin
+    slope       = fit.slope
+    intercept   = fit.intercept
+    r_squared   = fit.r_squared
+    pearson_r   = fit.r
+
+    margin      = max(0.5, 0.15 * (xcoords.max() - xcoords.min()))
+    xmin        = xcoords.min() - margin
+    xmax        = xcoords.max() + margin
     x_range     = np.linspace(xmin, xmax, 1_000)
-    y_pred_line = model.predict(x_range.reshape(-1, 1))
-    y_pred_pts  = model.predict(X)
 
-    if (show_ci or show_pi) and n_points >= 3:
-        ci_lower, ci_upper, pi_lower, pi_upper = compute_intervals(
-            X_flat, y, x_range, alpha_interval
-        )
+    # None when the bands do not exist (fewer than 3 points or all X equal)
+    ci_band = fit.confidence_band(x_range, alpha_interval) if show_ci else None
+    pi_band = fit.prediction_band(x_range, alpha_interval) if show_pi else None
 
-    # Always compute intervals at x_mean when alpha is defined (>= 3 points)
-    if n_points >= 3:
+    # Always compute intervals at x_mean when they exist
+    if fit.has_bands:
         alpha_for_cards = alpha_interval
-        x_mean_val = float(np.mean(X_flat))
-        ci_lo_mean, ci_hi_mean, pi_lo_mean, pi_hi_mean = compute_intervals(
-            X_flat, y, np.array([x_mean_val]), alpha_for_cards
-        )
+        x_mean_val = fit.x_mean
+        ci_lo_mean, ci_hi_mean = fit.confidence_band([x_mean_val], alpha_for_cards)
+        pi_lo_mean, pi_hi_mean = fit.prediction_band([x_mean_val], alpha_for_cards)
         conf_pct_cards = int(100 * (1 - alpha_for_cards))
 
+# All groups are fitted from one bincount pass over the group codes.
+if group_by is not None:
+    group_labels = points.labels(group_by)
+    group_fits   = [stats.fit() for stats in points.group_stats(group_by)]
+
 # ----------------------------------
 # STAT CARDS
 # ----------------------------------
@@ -210,7 +209,8 @@ if n_points >= 2:
     """, unsafe_allow_html=True)
 
     # Row 2: CI and PI at x_mean — always shown, values filled in when available
-    if n_points >= 3:
+    no_band_desc = "Minimaal 3 datapunten nodig" if n_points < 3 else "Niet alle X-waarden mogen gelijk zijn"
+    if fit.has_bands:
         ci_label = f"{conf_pct_cards}%-betrouwbaarheidsinterval voor <i>E(Y | X)</i>"
         pi_label = f"{conf_pct_cards}%-voorspellingsinterval voor <i>Y | X</i>"
         ci_value = f"[{ci_lo_mean[0]:.4f},  {ci_hi_mean[0]:.4f}]"
@@ -222,8 +222,8 @@ if n_points >= 2:
         pi_label = f"Voorspellingsinterval bij {to_lowercase(XBAR_HTML)}"
         ci_value = "—"
         pi_value = "—"
-        ci_desc  = "Minimaal 3 datapunten nodig"
-        pi_desc  = "Minimaal 3 datapunten nodig"
+        ci_desc  = no_band_desc
+        pi_desc  = no_band_desc
 
     st.markdown(f"""
     <div class="stats-row-3">
@@ -275,61 +275,49 @@ elif n_points == 1:
         yaxis=dict(title=dict(text="Y", font=dict(size=2*AXIS_FONT_SIZE)), tickfont=dict(size=2*TICK_FONT_SIZE)),
     )
 
-else:
-    # Prediction interval band (drawn first so it sits behind everything)
-    if show_pi and n_points >= 3:
-        fig.add_trace(go.Scatter(
-            x=np.concatenate([x_range, x_range[::-1]]),
-            y=np.concatenate([pi_upper, pi_lower[::-1]]),
-            fill="toself",
-            fillcolor=PI_FILL_COLOR,
-            line=dict(color=PI_COLOR, width=1, dash="dot"),
-            name=f"{conf_pct}% voorspellingsinterval",
-            showlegend=False
-        ))
-
-    # Confidence interval band
-    if show_ci and n_points >= 3:
-        fig.add_trace(go.Scatter(
-            x=np.concatenate([x_range, x_range[::-1]]),
-            y=np.concatenate([ci_upper, ci_lower[::-1]]),
-            fill="toself",
-            fillcolor=CI_FILL_COLOR,
-            line=dict(color=CI_COLOR, width=1, dash="dash"),
-            name=f"{conf_pct}% betrouwbaarheidsinterval voor E[Y|X]",
-            showlegend=False
-        ))
-
-    # Residuals
-    for xi, yi, yh in zip(xcoords, ycoords, y_pred_pts):
-        fig.add_trace(go.Scatter(
-            x=[xi, xi],
-            y=[yi, float(yh)],
-            mode="lines",
-            line=dict(color=RESIDUAL_COLOR, width=1.5, dash="dash"),
-            showlegend=False
-        ))
-
-    # Regression line
-    fig.add_trace(go.Scatter(
-        x=x_range, y=y_pred_line,
-        mode="lines",
-        line=dict(color=REGRESSION_COLOR, width=3),
-        name=f"Ŷ = {slope:.4f}X {'+' if intercept >= 0 else '-'} {abs(intercept):.4f}",
-        showlegend=False
+elif group_by is not None:
+    fig.add_traces(group_traces(
+        xcoords, ycoords, points.codes(group_by), group_labels, group_fits, x_range, conf_pct,
+        alpha=alpha_interval if show_ci else None,
     ))
 
-    # Data points
-    fig.add_trace(go.Scatter(
-        x=xcoords, y=ycoords,
-        mode="markers",
-        marker=dict(color=POINT_COLOR, size=12, line=dict(color="white", width=1)),
-        name="Datapunten",
-        showlegend=False
+    if n_points >= DENSITY_THRESHOLD:
+        st.caption(
+            f"{n_points:,} datapunten, weergegeven als dichtheid (kleur = aantal punten per vakje). "
+            f"De gekleurde punten zijn een steekproef van {GROUP_SAMPLE} punten met elke groep even sterk "
+            "vertegenwoordigd; de lijnen en intervallen per groep gebruiken alle punten."
+        )
+
+    fig.update_layout(
+        font=dict(family=FONT_FAMILY, color=PLOT_FONT_COLOR),
+        title=dict(
+            text=f"Regressielijn per groep: {group_by}",
+            font=dict(size=2*TITLE_FONT_SIZE, family=FONT_FAMILY, color=PLOT_FONT_COLOR),
+        ),
+        height=600,
+        xaxis=dict(title=dict(text=r"<i>X</i>", font=dict(size=2*AXIS_FONT_SIZE)), tickfont=dict(size=2*TICK_FONT_SIZE)),
+        yaxis=dict(title=dict(text=r"<i>Y</i>", font=dict(size=2*AXIS_FONT_SIZE)), tickfont=dict(size=2*TICK_FONT_SIZE)),
+        legend=dict(font=dict(size=2*ANNOTATION_FONT_SIZE), title=dict(text=group_by)),
+    )
+
+else:
+    fig.add_traces(regression_traces(
+        xcoords, ycoords, fit, x_range, conf_pct,
+        ci=ci_band,
+        pi=pi_band,
     ))
 
+    if n_points >= DENSITY_THRESHOLD:
+        st.caption(
+            f"{n_points:,} datapunten, weergegeven als dichtheid (kleur = aantal punten per vakje). "
+            f"De residuen zijn getekend voor een over X gespreide steekproef van {RESIDUAL_SAMPLE} punten; "
+            "de regressielijn en de intervallen gebruiken alle punten."
+        )
+
     if (show_ci or show_pi) and n_points < 3:
         st.warning("Minimaal 3 datapunten nodig om intervallen te berekenen.")
+    elif (show_ci or show_pi) and not fit.has_bands:
+        st.warning("Alle X-waarden zijn gelijk; zonder spreiding in X zijn er geen intervallen.")
 
     fig.update_layout(
         font=dict(family=FONT_FAMILY, color=PLOT_FONT_COLOR),
@@ -346,26 +334,62 @@ else:
 st.plotly_chart(fig, width="stretch", config=dict(displayModeBar=False))
 
 # ----------------------------------
-# POINTS TABLE
+# GROUP TABLE
 # ----------------------------------
 
-df = pd.DataFrame(
-    {
-        "$X$": xcoords,
-        "$Y$": ycoords 
-    }
-)
+if group_by is not None and n_points >= 2:
+    ci_at_mean = [fit_g.confidence_band([fit_g.x_mean], alpha_interval) for fit_g in group_fits]
+    st.dataframe(
+        {
+            group_by:       group_labels,
+            "n":            [fit_g.n for fit_g in group_fits],
+            "Helling b₁":   [fit_g.slope if fit_g.n >= 2 else None for fit_g in group_fits],
+            "Intercept b₀": [fit_g.intercept if fit_g.n >= 2 else None for fit_g in group_fits],
+            "r":            [fit_g.r for fit_g in group_fits],
+            f"{conf_pct}%-BI bij x̄": [f"[{ci[0][0]:.4f}, {ci[1][0]:.4f}]" if ci else "—" for ci in ci_at_mean],
+        },
+        hide_index=True, width="stretch",
+        column_config={name: st.column_config.NumberColumn(format="%.4f") for name in ("Helling b₁", "Intercept b₀", "r")},
+    )
+    n_ungrouped = int((points.codes(group_by) < 0).sum())
+    if n_ungrouped:
+        st.caption(f"{n_ungrouped} punt(en) zonder waarde voor {group_by}, zoals handmatig toegevoegde punten, "
+                   "horen bij geen groep.")
 
-# Apply alignment styles
-styled_df = df.style.set_properties(**{'text-align': 'center'})  # Hide index if desired
+# ----------------------------------
+# POINTS TABLE
+# ----------------------------------
+
+# Only the rows of the current page are sent to the browser; the download
+# files are generated when a download button is clicked.
+TABLE_PAGE_SIZE = 50
 
 if n_points > 0:
     with st.expander("📋 Lijst met ingevoerde datapunten", expanded=False):
-        rows = ["| $X$ | $Y$ |", "|---|---|"]
-        for i in range(n_points):
-            rows.append(f"| {xcoords[i]} | {ycoords[i]} |")
+        n_pages = -(-n_points // TABLE_PAGE_SIZE)
+        if st.session_state.get("table_page", 1) > n_pages:
+            st.session_state["table_page"] = n_pages
+
+        col_page, col_csv, col_parquet = st.columns([2, 1, 1], vertical_alignment="bottom")
+        table_page = col_page.number_input(f"Pagina (van {n_pages})", min_value=1, max_value=n_pages,
+                                           step=1, key="table_page")
+        col_csv.download_button(
+            "⬇️ CSV", data=lambda: points_csv(xcoords, ycoords),
+            file_name="datapunten.csv", mime="text/csv", on_click="ignore", width="stretch",
+        )
+        col_parquet.download_button(
+            "⬇️ Parquet", data=lambda: points_parquet(xcoords, ycoords),
+            file_name="datapunten.parquet", mime="application/vnd.apache.parquet",
+            on_click="ignore", width="stretch",
+        )
 
-        st.markdown("\n".join(rows))
+        start = (table_page - 1) * TABLE_PAGE_SIZE
+        stop  = min(start + TABLE_PAGE_SIZE, n_points)
+        st.dataframe(
+            {"#": np.arange(start + 1, stop + 1), "X": xcoords[start:stop], "Y": ycoords[start:stop]},
+            hide_index=True, width="stretch",
+        )
+        st.caption(f"Punten {start + 1}–{stop} van {n_points:,}")
 
 
 # ----------------------------------
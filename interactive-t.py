@@ -2,8 +2,8 @@ import streamlit as st
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.ticker as mticker
-from scipy.stats import norm, t
 
+import stats_core as sc
 from utils.explanation_utils import show_explanation
 from utils.streamlit_utils import load_css, page_header, apply_dark_style
 from utils.constants import *
@@ -36,11 +36,13 @@ with st.sidebar:
 # ----------------------------------
 confidence = 1 - alpha
 conf_pct   = int(100 * confidence)
-x          = np.linspace(-4, 4, 1_000)
-normal_pdf = norm.pdf(x)
-t_pdf      = t.pdf(x, df=df)
-z_crit     = norm.ppf(1 - alpha / 2)
-t_crit     = t.ppf(1 - alpha / 2, df=df)
+normal     = sc.normal(0, 1)
+t_dist     = sc.student_t(df)
+z_crit     = sc.critical_region(normal, alpha, sc.TWO_SIDED).right
+t_crit     = sc.critical_region(t_dist, alpha, sc.TWO_SIDED).right
+grid       = sc.adaptive_grid(-4, 4)
+normal_curve = sc.cached_curve(normal, grid, anchors=(-z_crit, z_crit))
+t_curve      = sc.cached_curve(t_dist, grid, anchors=(-t_crit, t_crit))
 
 # Example computation (rekenvoorbeeld)
 n_ex    = df + 1
@@ -64,7 +66,7 @@ st.markdown(f"""
   </div>
   <div class="stat-card beta">
     <span class="stat-label">Betrouwbaarheid normale benadering</span>
-    <span class="stat-value">{(t.cdf(z_crit, df=df) - t.cdf(-z_crit, df=df)):.4f}</span>
+    <span class="stat-value">{sc.region_probability(t_dist, sc.BETWEEN, -z_crit, z_crit):.4f}</span>
     <span class="stat-desc"><i>t</i>-verdeling heeft bredere staarten</span>
   </div>"
 </div>
@@ -80,14 +82,14 @@ st.markdown(f"""
 # ----------------------------------
 def fill_tails(ax, x, y, crit, color):
     """Shade both tails beyond ±crit."""
-    for mask in [x < -crit, x > crit]:
+    for mask in [x <= -crit, x >= crit]:
         ax.fill_between(x, y, where=mask, color=color, alpha=0.2)
 
 
-def crit_vlines(ax, x, pdf_func, crit, color, df=None):
+def crit_vlines(ax, dist, crit, color):
     """Draw dashed vertical lines at ±crit up to the PDF height."""
     for xv in [-crit, crit]:
-        yv = pdf_func(xv) if df is None else pdf_func(xv, df)
+        yv = sc.pdf(dist, xv)
         ax.plot([xv, xv], [0, yv], color=color, linewidth=1.5, linestyle="--")
 
 # ----------------------------------
@@ -96,18 +98,18 @@ def crit_vlines(ax, x, pdf_func, crit, color, df=None):
 fig, ax = plt.subplots(figsize=(10, 5))
 
 # Shaded tails
-fill_tails(ax, x, normal_pdf, z_crit, H0_COLOR)
-fill_tails(ax, x, t_pdf,      t_crit, H1_COLOR)
+fill_tails(ax, normal_curve.x, normal_curve.pdf, z_crit, H0_COLOR)
+fill_tails(ax, t_curve.x,      t_curve.pdf,      t_crit, H1_COLOR)
 
 # Critical value lines
-crit_vlines(ax, x, norm.pdf, z_crit, H0_COLOR)
+crit_vlines(ax, normal, z_crit, H0_COLOR)
 if df >= 3:   # avoid very tall lines for low df
-    crit_vlines(ax, x, t.pdf, t_crit, H1_COLOR, df=df)
+    crit_vlines(ax, t_dist, t_crit, H1_COLOR)
 
 # Curves
-ax.plot(x, normal_pdf, color=H0_COLOR, linewidth=2.5,
+ax.plot(normal_curve.x, normal_curve.pdf, color=H0_COLOR, linewidth=2.5,
         label=r"Normale verdeling $\mathcal{N}(0,1)$")
-ax.plot(x, t_pdf,      color=H1_COLOR, linewidth=2.5,
+ax.plot(t_curve.x,      t_curve.pdf,      color=H1_COLOR, linewidth=2.5,
         label=rf"$t$-verdeling $(\mathrm{{df}}={df})$")
 
 apply_dark_style(
@@ -242,7 +244,7 @@ $$
 De p-waarde is de kans om een $t$ te observeren die minstens zo groot is als de gevonden waarde, gegeven dat $H_0$ waar is:
  
 $$
-    p = \text{{tcdf}}(\text{{lower}}={t_score:.4f}, \text{{upper}}=10^{{99}}, \text{{df}}={n_ex - 1}) = {(1 - t.cdf(abs(t_score), n_ex - 1)):.4f}.
+    p = \text{{tcdf}}(\text{{lower}}={t_score:.4f}, \text{{upper}}=10^{{99}}, \text{{df}}={n_ex - 1}) = {sc.p_value(t_dist, abs(t_score), sc.RIGHT):.4f}.
 $$
  
 Omdat we tweezijdig toetsen, vergelijken we deze $p$-waarde met $\frac{{\alpha}}{{2}} = {alpha/2}$.
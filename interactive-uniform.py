@@ -2,8 +2,8 @@ import streamlit as st
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.ticker as mticker
-from scipy.stats import uniform
 
+import stats_core as sc
 from utils.explanation_utils import show_explanation
 from utils.streamlit_utils import load_css, page_header, apply_dark_style
 from utils.constants import *
@@ -40,23 +40,18 @@ with st.sidebar:
         [r"Geen", r"P(X ≤ b)", r"P(X ≥ a)", r"P(a ≤ X ≤ b)"]
     )
 
-    lo_val, hi_val, prob = None, None, None
+    lo_val, hi_val = None, None
 
     if show_mode == r"P(X ≤ b)":
         hi_val = st.number_input(r"$b$:", value=float(round((a_param + b_param) / 2, 2)), step=0.1)
-        prob   = uniform.cdf(hi_val, loc=a_param, scale=b_param - a_param)
 
     elif show_mode == r"P(X ≥ a)":
         lo_val = st.number_input(r"$a$:", value=float(round((a_param + b_param) / 2, 2)), step=0.1)
-        prob   = 1 - uniform.cdf(lo_val, loc=a_param, scale=b_param - a_param)
 
     elif show_mode == r"P(a ≤ X ≤ b)":
         lo_val = st.number_input(r"$a$:", value=float(round(a_param + (b_param - a_param) / 3, 2)), step=0.1)
         hi_val = st.number_input(r"$b$:", value=float(round(a_param + 2 * (b_param - a_param) / 3, 2)), step=0.1)
-        if lo_val < hi_val:
-            prob = uniform.cdf(hi_val, loc=a_param, scale=b_param - a_param) \
-                 - uniform.cdf(lo_val, loc=a_param, scale=b_param - a_param)
-        else:
+        if lo_val >= hi_val:
             st.warning(r"$a$ moet kleiner zijn dan $b$.")
 
     st.divider()
@@ -69,9 +64,11 @@ mu_val    = (a_param + b_param) / 2
 sigma_val = (b_param - a_param) / np.sqrt(12)
 padding   = (b_param - a_param) * 0.35
 
-x     = np.linspace(a_param - padding, b_param + padding, 1000)
-pdf_y = uniform.pdf(x, loc=a_param, scale=b_param - a_param)
-cdf_y = uniform.cdf(x, loc=a_param, scale=b_param - a_param)
+dist  = sc.uniform(a_param, b_param)
+curve = sc.cached_curve(dist, sc.adaptive_grid(a_param - padding, b_param + padding),
+                        anchors=(a_param, b_param, lo_val, hi_val))
+x, pdf_y, cdf_y = curve.x, curve.pdf, curve.cdf
+prob  = sc.region_probability(dist, show_mode, lo_val, hi_val)
 
 # ----------------------------------
 # STAT CARDS
@@ -105,46 +102,44 @@ st.markdown(f"""
 # ----------------------------------
 # HELPERS
 # ----------------------------------
-def add_shading(ax, x, a, b, mode, lo, hi, prob):
+def add_shading(ax, x, dist, a, b, mode, lo, hi, prob):
     """Fill the selected probability region on a PDF axes."""
-    scale = b - a
-    height = 1.0 / scale  # constant PDF height
+    height = 1.0 / (b - a)  # constant PDF height
 
     if mode == r"P(X ≤ b)" and hi is not None:
         xf = x[(x >= a) & (x <= hi)]
-        ax.fill_between(xf, uniform.pdf(xf, loc=a, scale=scale),
+        ax.fill_between(xf, sc.pdf(dist, xf),
                         color=FILL_COLOR, alpha=0.5,
                         label=rf"$P(X \leq {hi:.2f}) = {prob:.4f}$")
         ax.plot([hi, hi], [0, height], color=H0_COLOR, linewidth=1.4, linestyle=":")
 
     elif mode == r"P(X ≥ a)" and lo is not None:
         xf = x[(x >= lo) & (x <= b)]
-        ax.fill_between(xf, uniform.pdf(xf, loc=a, scale=scale),
+        ax.fill_between(xf, sc.pdf(dist, xf),
                         color=FILL_COLOR, alpha=0.5,
                         label=rf"$P(X \geq {lo:.2f}) = {prob:.4f}$")
         ax.plot([lo, lo], [0, height], color=H0_COLOR, linewidth=1.4, linestyle=":")
 
     elif mode == r"P(a ≤ X ≤ b)" and lo is not None and hi is not None and lo < hi:
         xf = x[(x >= lo) & (x <= hi)]
-        ax.fill_between(xf, uniform.pdf(xf, loc=a, scale=scale),
+        ax.fill_between(xf, sc.pdf(dist, xf),
                         color=FILL_COLOR, alpha=0.5,
                         label=rf"$P({lo:.2f} \leq X \leq {hi:.2f}) = {prob:.4f}$")
         ax.plot([lo, lo], [0, height], color=H0_COLOR, linewidth=1.4, linestyle=":")
         ax.plot([hi, hi], [0, height], color=H0_COLOR, linewidth=1.4, linestyle=":")
 
 
-def add_cdf_markers(ax, x, a, b, mode, lo, hi):
+def add_cdf_markers(ax, x, dist, mode, lo, hi):
     """Mark the queried CDF value(s) with a dot and dashed drop-lines."""
-    scale = b - a
     points = []
     if mode == r"P(X ≤ b)" and hi is not None:
-        points = [(hi, uniform.cdf(hi, loc=a, scale=scale))]
+        points = [(hi, sc.cdf(dist, hi))]
     elif mode == r"P(X ≥ a)" and lo is not None:
-        points = [(lo, uniform.cdf(lo, loc=a, scale=scale))]
+        points = [(lo, sc.cdf(dist, lo))]
     elif mode == r"P(a ≤ X ≤ b)" and lo is not None and hi is not None:
         points = [
-            (lo, uniform.cdf(lo, loc=a, scale=scale)),
-            (hi, uniform.cdf(hi, loc=a, scale=scale)),
+            (lo, sc.cdf(dist, lo)),
+            (hi, sc.cdf(dist, hi)),
         ]
 
     for xv, yv in points:
@@ -182,8 +177,8 @@ ax_cdf = axes[1] if view_mode == "PDF + CDF" else (axes[0] if show_cdf else None
 if show_pdf:
     ax_pdf.plot(x, pdf_y, color=H0_COLOR, linewidth=2.5,
                 label=rf"$f(x)$ — Uniform$(a={a_param},\, b={b_param})$")
-    ax_pdf.plot([mu_val, mu_val], [0, uniform.pdf(mu_val, loc=a_param, scale=b_param - a_param)], color=H0_COLOR, linewidth=1.0, linestyle="--", alpha=0.5)
-    add_shading(ax_pdf, x, a_param, b_param, show_mode, lo_val, hi_val, prob)
+    ax_pdf.plot([mu_val, mu_val], [0, sc.pdf(dist, mu_val)], color=H0_COLOR, linewidth=1.0, linestyle="--", alpha=0.5)
+    add_shading(ax_pdf, x, dist, a_param, b_param, show_mode, lo_val, hi_val, prob)
     apply_dark_style(
         fig=fig,
         ax=ax_pdf,
@@ -194,10 +189,10 @@ if show_pdf:
 
 # --- CDF axes ---
 if show_cdf:
-    ymean = uniform.cdf(mu_val, loc=a_param, scale=b_param-a_param)
+    ymean = sc.cdf(dist, mu_val)
     ax_cdf.plot(x, cdf_y, color=H1_COLOR, linewidth=2.5, label=r"$F(x) = P(X \leq x)$")
     ax_cdf.plot([mu_val, mu_val, x[0]], [0, ymean, ymean], color=H1_COLOR, linewidth=1.0, linestyle="--", alpha=0.5)
-    add_cdf_markers(ax_cdf, x, a_param, b_param, show_mode, lo_val, hi_val)
+    add_cdf_markers(ax_cdf, x, dist, show_mode, lo_val, hi_val)
     apply_dark_style(
         fig=fig,
         ax=ax_cdf,
@@ -1,10 +1,8 @@
 import streamlit as st
-import numpy as np
-import plotly.graph_objects as go
-from scipy.stats import norm
-from collections import deque
 
-from utils.streamlit_utils import load_css, page_header
+import stats_core as sc
+from utils.animation_utils import MAX_PLOTLY_FRAMES, build_ci_figure, ci_animation
+from utils.streamlit_utils import load_css, page_header, seed_input
 from utils.explanation_utils import show_explanation
 from utils.constants import *
 
@@ -19,6 +17,13 @@ st.set_page_config(
 # ----------------------------------
 load_css()
 
+# Animation modes: Plotly frames built on the server, or a small browser
+# component that receives only the simulated numbers. Plotly builds one frame
+# per sample, so it is capped at MAX_PLOTLY_FRAMES samples.
+SERVER_MODE = "Plotly (server)"
+CLIENT_MODE = "Browser (snel, grote aantallen)"
+MAX_BATCH   = {SERVER_MODE: MAX_PLOTLY_FRAMES, CLIENT_MODE: 100_000}
+
 # ----------------------------------
 # PARAMETERS
 # ----------------------------------
@@ -31,7 +36,12 @@ with st.sidebar:
     n              = st.number_input(r"Steekproefgrootte $n$:", min_value=2, value=30)
     alpha          = st.number_input(r"Significantieniveau $\alpha$:", min_value=0.01, max_value=0.10, value=0.05)
     frame_duration = st.number_input("Frame duur (ms):", min_value=100, value=500)
-    batch_size     = st.number_input("Aantal steekproeven:", min_value=1, max_value=1000, value=100)
+    render_mode    = st.selectbox("Animatie:", [SERVER_MODE, CLIENT_MODE])
+    batch_size     = st.number_input("Aantal steekproeven:", min_value=1, max_value=MAX_BATCH[render_mode], value=100,
+                                     help=f"Met Plotly maximaal {MAX_PLOTLY_FRAMES}; kies de browseranimatie "
+                                          "voor grotere aantallen.")
+    show_samples   = render_mode == SERVER_MODE or st.checkbox("Toon waarnemingen", value=True)
+    seed           = seed_input()
     generate       = st.button("Steekproeven trekken")
 
 st.markdown(f"""
@@ -48,166 +58,20 @@ Hier is $\\mu$ bekend om het concept van betrouwbaarheidsintervallen te illustre
 # ----------------------------------
 # HELPERS
 # ----------------------------------
-def make_traces(intervals, means, contains, sample, xbar, mu):
-    traces = []
-
-    # Invisible anchor to fix axis range
-    traces.append(go.Scatter(
-        x=[mu - 4 * sigma, mu + 4 * sigma], y=[1, 1],
-        mode="markers", marker=dict(opacity=0), showlegend=False,
-    ))
-
-    # Raw sample observations
-    traces.append(go.Scatter(
-        x=sample, y=[-1] * len(sample),
-        mode="markers", marker=dict(size=8, color=OBSERVATION_COLOR),
-        showlegend=False,
-    ))
-
-    # Current sample mean
-    traces.append(go.Scatter(
-        x=[xbar], y=[-1],
-        mode="markers", marker=dict(size=14, color=SAMPLE_MEAN_COLOR),
-        showlegend=False,
-    ))
-
-    # Last 10 confidence intervals
-    for i, (l, r) in enumerate(intervals):
-        if (l, r) == (mu, mu):       # placeholder — not yet drawn
-            traces += [
-                go.Scatter(x=[mu, mu], y=[i, i], mode="markers",
-                           marker=dict(size=0, opacity=0), showlegend=False),
-                go.Scatter(x=[mu], y=[i], mode="markers",
-                           marker=dict(size=0, opacity=0), showlegend=False),
-            ]
-        else:
-            color = ACCEPTABLE_COLOR if contains[i] else CRITICAL_COLOR
-            traces += [
-                go.Scatter(x=[l, r], y=[i, i], mode="lines",
-                           line=dict(color=color, width=3), showlegend=False),
-                go.Scatter(x=[means[i]], y=[i], mode="markers",
-                           marker=dict(size=9, color=SAMPLE_MEAN_COLOR), showlegend=False),
-            ]
-    return traces
-
-
-def make_annotations(intervals, means, contains, mu):
-    annotations = []
-    for j, (l, r) in enumerate(intervals):
-        if (l, r) == (mu, mu):
-            continue
-        if j == 1:
-            break
-        color = ACCEPTABLE_COLOR if contains[j] else CRITICAL_COLOR
-        annotations += [
-            dict(x=means[j], y=j + 0.40, xanchor="center", xref="x", yref="y",
-                 text=f"{means[j]:.2f}", showarrow=False,
-                 font=dict(color=SAMPLE_MEAN_COLOR, size=10+ANNOTATION_FONT_SIZE,
-                           family=FONT_FAMILY)),
-            dict(x=l, y=j + 0.40, xref="x",  xanchor="right",
-                 text=f"{l:.2f}", showarrow=False,
-                 font=dict(color=color, size=10+ANNOTATION_FONT_SIZE,
-                           family=FONT_FAMILY)),
-            dict(x=r, y=j + 0.40, xref="x",  xanchor="left",
-                 text=f"{r:.2f}", showarrow=False,
-                 font=dict(color=color, size=10+ANNOTATION_FONT_SIZE, 
-                           family=FONT_FAMILY)),
-        ]
-    return annotations
+# The stream is keyed on (mu, sigma, n) only: samples are drawn row by row, so
+# a larger batch extends a smaller one and alpha only changes the intervals.
+def sample_rng(seed, mu, sigma, n):
+    return sc.generator(seed, "ci", mu, sigma, n)
+
+
+@st.cache_data
+def build_figure(mu, sigma, n, alpha, batch_size, frame_duration, seed):
+    return build_ci_figure(mu, sigma, n, alpha, batch_size, frame_duration, rng=sample_rng(seed, mu, sigma, n))
+
 
 @st.cache_data
-def build_figure(mu, sigma, n, alpha, batch_size, frame_duration):
-    z  = norm.ppf(1 - alpha / 2)
-    se = sigma / np.sqrt(n)
-    num_intervals = 10
-
-    all_samples = [np.random.normal(mu, sigma, n) for _ in range(batch_size)]
-    all_xbars   = np.array([s.mean() for s in all_samples])
-    lefts = all_xbars - z * se
-    rights = all_xbars + z * se
-    hits = (lefts <= mu) & (mu <= rights)
-    count_contains = hits.cumsum()[-1]
-
-    intervals_history = deque([(mu, mu)] * num_intervals, maxlen=num_intervals)
-    means_history     = deque([mu]       * num_intervals, maxlen=num_intervals)
-    contains_history  = deque([False]    * num_intervals, maxlen=num_intervals)
-
-    frames = []
-
-    for k in range(batch_size):
-        xbar  = all_xbars[k]
-
-        intervals_history.appendleft((lefts[k], rights[k]))
-        means_history.appendleft(xbar)
-        contains_history.appendleft(hits[k])
-
-        traces      = make_traces(intervals_history, means_history,
-                                  contains_history, all_samples[k], xbar, mu)
-        annotations = make_annotations(intervals_history, means_history,
-                                       contains_history, mu)
-
-        frames.append(go.Frame(
-            data=traces,
-            name=str(k),
-            layout=go.Layout(annotations=annotations),
-        ))
-
-    fig = go.Figure(
-        data=frames[0].data,
-        frames=frames,
-        layout=go.Layout(
-            font=dict(family=FONT_FAMILY, color=PLOT_FONT_COLOR),
-            xaxis=dict(
-                range=[mu - 4 * sigma, mu + 4 * sigma],
-                title=dict(text=r"<i>x</i>", font=dict(size=2*AXIS_FONT_SIZE)),
-                tickfont=dict(size=2*TICK_FONT_SIZE),
-            ),
-            yaxis=dict(
-                range=[-4, 10],
-                autorange="reversed",
-                tickfont=dict(size=2*TICK_FONT_SIZE),
-                showticklabels=False,
-            ),
-            height=700,
-            annotations=frames[0].layout.annotations,
-            shapes=[dict(
-                type="line",
-                x0=mu, x1=mu, y0=-3, y1=9,
-                line=dict(color=H0_COLOR, dash="dash", width=1.5),
-            )],
-            updatemenus=[dict(
-                type="buttons",
-                pad=dict(t=20, r=20, b=20, l=20),
-                showactive=False,
-                y=0.15, x=0.95,
-                xanchor="center",
-                direction="left",
-                font=dict(size=BUTTON_FONT_SIZE, family=FONT_FAMILY),
-                buttons=[
-                    dict(
-                        label="▶ Speel",
-                        method="animate",
-                        args=[None, dict(
-                            frame=dict(duration=frame_duration, redraw=True),
-                            fromcurrent=True,
-                            transition=dict(duration=0),
-                        )],
-                    ),
-                    dict(
-                        label="⏸ Pauze",
-                        method="animate",
-                        args=[[None], dict(
-                            frame=dict(duration=0, redraw=False),
-                            mode="immediate",
-                            transition=dict(duration=0),
-                        )],
-                    ),
-                ],
-            )],
-        ),
-    )
-
-    return fig, count_contains
+def simulate(mu, sigma, n, alpha, batch_size, seed):
+    return sc.simulate_z_intervals(mu, sigma, n, alpha, batch_size, rng=sample_rng(seed, mu, sigma, n))
 
 
 # ----------------------------------
@@ -219,7 +83,11 @@ st.subheader(
 )
 
 if generate:
-    fig, count_contains = build_figure(mu, sigma, n, alpha, int(batch_size), frame_duration)
+    if render_mode == CLIENT_MODE:
+        sim            = simulate(mu, sigma, n, alpha, int(batch_size), seed)
+        count_contains = int(sim.hits.sum())
+    else:
+        fig, count_contains = build_figure(mu, sigma, n, alpha, int(batch_size), frame_duration, seed)
     total      = int(batch_size)
     total_miss = total - count_contains
     coverage   = count_contains / total * 100
@@ -244,7 +112,10 @@ if generate:
     </div>
     """, unsafe_allow_html=True)
 
-    st.plotly_chart(fig, width="stretch", config=dict(displayModeBar=False))
+    if render_mode == CLIENT_MODE:
+        ci_animation(sim, mu, sigma, frame_duration, include_samples=show_samples)
+    else:
+        st.plotly_chart(fig, width="stretch", config=dict(displayModeBar=False))
 
 else:
     n_label = f"$n={n}$" if batch_size == 1 else f"$n={n}$"
@@ -2,10 +2,11 @@ import streamlit as st
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.ticker as mticker
-from scipy.stats import norm, uniform, expon, binom, poisson
+
+import stats_core as sc
 
 from utils.explanation_utils import show_explanation
-from utils.streamlit_utils import load_css, page_header, apply_dark_style
+from utils.streamlit_utils import load_css, page_header, apply_dark_style, seed_input
 from utils.constants import *
 
 st.set_page_config(
@@ -21,6 +22,11 @@ load_css()
 
 BG_COLOR = "#1a1f2e"
 
+SAMPLING_ENGINES = {
+    "Snel (exacte verdeling van de som)": sc.FAST,
+    "Per waarneming (referentie)":        sc.REFERENCE,
+}
+
 # ----------------------------------
 # PARAMETERS
 # ----------------------------------
@@ -37,63 +43,58 @@ with st.sidebar:
     if dist_selector == "normale":
         mu_val      = st.number_input(r"Gemiddelde $\mu$:", value=0.0)
         sigma_val   = st.number_input(r"Standaardafwijking $\sigma$:", value=1.0)
-        dist_params = {"mu": mu_val, "sigma": sigma_val}
+        dist        = sc.normal(mu_val, sigma_val)
         true_mu     = mu_val
         true_sigma  = sigma_val / np.sqrt(sample_size)
     elif dist_selector == "uniforme":
         a_val       = st.number_input(r"Ondergrens $a$:", value=-5.0)
         b_val       = st.number_input(r"Bovengrens $b$:", min_value=a_val + 0.1, value=5.0)
-        dist_params = {"a": a_val, "b": b_val}
+        dist        = sc.uniform(a_val, b_val)
         true_mu     = (a_val + b_val) / 2
         true_sigma  = (b_val - a_val) / np.sqrt(12 * sample_size)
     elif dist_selector == "exponentiële":
         lam_val     = st.number_input(r"$\lambda$:", min_value=0.1, value=1.0)
-        dist_params = {"lambda_": lam_val}
+        dist        = sc.exponential(lam_val)
         true_mu     = 1 / lam_val
         true_sigma  = (1 / lam_val) / np.sqrt(sample_size)
     elif dist_selector == "Poisson":
         lam_val     = st.number_input(r"$\lambda$:", min_value=0.1, value=1.0)
-        dist_params = {"lambda_": lam_val}
+        dist        = sc.poisson(lam_val)
         true_mu     = lam_val
         true_sigma  = np.sqrt(lam_val / sample_size)
     elif dist_selector == "binomiale":
         n_binom     = st.number_input(r"Aantal Bernoulli-experimenten $n$:", min_value=1, value=20)
         p_binom     = st.slider(r"Succeskans $p$:", min_value=0.0, max_value=1.0, value=0.5, step=0.01)
-        dist_params = {"n": n_binom, "p": p_binom}
+        dist        = sc.binomial(n_binom, p_binom)
         true_mu     = n_binom * p_binom
         true_sigma  = np.sqrt(n_binom * p_binom * (1 - p_binom) / sample_size)
     
     toggle_normal_curve = st.selectbox("Teken normaalkromme", options=[True, False])
-
-# ----------------------------------
-# SAMPLING
-# ----------------------------------
-def draw_sample_means(dist, sample_size, n_samples, **params):
-    if dist == "normale":
-        data = norm.rvs(loc=params["mu"], scale=params["sigma"], size=(sample_size, n_samples))
-    elif dist == "uniforme":
-        data = uniform.rvs(loc=params["a"], scale=params["b"] - params["a"], size=(sample_size, n_samples))
-    elif dist == "exponentiële":
-        data = expon.rvs(scale=1 / params["lambda_"], size=(sample_size, n_samples))
-    elif dist == "binomiale":
-        data = binom.rvs(n=params["n"], p=params["p"], size=(sample_size, n_samples))
-    elif dist == "Poisson":
-        data = poisson.rvs(mu=params["lambda_"], size=(sample_size, n_samples))
-    return data.mean(axis=0)
+    engine_label        = st.selectbox(
+        "Simulatiemethode:",
+        options=list(SAMPLING_ENGINES),
+        help="De snelle methode trekt de som van elke steekproef rechtstreeks uit haar exacte "
+             "verdeling. Voor de uniforme verdeling bestaat die niet en wordt elke waarneming "
+             "afzonderlijk getrokken.",
+    )
+    seed                = seed_input()
 
 # ----------------------------------
 # COMPUTATIONS
 # ----------------------------------
-all_means = draw_sample_means(dist_selector, sample_size, n_samples, **dist_params)
+# Means are binned as they are generated; only the bin counts and running
+# moments are kept, never the n_samples individual means.
+lattice   = 1 / sample_size if dist.discrete else None
+bin_edges = sc.centered_edges(true_mu, true_sigma, n_bins, support=sc.support(dist), lattice=lattice)
+histogram = sc.StreamingHistogram(bin_edges)
+seed_seq  = sc.derive_seed(seed, "cls", dist, sample_size)
+for block in sc.iter_parallel_sample_means(dist, sample_size, n_samples, seed=seed_seq,
+                                           engine=SAMPLING_ENGINES[engine_label]):
+    histogram.add(block)
 
-bin_edges   = np.linspace(all_means.min(), all_means.max(), n_bins + 1)
 bin_width   = bin_edges[1] - bin_edges[0]
 x_curve     = np.linspace(bin_edges[0], bin_edges[-1], 300)
-
-if dist_selector in ["binomiale", "Poisson"]:
-    curve_y     = norm.pdf(x_curve, loc=true_mu, scale=true_sigma) * n_samples / sample_size
-else:
-    curve_y     = norm.pdf(x_curve, loc=true_mu, scale=true_sigma) * n_samples * bin_width
+curve_y     = sc.pdf(sc.normal(true_mu, true_sigma), x_curve) * n_samples * bin_width
 
 # ----------------------------------
 # STAT CARDS
@@ -102,12 +103,12 @@ st.markdown(f"""
 <div class="stats-row-2">
   <div class="stat-card alpha">
     <span class="stat-label">Gemiddelde van steekproefgemiddelden</span>
-    <span class="stat-value">{all_means.mean():.4f}</span>
+    <span class="stat-value">{histogram.mean:.4f}</span>
     <span class="stat-desc">Steeds dichter bij {to_lowercase(MEAN_HTML)} = {true_mu:.4f} (als <i>n &rightarrow; &#8734;</i>)</span>
   </div>
   <div class="stat-card beta">
     <span class="stat-label">Standaardafwijking van steekproefgemiddelden</span>
-    <span class="stat-value">{all_means.std():.4f}</span>
+    <span class="stat-value">{histogram.std:.4f}</span>
     <span class="stat-desc">Steeds dichter bij {to_lowercase(STD_HTML)} / &radic;<i>n</i> = {true_sigma:.4f} (als <i>n &rightarrow; &#8734;</i>)</span>
   </div>
 </div>
@@ -120,8 +121,8 @@ fig, ax = plt.subplots(figsize=(10, 5))
 
 # Histogram bars
 ax.bar(
-    (bin_edges[:-1] + bin_edges[1:]) / 2,
-    np.histogram(all_means, bins=bin_edges)[0],
+    histogram.centers,
+    histogram.counts,
     width=bin_width * 0.92,
     color=HISTOGRAM_BAR_COLOR,
     alpha=0.75,
@@ -159,6 +160,21 @@ plt.tight_layout(pad=2.0)
 st.pyplot(fig, width='stretch')
 plt.close(fig)
 
+n_shown = len(bin_edges) - 1
+if n_shown < n_bins:
+    st.caption(
+        f"Het histogram toont {n_shown} in plaats van {n_bins} klassen: de steekproefgemiddelden "
+        f"kunnen binnen het getoonde bereik maar {n_shown} verschillende waarden aannemen."
+    )
+
+n_outside = histogram.underflow + histogram.overflow
+if n_outside:
+    st.info(
+        f"{n_outside} van de {n_samples} steekproefgemiddelden vallen buiten het getoonde bereik "
+        rf"$\mu \pm 4\,\sigma/\sqrt{{n}}$ en zijn niet in het histogram opgenomen "
+        "(wel in het gemiddelde en de standaardafwijking)."
+    )
+
 # ----------------------------------
 # EXPLANATION
 # ----------------------------------
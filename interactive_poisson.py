@@ -2,10 +2,10 @@ import streamlit as st
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.ticker as mticker
-from scipy.stats import binom, poisson
 
+import stats_core as sc
 from utils.explanation_utils import show_explanation
-from utils.streamlit_utils import load_css, page_header, apply_dark_style, stem_plot, get_highlighted, add_cdf_markers
+from utils.streamlit_utils import load_css, page_header, apply_dark_style, stem_plot, step_cdf_plot, get_highlighted, add_cdf_markers
 from utils.constants import *
 
 st.set_page_config(
@@ -43,26 +43,22 @@ with st.sidebar:
 
         k_max_sidebar = int(lambda_val + 4 * np.sqrt(lambda_val)) + 1
 
-        lo_val, hi_val, prob = None, None, None
+        lo_val, hi_val = None, None
 
         if show_mode == r"P(X ≤ b)":
             hi_val = st.number_input(r"$b$:", min_value=0, max_value=k_max_sidebar,
                                      value=int(lambda_val))
-            prob   = poisson.cdf(hi_val, lambda_val)
 
         elif show_mode == r"P(X ≥ a)":
             lo_val = st.number_input(r"$a$:", min_value=0, max_value=k_max_sidebar,
                                      value=int(lambda_val))
-            prob   = 1 - poisson.cdf(lo_val - 1, lambda_val)
 
         elif show_mode == r"P(a ≤ X ≤ b)":
             lo_val = st.number_input(r"$a$:", min_value=0, max_value=k_max_sidebar,
                                      value=max(0, int(lambda_val) - 2))
             hi_val = st.number_input(r"$b$:", min_value=0, max_value=k_max_sidebar,
                                      value=int(lambda_val) + 2)
-            if lo_val <= hi_val:
-                prob = poisson.cdf(hi_val, lambda_val) - poisson.cdf(lo_val - 1, lambda_val)
-            else:
+            if lo_val > hi_val:
                 st.warning(r"$a$ moet kleiner zijn dan of gelijk zijn aan $b$.")
 
         st.divider()
@@ -79,16 +75,17 @@ with st.sidebar:
 # # COMPUTATIONS
 # ----------------------------------
 if mode == "Poissonverdeling":
-    k     = np.arange(0, k_max_sidebar + 1)
-    pmf_y = poisson.pmf(k, lambda_val)
-    cdf_y = pmf_y.cumsum()
+    dist  = sc.poisson(lambda_val)
+    table = sc.discrete_table(dist, k_max_sidebar)
+    k, pmf_y, cdf_y = table.k, table.pmf, table.cdf
+    prob  = sc.region_probability(dist, show_mode, lo_val, hi_val)
     sigma_val = np.sqrt(lambda_val)
 else:
     p_input = lambda_input / n_input
     k_max   = max(n_input + 1, int(lambda_input + 4 * np.sqrt(lambda_input)))
-    k       = np.arange(0, k_max)
-    y_binom   = binom.pmf(k, n_input, p_input)
-    y_poisson = poisson.pmf(k, lambda_input)
+    k       = sc.integer_grid(k_max - 1)
+    y_binom   = sc.pdf(sc.binomial(n_input, p_input), k)
+    y_poisson = sc.pdf(sc.poisson(lambda_input), k)
 
 # ----------------------------------
 # STAT CARDS
@@ -148,15 +145,6 @@ else:
 # PLOTTING FUNCTIONS
 # ----------------------------------
 if mode == "Poissonverdeling":
-    def get_highlighted(mode, lo, hi, k):
-        if mode == r"P(X ≤ b)" and hi is not None:
-            return set(k[k <= hi])
-        elif mode == r"P(X ≥ a)" and lo is not None:
-            return set(k[k >= lo])
-        elif mode == r"P(a ≤ X ≤ b)" and lo is not None and hi is not None and lo <= hi:
-            return set(k[(k >= lo) & (k <= hi)])
-        return None
-
     highlighted = get_highlighted(show_mode, lo_val, hi_val, k)
 
     prob_label_latex = {
@@ -191,9 +179,7 @@ if mode == "Poissonverdeling":
         ax_pmf.yaxis.set_major_formatter(mticker.FormatStrFormatter("%.2f"))
 
     if show_cdf:
-        for j in k[:-1]:
-            ax_cdf.plot([j, j+1], [cdf_y[j], cdf_y[j]], color=H1_COLOR, linestyle='-', linewidth=2.5)
-        ax_cdf.step(k, cdf_y, where="post", color=H1_COLOR, linestyle=':', linewidth=2.5)
+        step_cdf_plot(ax_cdf, k, cdf_y, color=H1_COLOR)
         ax_cdf.xaxis.set_major_locator(mticker.MaxNLocator(integer=True))
         ax_cdf.yaxis.set_major_formatter(mticker.FormatStrFormatter("%.2f"))
         apply_dark_style(
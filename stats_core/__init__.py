@@ -0,0 +1,25 @@
+from stats_core.distributions import (
+    Distribution, normal, student_t, chi_squared, fisher_f, uniform, exponential, binomial, poisson,
+    pdf, cdf, sf, ppf, mean, std, support,
+)
+from stats_core.grids import (
+    GridSpec, AdaptiveGridSpec, linear_grid, adaptive_grid, integer_grid, adaptive_sample,
+)
+from stats_core.curves import Curve, DiscreteTable, continuous_curve, discrete_table, with_anchors
+from stats_core.cache import CacheStats, CurveCache, curve_cache, cached_curve
+from stats_core.regions import (
+    AT_MOST, AT_LEAST, BETWEEN, LEFT, RIGHT, TWO_SIDED,
+    CriticalRegion, region_probability, critical_region, tail_probabilities, p_value,
+)
+from stats_core.sampling import (
+    DEFAULT_MEMORY_BUDGET, REFERENCE, FAST, ENGINES,
+    draw_observations, draw_sums, has_exact_sum, iter_sample_means, sample_means,
+    PARALLEL_BLOCK, DEFAULT_WORKERS, iter_parallel_sample_means, parallel_sample_means,
+)
+from stats_core.histogram import StreamingHistogram, centered_edges
+from stats_core.simulation import IntervalSimulation, simulate_z_intervals, trailing_windows
+from stats_core.rng import MAX_SEED, new_seed, derive_seed, generator
+from stats_core.tables import load_tables, quantile
+from stats_core.regression import RegressionStats, LinearFit, grouped_regression
+from stats_core.points import PointStore
+from stats_core.lazy import LazyModule, lazy_import
@@ -0,0 +1,111 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from stats_core.curves import Curve, continuous_curve, with_anchors
+from stats_core.distributions import Distribution
+from stats_core.grids import GridSpec, AdaptiveGridSpec
+
+# ----------------------------------
+# CURVE CACHE
+# ----------------------------------
+DEFAULT_MAX_BYTES = 32 * 2**20
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits:      int
+    misses:    int
+    evictions: int
+    entries:   int
+    nbytes:    int
+    max_bytes: int
+
+
+def _curve_nbytes(curve: Curve) -> int:
+    return curve.x.nbytes + curve.pdf.nbytes + curve.cdf.nbytes
+
+
+def _freeze(curve: Curve) -> Curve:
+    for arr in (curve.x, curve.pdf, curve.cdf):
+        arr.setflags(write=False)
+    return curve
+
+
+class CurveCache:
+    """
+    Thread-safe LRU cache of evaluated curves, keyed by distribution and grid.
+
+    The cache holds at most `max_bytes` of array data; the least recently used
+    curves are evicted first. Cached arrays are read-only because they are
+    shared between reruns and sessions.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self._max_bytes = int(max_bytes)
+        self._entries   = OrderedDict()
+        self._nbytes    = 0
+        self._hits      = 0
+        self._misses    = 0
+        self._evictions = 0
+        self._lock      = threading.Lock()
+
+    def get(self, dist: Distribution, grid: GridSpec | AdaptiveGridSpec) -> Curve:
+        key = (dist, grid)
+        with self._lock:
+            curve = self._entries.get(key)
+            if curve is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return curve
+            self._misses += 1
+
+        curve = _freeze(continuous_curve(dist, grid))
+        size  = _curve_nbytes(curve)
+
+        with self._lock:
+            if key not in self._entries and size <= self._max_bytes:
+                self._entries[key] = curve
+                self._nbytes += size
+                self._evict()
+        return curve
+
+    def resize(self, max_bytes: int) -> None:
+        with self._lock:
+            self._max_bytes = int(max_bytes)
+            self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                nbytes=self._nbytes,
+                max_bytes=self._max_bytes,
+            )
+
+    def _evict(self) -> None:
+        while self._nbytes > self._max_bytes and self._entries:
+            _, curve = self._entries.popitem(last=False)
+            self._nbytes    -= _curve_nbytes(curve)
+            self._evictions += 1
+
+
+curve_cache = CurveCache()
+
+
+def cached_curve(dist: Distribution, grid: GridSpec | AdaptiveGridSpec, anchors=()) -> Curve:
+    """
+    Evaluate `dist` on `grid` through the shared process-wide curve cache.
+
+    Anchors are inserted after the lookup, so moving a threshold reuses the
+    cached curve and only evaluates the anchor points themselves.
+    """
+    return with_anchors(curve_cache.get(dist, grid), dist, anchors)
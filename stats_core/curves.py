@@ -0,0 +1,55 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from stats_core.distributions import Distribution, pdf, cdf
+from stats_core.grids import GridSpec, AdaptiveGridSpec, integer_grid
+
+# ----------------------------------
+# CURVES
+# ----------------------------------
+@dataclass(frozen=True)
+class Curve:
+    """A continuous distribution evaluated on a grid."""
+    x:   np.ndarray
+    pdf: np.ndarray
+    cdf: np.ndarray
+
+
+@dataclass(frozen=True)
+class DiscreteTable:
+    """Probability mass and cumulative probabilities on 0, 1, ..., k_max."""
+    k:   np.ndarray
+    pmf: np.ndarray
+    cdf: np.ndarray
+
+
+def continuous_curve(dist: Distribution, grid: GridSpec | AdaptiveGridSpec) -> Curve:
+    x, y = grid.sample(lambda x: pdf(dist, x))
+    return Curve(x=x, pdf=y, cdf=cdf(dist, x))
+
+
+def with_anchors(curve: Curve, dist: Distribution, anchors) -> Curve:
+    """
+    Insert exact evaluations at `anchors` (thresholds, critical values) into a curve.
+
+    Anchors outside the curve's range, None values and points already on the
+    grid are skipped, so shaded regions start exactly at their boundaries.
+    """
+    pts = np.array([a for a in anchors if a is not None], dtype=float)
+    pts = pts[(pts >= curve.x[0]) & (pts <= curve.x[-1])]
+    pts = np.setdiff1d(pts, curve.x)
+    if pts.size == 0:
+        return curve
+
+    idx = np.searchsorted(curve.x, pts)
+    return Curve(
+        x=np.insert(curve.x, idx, pts),
+        pdf=np.insert(curve.pdf, idx, pdf(dist, pts)),
+        cdf=np.insert(curve.cdf, idx, cdf(dist, pts)),
+    )
+
+
+def discrete_table(dist: Distribution, k_max: int) -> DiscreteTable:
+    k = integer_grid(k_max)
+    return DiscreteTable(k=k, pmf=pdf(dist, k), cdf=cdf(dist, k))
@@ -0,0 +1,104 @@
+from dataclasses import dataclass
+
+from stats_core.lazy import lazy_import
+
+stats = lazy_import("scipy.stats")
+
+# ----------------------------------
+# DISTRIBUTION SPECS
+# ----------------------------------
+# Attribute names in scipy.stats, looked up on use so that scipy is only
+# imported once a distribution is actually evaluated.
+_SCIPY_DISTRIBUTIONS = {
+    "normal":   "norm",
+    "t":        "t",
+    "chi2":     "chi2",
+    "f":        "f",
+    "uniform":  "uniform",
+    "expon":    "expon",
+    "binomial": "binom",
+    "poisson":  "poisson",
+}
+_DISCRETE = {"binomial", "poisson"}
+
+
+@dataclass(frozen=True)
+class Distribution:
+    """
+    Hashable description of a distribution.
+
+    Attributes:
+        name:   Key into the supported distributions (e.g. 'normal', 'chi2').
+        params: Positional scipy arguments (shape parameters, then loc/scale).
+    """
+    name:   str
+    params: tuple
+
+    @property
+    def discrete(self) -> bool:
+        return self.name in _DISCRETE
+
+    @property
+    def scipy(self):
+        return getattr(stats, _SCIPY_DISTRIBUTIONS[self.name])
+
+
+def normal(mu: float, sigma: float) -> Distribution:
+    return Distribution("normal", (float(mu), float(sigma)))
+
+def student_t(df: float) -> Distribution:
+    return Distribution("t", (float(df),))
+
+def chi_squared(df: float) -> Distribution:
+    return Distribution("chi2", (float(df),))
+
+def fisher_f(df1: float, df2: float) -> Distribution:
+    return Distribution("f", (float(df1), float(df2)))
+
+def uniform(a: float, b: float) -> Distribution:
+    return Distribution("uniform", (float(a), float(b) - float(a)))
+
+def exponential(lam: float) -> Distribution:
+    return Distribution("expon", (0.0, 1 / float(lam)))
+
+def binomial(n: int, p: float) -> Distribution:
+    return Distribution("binomial", (int(n), float(p)))
+
+def poisson(lam: float) -> Distribution:
+    return Distribution("poisson", (float(lam),))
+
+# ----------------------------------
+# EVALUATION
+# ----------------------------------
+def pdf(dist: Distribution, x):
+    """Density for continuous distributions, probability mass for discrete ones."""
+    if dist.discrete:
+        return dist.scipy.pmf(x, *dist.params)
+    return dist.scipy.pdf(x, *dist.params)
+
+
+def cdf(dist: Distribution, x):
+    return dist.scipy.cdf(x, *dist.params)
+
+
+def sf(dist: Distribution, x):
+    """Survival function P(X > x)."""
+    return dist.scipy.sf(x, *dist.params)
+
+
+def ppf(dist: Distribution, q):
+    """Quantile function (inverse of the CDF)."""
+    return dist.scipy.ppf(q, *dist.params)
+
+
+def mean(dist: Distribution) -> float:
+    return float(dist.scipy.mean(*dist.params))
+
+
+def std(dist: Distribution) -> float:
+    return float(dist.scipy.std(*dist.params))
+
+
+def support(dist: Distribution) -> tuple[float, float]:
+    lo, hi = dist.scipy.support(*dist.params)
+    return float(lo), float(hi)
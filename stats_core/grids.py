@@ -0,0 +1,95 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+# ----------------------------------
+# GRIDS
+# ----------------------------------
+@dataclass(frozen=True)
+class GridSpec:
+    """Evenly spaced grid of `num` points on [lo, hi]."""
+    lo:  float
+    hi:  float
+    num: int
+
+    def points(self) -> np.ndarray:
+        return np.linspace(self.lo, self.hi, self.num)
+
+    def sample(self, func) -> tuple[np.ndarray, np.ndarray]:
+        x = self.points()
+        return x, func(x)
+
+
+@dataclass(frozen=True)
+class AdaptiveGridSpec:
+    """
+    Grid on [lo, hi] that is refined only where the sampled function bends.
+
+    `tol` is the largest allowed gap between the function and its linear
+    interpolant, relative to the function's peak value.
+    """
+    lo:  float
+    hi:  float
+    tol: float = 1e-3
+
+    def sample(self, func) -> tuple[np.ndarray, np.ndarray]:
+        return adaptive_sample(func, self.lo, self.hi, self.tol)
+
+
+def linear_grid(lo: float, hi: float, num: int) -> GridSpec:
+    return GridSpec(float(lo), float(hi), int(num))
+
+
+def adaptive_grid(lo: float, hi: float, tol: float = 1e-3) -> AdaptiveGridSpec:
+    return AdaptiveGridSpec(float(lo), float(hi), float(tol))
+
+
+def integer_grid(k_max: int) -> np.ndarray:
+    """The support points 0, 1, ..., k_max of a discrete distribution."""
+    return np.arange(0, int(k_max) + 1)
+
+
+def adaptive_sample(func, lo, hi, tol=1e-3, initial=33, max_depth=24, max_points=10_000):
+    """
+    Sample a vectorized `func` on [lo, hi] by repeated bisection.
+
+    Every pass evaluates the midpoints of the intervals that are still active
+    in one call, and keeps a midpoint only where it deviates more than
+    `tol * max|func|` from the chord. Smooth stretches therefore stay coarse,
+    while peaks, kinks and jumps are refined down to (hi - lo) / 2**max_depth.
+
+    Returns:
+        The sample points and the function values at those points.
+    """
+    x = np.linspace(lo, hi, initial)
+    y = np.asarray(func(x), dtype=float)
+
+    finite = np.isfinite(y)
+    scale  = np.max(np.abs(y[finite])) if finite.any() else 0.0
+    bound  = tol * (scale or 1.0)
+
+    active = np.ones(len(x) - 1, dtype=bool)
+    for _ in range(max_depth):
+        left = np.flatnonzero(active)
+        if left.size == 0 or len(x) + left.size > max_points:
+            break
+
+        x_mid = 0.5 * (x[left] + x[left + 1])
+        y_mid = np.asarray(func(x_mid), dtype=float)
+        with np.errstate(invalid="ignore"):
+            error = np.abs(y_mid - 0.5 * (y[left] + y[left + 1]))
+        refine = ~(error <= bound)          # non-finite errors are refined too
+        if not refine.any():
+            break
+
+        idx = left[refine]
+        x = np.insert(x, idx + 1, x_mid[refine])
+        y = np.insert(y, idx + 1, y_mid[refine])
+
+        # Only the two halves of a refined interval stay active.
+        new = idx + 1 + np.arange(idx.size)
+        active = np.zeros(len(x) - 1, dtype=bool)
+        active[new - 1] = True
+        active[new] = True
+
+    return x, y
@@ -0,0 +1,118 @@
+import math
+
+import numpy as np
+
+# ----------------------------------
+# STREAMING HISTOGRAM
+# ----------------------------------
+def centered_edges(mu: float, sigma: float, n_bins: int, width: float = 4.0,
+                   support: tuple[float, float] = (-np.inf, np.inf),
+                   lattice: float | None = None) -> np.ndarray:
+    """
+    Fixed bin edges covering mu ± width·sigma, clipped to `support`.
+
+    For values on a lattice (e.g. means of integer observations, spaced
+    1/n apart) every bin spans the same whole number of lattice steps and the
+    edges fall halfway between lattice points, so every bin holds the same
+    number of attainable values. The range is widened rather than dropping
+    bins, so exactly `n_bins` bins are returned unless fewer lattice points
+    fall inside the range; then each bin holds a single point.
+    """
+    spread = width * sigma if sigma > 0 else 0.5
+    lo     = max(mu - spread, support[0])
+    hi     = min(mu + spread, support[1])
+    n_bins = max(1, int(n_bins))
+
+    if not lattice:
+        if hi <= lo:
+            lo, hi = lo - 0.5, hi + 0.5
+        return np.linspace(lo, hi, n_bins + 1)
+
+    # Work in integer lattice indices to avoid rounding drift in the edges.
+    k_lo   = math.ceil(lo / lattice - 1e-9)
+    k_hi   = max(k_lo, math.floor(hi / lattice + 1e-9))
+    points = k_hi - k_lo + 1
+    n_bins = min(n_bins, points)
+    steps  = math.ceil(points / n_bins)
+
+    # Spread the surplus points evenly over both ends, then shift the range
+    # back inside the support where it spills over.
+    start = k_lo - (n_bins * steps - points) // 2
+    if np.isfinite(support[1]):
+        start = min(start, math.floor(support[1] / lattice + 1e-9) - n_bins * steps + 1)
+    if np.isfinite(support[0]):
+        start = max(start, math.ceil(support[0] / lattice - 1e-9))
+    return (start - 0.5 + steps * np.arange(n_bins + 1)) * lattice
+
+
+class StreamingHistogram:
+    """
+    Histogram with fixed edges plus running mean and variance.
+
+    Values are consumed chunk by chunk, so memory stays O(bins) however many
+    values are added. The mean and variance are merged per chunk with Chan's
+    parallel form of Welford's algorithm; values outside the edges are
+    counted in `underflow` and `overflow` but still contribute to the mean
+    and variance.
+    """
+
+    def __init__(self, edges):
+        self.edges     = np.asarray(edges, dtype=float)
+        self.counts    = np.zeros(len(self.edges) - 1, dtype=np.int64)
+        self.underflow = 0
+        self.overflow  = 0
+        self.n         = 0
+        self._mean     = 0.0
+        self._m2       = 0.0
+
+    def add(self, values) -> None:
+        values = np.asarray(values, dtype=float).ravel()
+        if values.size == 0:
+            return
+
+        self.counts    += np.histogram(values, bins=self.edges)[0]
+        self.underflow += int(np.count_nonzero(values < self.edges[0]))
+        self.overflow  += int(np.count_nonzero(values > self.edges[-1]))
+
+        chunk_mean = float(values.mean())
+        chunk_m2   = float(np.square(values - chunk_mean).sum())
+        self._merge(values.size, chunk_mean, chunk_m2)
+
+    def merge(self, other: "StreamingHistogram") -> None:
+        """Fold another histogram with identical edges into this one."""
+        if not np.array_equal(self.edges, other.edges):
+            raise ValueError("histograms have different bin edges")
+        self.counts    += other.counts
+        self.underflow += other.underflow
+        self.overflow  += other.overflow
+        self._merge(other.n, other._mean, other._m2)
+
+    def _merge(self, n: int, mean: float, m2: float) -> None:
+        if n == 0:
+            return
+        total      = self.n + n
+        delta      = mean - self._mean
+        self._mean += delta * n / total
+        self._m2   += m2 + delta**2 * self.n * n / total
+        self.n      = total
+
+    @property
+    def centers(self) -> np.ndarray:
+        return (self.edges[:-1] + self.edges[1:]) / 2
+
+    @property
+    def widths(self) -> np.ndarray:
+        return np.diff(self.edges)
+
+    @property
+    def mean(self) -> float:
+        return self._mean if self.n else math.nan
+
+    @property
+    def var(self) -> float:
+        """Population variance (ddof=0), as np.var."""
+        return self._m2 / self.n if self.n else math.nan
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.var)
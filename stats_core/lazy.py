@@ -0,0 +1,48 @@
+import importlib
+import sys
+
+# ----------------------------------
+# LAZY IMPORTS
+# ----------------------------------
+class LazyModule:
+    """
+    Stand-in for a module that is imported on first attribute access.
+
+    scipy.stats alone takes over a second to import; behind a LazyModule a
+    page that never evaluates a distribution never pays for it. The import
+    itself goes through importlib, whose per-module locks make concurrent
+    first accesses from several script threads safe.
+    """
+
+    def __init__(self, name: str):
+        self._name   = name
+        self._module = None
+
+    def _load(self):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return self._module
+
+    def __getattr__(self, attr: str):
+        # Only called for attributes not found on the proxy itself.
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module {self._name!r} ({state})>"
+
+
+def lazy_import(name: str):
+    """
+    `name` as a module that is imported on first use.
+
+    Returns the module itself if it has already been imported, e.g.
+    `stats = lazy_import("scipy.stats")` instead of `from scipy import stats`.
+    Names imported with `from module import name` are resolved immediately
+    and therefore cannot be lazy; access them as `module.name` instead.
+    """
+    return sys.modules.get(name) or LazyModule(name)
+
@@ -0,0 +1,147 @@
+import numpy as np
+
+from stats_core.regression import RegressionStats, LinearFit, grouped_regression
+
+# ----------------------------------
+# POINT STORE
+# ----------------------------------
+class PointStore:
+    """
+    Growable columns of (x, y) points with running regression statistics.
+
+    The points live in two float64 arrays whose capacity doubles when full,
+    so append and pop are amortized O(1) and a million points take 16 MB
+    (up to 32 MB right after a resize) instead of two lists of Python
+    floats. `x` and `y` are read-only views of the filled part, so plotting
+    and fitting never copy. Every change also updates `stats`, so fit()
+    costs O(1) however many points there are.
+
+    Categorical columns (e.g. "gender") can be kept next to x and y as int32
+    codes into a list of labels. A point without a value for a column, such
+    as one added with append(), gets code -1 and belongs to no group there.
+    """
+
+    def __init__(self, capacity: int = 64):
+        self._capacity = max(1, int(capacity))
+        self.clear()
+
+    def clear(self) -> None:
+        self._x      = np.empty(self._capacity)
+        self._y      = np.empty(self._capacity)
+        self._n      = 0
+        self._codes  = {}   # column -> int32 codes, same capacity as _x
+        self._labels = {}   # column -> {label: code}, in order of appearance
+        self.stats   = RegressionStats()
+
+    def __len__(self) -> int:
+        return self._n
+
+    def _reserve(self, size: int) -> None:
+        if size <= len(self._x):
+            return
+        capacity = max(size, 2 * len(self._x))
+        for name in ("_x", "_y"):
+            grown = np.empty(capacity)
+            grown[:self._n] = getattr(self, name)[:self._n]
+            setattr(self, name, grown)
+        for column, codes in self._codes.items():
+            grown = np.full(capacity, -1, dtype=np.int32)
+            grown[:self._n] = codes[:self._n]
+            self._codes[column] = grown
+
+    def append(self, x: float, y: float) -> None:
+        self._reserve(self._n + 1)
+        self._x[self._n], self._y[self._n] = x, y
+        for codes in self._codes.values():
+            codes[self._n] = -1
+        self._n += 1
+        self.stats.add(float(x), float(y))
+
+    def extend(self, x, y, categories: dict | None = None) -> None:
+        """
+        Add the points of the arrays x and y.
+
+        Args:
+            categories: Optional {column: (codes, labels)} in factorized form:
+                one code per point indexing `labels`, -1 for a missing value.
+                Columns not given here get code -1 for these points.
+        """
+        x = np.asarray(x, dtype=float).ravel()
+        y = np.asarray(y, dtype=float).ravel()
+        if x.size != y.size:
+            raise ValueError(f"x and y differ in length ({x.size} and {y.size})")
+        categories = categories or {}
+        for column, (codes, _) in categories.items():
+            if len(codes) != x.size:
+                raise ValueError(f"column {column!r} has {len(codes)} codes for {x.size} points")
+        self._reserve(self._n + x.size)
+        for column in categories:
+            if column not in self._codes:
+                self._codes[column]  = np.full(len(self._x), -1, dtype=np.int32)
+                self._labels[column] = {}
+        for column, codes in self._codes.items():
+            block = codes[self._n:self._n + x.size]
+            if column in categories:
+                block[:] = self._encode(column, *categories[column])
+            else:
+                block[:] = -1
+        self._x[self._n:self._n + x.size] = x
+        self._y[self._n:self._n + y.size] = y
+        self._n += x.size
+        self.stats.update(x, y)
+
+    def _encode(self, column: str, codes, labels) -> np.ndarray:
+        # Only the block's distinct labels go through the dict; the codes are
+        # remapped with one take. The trailing -1 keeps missing values at -1.
+        index  = self._labels[column]
+        lookup = np.array([index.setdefault(str(label), len(index)) for label in labels] + [-1], dtype=np.int32)
+        return lookup[np.asarray(codes, dtype=np.intp).ravel()]
+
+    def pop(self) -> tuple[float, float]:
+        """Remove and return the last point."""
+        if self._n == 0:
+            raise IndexError("pop from an empty PointStore")
+        self._n -= 1
+        x, y = float(self._x[self._n]), float(self._y[self._n])
+        self.stats.remove(x, y)
+        return x, y
+
+    def _view(self, column: np.ndarray) -> np.ndarray:
+        view = column[:self._n]
+        view.flags.writeable = False
+        return view
+
+    @property
+    def x(self) -> np.ndarray:
+        return self._view(self._x)
+
+    @property
+    def y(self) -> np.ndarray:
+        return self._view(self._y)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the columns, including unused capacity."""
+        return self._x.nbytes + self._y.nbytes + sum(codes.nbytes for codes in self._codes.values())
+
+    @property
+    def categories(self) -> list[str]:
+        """Names of the categorical columns."""
+        return list(self._codes)
+
+    def labels(self, column: str) -> list[str]:
+        """Labels of a categorical column; label i has code i."""
+        return list(self._labels[column])
+
+    def codes(self, column: str) -> np.ndarray:
+        return self._view(self._codes[column])
+
+    def drop_category(self, column: str) -> None:
+        del self._codes[column], self._labels[column]
+
+    def fit(self) -> LinearFit:
+        return self.stats.fit()
+
+    def group_stats(self, column: str) -> list[RegressionStats]:
+        """RegressionStats per label of a categorical column, in O(n) for all groups together."""
+        return grouped_regression(self.codes(column), self.x, self.y, len(self._labels[column]))
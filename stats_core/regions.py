@@ -0,0 +1,77 @@
+from dataclasses import dataclass
+
+from stats_core.distributions import Distribution, cdf, sf
+from stats_core.tables import quantile
+
+# ----------------------------------
+# PROBABILITY REGIONS
+# ----------------------------------
+# The region modes use the same labels as the page selectboxes.
+AT_MOST = r"P(X ≤ b)"
+AT_LEAST = r"P(X ≥ a)"
+BETWEEN = r"P(a ≤ X ≤ b)"
+
+
+def region_probability(dist: Distribution, mode: str, lo=None, hi=None) -> float | None:
+    """
+    Probability of the selected region, or None when the bounds are incomplete.
+
+    For discrete distributions the bounds are inclusive, so P(X ≥ a) = P(X > a - 1)
+    and a = b is a valid interval; continuous intervals need a < b.
+    """
+    step = 1 if dist.discrete else 0
+    if mode == AT_MOST and hi is not None:
+        return float(cdf(dist, hi))
+    if mode == AT_LEAST and lo is not None:
+        return float(sf(dist, lo - step))
+    if mode == BETWEEN and lo is not None and hi is not None:
+        if lo > hi or (lo == hi and not dist.discrete):
+            return None
+        return float(cdf(dist, hi) - cdf(dist, lo - step))
+    return None
+
+# ----------------------------------
+# HYPOTHESIS TESTS
+# ----------------------------------
+LEFT = "left"
+RIGHT = "right"
+TWO_SIDED = "two-sided"
+
+
+@dataclass(frozen=True)
+class CriticalRegion:
+    """Reject H0 when the test statistic is below `left` or above `right`."""
+    left:  float | None
+    right: float | None
+
+    def contains(self, stat: float) -> bool:
+        return ((self.left is not None and stat < self.left)
+                or (self.right is not None and stat > self.right))
+
+
+def critical_region(dist: Distribution, alpha: float, tail: str) -> CriticalRegion:
+    if tail == RIGHT:
+        return CriticalRegion(None, quantile(dist, 1 - alpha))
+    if tail == LEFT:
+        return CriticalRegion(quantile(dist, alpha), None)
+    return CriticalRegion(quantile(dist, alpha / 2), quantile(dist, 1 - alpha / 2))
+
+
+def tail_probabilities(dist: Distribution, stat: float) -> tuple[float, float]:
+    """Return (P(X ≤ stat), P(X ≥ stat)) for a continuous distribution."""
+    return float(cdf(dist, stat)), float(sf(dist, stat))
+
+
+def p_value(dist: Distribution, stat: float, tail: str) -> float:
+    """
+    p-value of `stat` under `dist`.
+
+    For a two-sided test this is the smallest tail probability, which the
+    pages compare against alpha / 2.
+    """
+    left, right = tail_probabilities(dist, stat)
+    if tail == RIGHT:
+        return right
+    if tail == LEFT:
+        return left
+    return min(left, right)
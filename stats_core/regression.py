@@ -0,0 +1,210 @@
+import functools
+import math
+from dataclasses import dataclass
+
+import numpy as np
+
+from stats_core.distributions import ppf, student_t
+
+# ----------------------------------
+# SIMPLE LINEAR REGRESSION
+# ----------------------------------
+class RegressionStats:
+    """
+    Running sufficient statistics for the least-squares line y = b0 + b1·x.
+
+    Holds n, the means of x and y and the centred sums of squares and
+    cross-products Sxx, Syy and Sxy, which determine the fit (see fit()). Single points are added and removed in O(1) with
+    Welford's update; whole arrays are folded in with Chan's parallel form.
+    Centred sums avoid the cancellation of the textbook Σx², Σxy form when
+    the data lie far from the origin.
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self) -> None:
+        self.n      = 0
+        self.x_mean = 0.0
+        self.y_mean = 0.0
+        self.sxx    = 0.0
+        self.syy    = 0.0
+        self.sxy    = 0.0
+
+    @classmethod
+    def from_arrays(cls, x, y) -> "RegressionStats":
+        stats = cls()
+        stats.update(x, y)
+        return stats
+
+    @classmethod
+    def from_moments(cls, n, x_mean, y_mean, sxx, syy, sxy) -> "RegressionStats":
+        stats = cls()
+        stats._merge(int(n), float(x_mean), float(y_mean), float(sxx), float(syy), float(sxy))
+        return stats
+
+    def add(self, x: float, y: float) -> None:
+        self.n      += 1
+        dx           = x - self.x_mean
+        dy           = y - self.y_mean
+        self.x_mean += dx / self.n
+        self.y_mean += dy / self.n
+        self.sxx    += dx * (x - self.x_mean)
+        self.syy    += dy * (y - self.y_mean)
+        self.sxy    += dx * (y - self.y_mean)
+
+    def remove(self, x: float, y: float) -> None:
+        """Undo add(x, y) for a point that was added earlier."""
+        if self.n <= 1:
+            self.clear()
+            return
+        x_mean       = (self.n * self.x_mean - x) / (self.n - 1)
+        y_mean       = (self.n * self.y_mean - y) / (self.n - 1)
+        self.sxx    -= (x - x_mean) * (x - self.x_mean)
+        self.syy    -= (y - y_mean) * (y - self.y_mean)
+        self.sxy    -= (x - x_mean) * (y - self.y_mean)
+        self.x_mean, self.y_mean = x_mean, y_mean
+        self.n      -= 1
+
+    def update(self, x, y) -> None:
+        """Add all points of the arrays x and y."""
+        x = np.asarray(x, dtype=float).ravel()
+        y = np.asarray(y, dtype=float).ravel()
+        if x.size != y.size:
+            raise ValueError(f"x and y differ in length ({x.size} and {y.size})")
+        if x.size == 0:
+            return
+        x_mean, y_mean = float(x.mean()), float(y.mean())
+        dx, dy         = x - x_mean, y - y_mean
+        self._merge(x.size, x_mean, y_mean, float(dx @ dx), float(dy @ dy), float(dx @ dy))
+
+    def merge(self, other: "RegressionStats") -> None:
+        self._merge(other.n, other.x_mean, other.y_mean, other.sxx, other.syy, other.sxy)
+
+    def _merge(self, n, x_mean, y_mean, sxx, syy, sxy) -> None:
+        if n == 0:
+            return
+        total        = self.n + n
+        dx           = x_mean - self.x_mean
+        dy           = y_mean - self.y_mean
+        weight       = self.n * n / total
+        self.sxx    += sxx + dx * dx * weight
+        self.syy    += syy + dy * dy * weight
+        self.sxy    += sxy + dx * dy * weight
+        self.x_mean += dx * n / total
+        self.y_mean += dy * n / total
+        self.n       = total
+
+    def fit(self) -> "LinearFit":
+        """
+        Snapshot of the least-squares fit.
+
+        The slope is 0 when all x are equal, which is the minimum-norm
+        least-squares solution. r is nan when x or y is constant.
+        """
+        slope = self.sxy / self.sxx if self.sxx > 0 else 0.0
+        denom = math.sqrt(self.sxx * self.syy)
+        sse   = max(self.syy - slope * self.sxy, 0.0)
+        return LinearFit(
+            n=self.n,
+            x_mean=self.x_mean,
+            sxx=self.sxx,
+            slope=slope,
+            intercept=self.y_mean - slope * self.x_mean,
+            r=self.sxy / denom if denom > 0 else math.nan,
+            s=math.sqrt(sse / (self.n - 2)) if self.n > 2 else math.nan,
+        )
+
+
+def grouped_regression(codes, x, y, n_groups: int) -> list[RegressionStats]:
+    """
+    RegressionStats per group, for integer group codes 0 .. n_groups - 1.
+
+    All groups are reduced together with np.bincount: one pass for the
+    counts and means, one for the centred sums, so the cost is O(n) however
+    many groups there are. Points with a negative code belong to no group.
+    """
+    codes = np.asarray(codes, dtype=np.intp).ravel()
+    x     = np.asarray(x, dtype=float).ravel()
+    y     = np.asarray(y, dtype=float).ravel()
+    if (codes < 0).any():
+        keep = codes >= 0
+        codes, x, y = codes[keep], x[keep], y[keep]
+
+    n = np.bincount(codes, minlength=n_groups)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        x_mean = np.bincount(codes, x, minlength=n_groups) / n
+        y_mean = np.bincount(codes, y, minlength=n_groups) / n
+    dx  = x - x_mean[codes]
+    dy  = y - y_mean[codes]
+    sxx = np.bincount(codes, dx * dx, minlength=n_groups)
+    syy = np.bincount(codes, dy * dy, minlength=n_groups)
+    sxy = np.bincount(codes, dx * dy, minlength=n_groups)
+    return [RegressionStats.from_moments(*moments) for moments in zip(n, x_mean, y_mean, sxx, syy, sxy)]
+
+
+@functools.lru_cache(maxsize=256)
+def _t_critical(df: int, alpha: float) -> float:
+    return float(ppf(student_t(df), 1 - alpha / 2))
+
+
+@dataclass(frozen=True)
+class LinearFit:
+    """
+    Fitted line y = intercept + slope·x with what its interval bands need.
+
+    Attributes:
+        sxx: Σ(x - x̄)².
+        s:   Residual standard error sqrt(SSE / (n - 2)); nan for n < 3.
+    """
+    n:         int
+    x_mean:    float
+    sxx:       float
+    slope:     float
+    intercept: float
+    r:         float
+    s:         float
+
+    @property
+    def r_squared(self) -> float:
+        return self.r ** 2
+
+    @property
+    def has_bands(self) -> bool:
+        """Whether the interval bands exist: they need n > 2 and x values that are not all equal."""
+        return self.n > 2 and self.sxx > 0
+
+    def predict(self, x):
+        return self.intercept + self.slope * np.asarray(x, dtype=float)
+
+    def _band(self, x, alpha: float, extra: float):
+        if not self.has_bands:
+            return None
+        x     = np.asarray(x, dtype=float)
+        y_hat = self.predict(x)
+        half  = _t_critical(self.n - 2, alpha) * self.s * np.sqrt(
+            extra + 1 / self.n + (x - self.x_mean) ** 2 / self.sxx
+        )
+        return y_hat - half, y_hat + half
+
+    def confidence_band(self, x, alpha: float):
+        """
+        (1 - alpha) confidence band for E[Y|X=x]:
+
+            ŷ ± t · s · sqrt(1/n + (x - x̄)² / Sxx),  t = t_{1 - alpha/2}(n - 2)
+
+        Returns:
+            (lower, upper), arrays shaped like x, or None without has_bands.
+        """
+        return self._band(x, alpha, 0.0)
+
+    def prediction_band(self, x, alpha: float):
+        """
+        (1 - alpha) prediction band for a new Y at X=x:
+
+            ŷ ± t · s · sqrt(1 + 1/n + (x - x̄)² / Sxx)
+
+        Returns:
+            (lower, upper), arrays shaped like x, or None without has_bands.
+        """
+        return self._band(x, alpha, 1.0)
@@ -0,0 +1,36 @@
+import hashlib
+import secrets
+
+import numpy as np
+
+# ----------------------------------
+# SEEDED RANDOM NUMBER GENERATORS
+# ----------------------------------
+MAX_SEED = 2**32 - 1
+
+
+def new_seed() -> int:
+    """A fresh random session seed in [0, MAX_SEED]."""
+    return secrets.randbelow(MAX_SEED + 1)
+
+
+def _key_words(key: tuple) -> list[int]:
+    # repr() of ints, floats, strings and the frozen stats_core dataclasses is
+    # stable across processes, unlike hash(), which is salted per process.
+    digest = hashlib.blake2b(repr(key).encode(), digest_size=16).digest()
+    return np.frombuffer(digest, dtype=np.uint32).tolist()
+
+
+def derive_seed(seed: int, *key) -> np.random.SeedSequence:
+    """
+    SeedSequence for one use of the session seed, e.g. derive_seed(seed, "ci", mu, sigma, n).
+
+    Different keys give statistically independent streams; the same seed and
+    key always give the same stream, in any process.
+    """
+    return np.random.SeedSequence([int(seed), *_key_words(key)])
+
+
+def generator(seed: int, *key) -> np.random.Generator:
+    """numpy Generator for derive_seed(seed, *key)."""
+    return np.random.default_rng(derive_seed(seed, *key))
@@ -0,0 +1,201 @@
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from stats_core.distributions import Distribution
+
+# ----------------------------------
+# SAMPLE MEANS
+# ----------------------------------
+DEFAULT_MEMORY_BUDGET = 64 * 2**20
+MIN_BLOCK             = 1_024
+
+REFERENCE = "reference"
+FAST      = "fast"
+ENGINES   = (REFERENCE, FAST)
+
+
+def draw_observations(dist: Distribution, rng: np.random.Generator, size) -> np.ndarray:
+    """Draw independent observations from `dist` with a NumPy Generator."""
+    name, params = dist.name, dist.params
+    if name == "normal":
+        return rng.normal(params[0], params[1], size)
+    if name == "uniform":
+        return rng.uniform(params[0], params[0] + params[1], size)
+    if name == "expon":
+        return params[0] + rng.exponential(params[1], size)
+    if name == "binomial":
+        return rng.binomial(params[0], params[1], size)
+    if name == "poisson":
+        return rng.poisson(params[0], size)
+    return dist.scipy.rvs(*params, size=size, random_state=rng)
+
+
+def draw_sums(dist: Distribution, sample_size: int, rng: np.random.Generator, size):
+    """
+    Draw sums of `sample_size` observations directly from their exact distribution.
+
+    Returns None when the distribution of the sum has no closed form here
+    (e.g. the uniform distribution).
+    """
+    name, params, n = dist.name, dist.params, sample_size
+    if name == "normal":
+        return rng.normal(n * params[0], np.sqrt(n) * params[1], size)
+    if name == "expon":
+        return n * params[0] + rng.gamma(n, params[1], size)
+    if name == "binomial":
+        return rng.binomial(n * params[0], params[1], size)
+    if name == "poisson":
+        return rng.poisson(n * params[0], size)
+    return None
+
+
+def has_exact_sum(dist: Distribution) -> bool:
+    return dist.name in {"normal", "expon", "binomial", "poisson"}
+
+
+def _block_shape(sample_size: int, n_samples: int, memory_budget: int) -> tuple[int, int]:
+    """
+    Shape (rows, cols) of one chunk of draws that stays within `memory_budget`.
+
+    Whole samples are drawn at once when they fit; otherwise a block of at
+    least MIN_BLOCK samples is accumulated over several row chunks.
+    """
+    budget = max(1, int(memory_budget) // 8)
+    cols   = min(n_samples, budget, max(MIN_BLOCK, budget // sample_size))
+    rows   = min(sample_size, max(1, budget // cols))
+    return rows, cols
+
+
+def iter_sample_means(dist: Distribution, sample_size: int, n_samples: int, rng=None,
+                      memory_budget: int = DEFAULT_MEMORY_BUDGET, engine: str = REFERENCE):
+    """
+    Yield the means of `n_samples` samples of size `sample_size` in blocks.
+
+    Observations are generated and reduced to running sums chunk by chunk, so
+    at most `memory_budget` bytes of raw draws exist at any time, whatever the
+    sample size.
+
+    The FAST engine draws each sum from its exact distribution (one draw per
+    sample instead of `sample_size`) and falls back to the REFERENCE engine,
+    which draws every observation, when no closed form is available.
+
+    Args:
+        dist:          Distribution of a single observation.
+        sample_size:   Number of observations per sample (n).
+        n_samples:     Number of samples.
+        rng:           numpy Generator, or a seed for np.random.default_rng.
+        memory_budget: Upper bound in bytes for one chunk of raw draws.
+        engine:        REFERENCE or FAST.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"unknown engine {engine!r}, expected one of {ENGINES}")
+    sample_size, n_samples = int(sample_size), int(n_samples)
+    rng = np.random.default_rng(rng)
+
+    if engine == FAST and has_exact_sum(dist):
+        block = max(1, int(memory_budget) // 8)
+        for start in range(0, n_samples, block):
+            yield draw_sums(dist, sample_size, rng, min(block, n_samples - start)) / sample_size
+        return
+
+    rows, cols = _block_shape(sample_size, n_samples, memory_budget)
+
+    for start in range(0, n_samples, cols):
+        width = min(cols, n_samples - start)
+        sums  = np.zeros(width)
+        for done in range(0, sample_size, rows):
+            sums += draw_observations(dist, rng, (min(rows, sample_size - done), width)).sum(axis=0)
+        yield sums / sample_size
+
+
+def sample_means(dist: Distribution, sample_size: int, n_samples: int, rng=None,
+                 memory_budget: int = DEFAULT_MEMORY_BUDGET, engine: str = REFERENCE) -> np.ndarray:
+    """Means of `n_samples` samples of size `sample_size`; see iter_sample_means."""
+    return _collect(iter_sample_means(dist, sample_size, n_samples, rng, memory_budget, engine),
+                    n_samples)
+
+
+def _collect(blocks, n_samples: int) -> np.ndarray:
+    means = np.empty(int(n_samples))
+    start = 0
+    for block in blocks:
+        means[start:start + len(block)] = block
+        start += len(block)
+    return means
+
+
+# ----------------------------------
+# PARALLEL SAMPLING
+# ----------------------------------
+PARALLEL_BLOCK  = 65_536
+# Default thread count. Kept small because a Streamlit server runs one pool
+# per rerun in every session; pass `workers` explicitly to use more cores.
+DEFAULT_WORKERS = min(4, os.cpu_count() or 1)
+
+
+def _seed_sequence(seed) -> np.random.SeedSequence:
+    if isinstance(seed, np.random.SeedSequence):
+        return seed
+    return np.random.SeedSequence(seed)
+
+
+def iter_parallel_sample_means(dist: Distribution, sample_size: int, n_samples: int, seed=None,
+                               workers: int | None = None, block_size: int = PARALLEL_BLOCK,
+                               memory_budget: int = DEFAULT_MEMORY_BUDGET,
+                               engine: str = REFERENCE):
+    """
+    Yield sample means in order, generating fixed-size blocks on a thread pool.
+
+    The samples are split into blocks of `block_size`, and block i always draws
+    from the i-th stream spawned from `seed`. The output therefore depends only
+    on the seed, the block size and the memory budget, never on the number of
+    workers. NumPy releases the GIL while filling and reducing arrays, so
+    threads scale without copying results between processes.
+
+    Args:
+        seed:          int, SeedSequence or None (fresh entropy).
+        workers:       Number of threads; defaults to DEFAULT_WORKERS.
+        block_size:    Number of samples per block.
+        memory_budget: Budget for raw draws per worker; the peak is roughly
+                       `workers * memory_budget`.
+
+    The other arguments are as in iter_sample_means.
+    """
+    sample_size, n_samples = int(sample_size), int(n_samples)
+    block_size = max(1, int(block_size))
+    workers    = max(1, int(workers or DEFAULT_WORKERS))
+    starts     = range(0, n_samples, block_size)
+    streams    = _seed_sequence(seed).spawn(len(starts))
+
+    def block_means(i: int) -> np.ndarray:
+        width = min(block_size, n_samples - starts[i])
+        return sample_means(dist, sample_size, width, np.random.default_rng(streams[i]),
+                            memory_budget, engine)
+
+    if workers == 1 or len(starts) == 1:
+        for i in range(len(starts)):
+            yield block_means(i)
+        return
+
+    # Keep a bounded number of blocks in flight so memory stays O(workers).
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for i in range(len(starts)):
+            pending.append(pool.submit(block_means, i))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def parallel_sample_means(dist: Distribution, sample_size: int, n_samples: int, seed=None,
+                          workers: int | None = None, block_size: int = PARALLEL_BLOCK,
+                          memory_budget: int = DEFAULT_MEMORY_BUDGET,
+                          engine: str = REFERENCE) -> np.ndarray:
+    """Means of `n_samples` samples; see iter_parallel_sample_means."""
+    blocks = iter_parallel_sample_means(dist, sample_size, n_samples, seed, workers,
+                                        block_size, memory_budget, engine)
+    return _collect(blocks, n_samples)
@@ -0,0 +1,63 @@
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from stats_core.distributions import normal
+from stats_core.tables import quantile
+
+# ----------------------------------
+# CONFIDENCE-INTERVAL SIMULATION
+# ----------------------------------
+@dataclass(frozen=True)
+class IntervalSimulation:
+    """
+    Repeated samples from N(mu, sigma) with their z-intervals for mu.
+
+    Attributes:
+        samples: (batch_size, n) array, one sample per row.
+        means:   Sample means.
+        lefts:   Lower interval bounds.
+        rights:  Upper interval bounds.
+        hits:    Whether each interval contains mu.
+    """
+    samples: np.ndarray
+    means:   np.ndarray
+    lefts:   np.ndarray
+    rights:  np.ndarray
+    hits:    np.ndarray
+
+    @property
+    def batch_size(self) -> int:
+        return len(self.means)
+
+
+def simulate_z_intervals(mu: float, sigma: float, n: int, alpha: float, batch_size: int,
+                         rng=None) -> IntervalSimulation:
+    """
+    Draw `batch_size` samples of size `n` in one call and compute their
+    (1 - alpha) confidence intervals for mu with known sigma.
+
+    Args:
+        rng: numpy Generator, or a seed for np.random.default_rng.
+    """
+    rng     = np.random.default_rng(rng)
+    z       = quantile(normal(0, 1), 1 - alpha / 2)
+    half    = z * sigma / np.sqrt(n)
+    samples = rng.normal(mu, sigma, (int(batch_size), int(n)))
+    means   = samples.mean(axis=1)
+    lefts   = means - half
+    rights  = means + half
+    return IntervalSimulation(samples, means, lefts, rights, (lefts <= mu) & (mu <= rights))
+
+
+def trailing_windows(values, size: int, fill=np.nan) -> np.ndarray:
+    """
+    Row k holds values[k], values[k-1], ..., values[k-size+1], newest first.
+
+    Positions before the start are `fill`. The result is a read-only strided
+    view of a single padded copy, so no per-row copies are made.
+    """
+    values = np.asarray(values)
+    padded = np.concatenate([np.full(size - 1, fill, dtype=np.result_type(values, type(fill))), values])
+    return sliding_window_view(padded, size)[:, ::-1]
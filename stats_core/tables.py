@@ -0,0 +1,249 @@
+"""
+Precomputed critical-value tables.
+
+Quantiles of the standard normal, t, chi-squared and F distributions are
+tabulated once for the significance levels a user can pick (0.001, 0.005,
+0.01, 0.015, ..., 0.25) and their halves, for integer degrees of freedom,
+and stored as float64 in a compressed .npz file. A lookup is only served
+from the table when the tail probability is one of those nodes, so table
+values are the exact scipy results. Every other input (another alpha,
+non-integer or large degrees of freedom, central probabilities) is computed
+with scipy; interpolating between nodes would show up in the 4 decimals the
+pages display, and put a rejection bound next to an exact p-value.
+`python -m stats_core.tables --check` compares the table with scipy.
+
+If the file is missing, it is generated in a background thread and lookups
+use scipy until it is ready. Generate it ahead of time with:
+
+    python -m stats_core.tables [--path .cache/critical_values.npz]
+"""
+import argparse
+import os
+import tempfile
+import threading
+import warnings
+import zipfile
+from pathlib import Path
+
+import numpy as np
+
+from stats_core.distributions import Distribution, ppf, student_t, chi_squared, fisher_f, normal
+
+# ----------------------------------
+# GRIDS
+# ----------------------------------
+TABLE_PATH = "./.cache/critical_values.npz"
+
+ALPHA_GRID = np.round(np.concatenate([[0.001], np.arange(0.005, 0.2501, 0.005)]), 3)
+TAIL_GRID  = np.unique(np.concatenate([ALPHA_GRID, ALPHA_GRID / 2]))
+DF_GRID    = np.arange(1, 201)
+F_DF_GRID  = np.arange(1, 51)
+
+# Tolerance for matching a tail probability to a node, so that e.g.
+# 1 - (1 - 0.05 / 2) still finds the node 0.025.
+NODE_RTOL = 1e-9
+
+
+def _upper(dist: Distribution, p: np.ndarray) -> np.ndarray:
+    return ppf(dist, 1 - p)
+
+
+def build_tables() -> dict[str, np.ndarray]:
+    """Evaluate every table with scipy (a few seconds)."""
+    p = TAIL_GRID
+    return dict(
+        p=p,
+        df=DF_GRID,
+        f_df=F_DF_GRID,
+        norm_upper=_upper(normal(0, 1), p),
+        t_upper=np.array([_upper(student_t(df), p) for df in DF_GRID]),
+        chi2_upper=np.array([_upper(chi_squared(df), p) for df in DF_GRID]),
+        chi2_lower=np.array([ppf(chi_squared(df), p) for df in DF_GRID]),
+        f_upper=np.array([[_upper(fisher_f(d1, d2), p) for d2 in F_DF_GRID] for d1 in F_DF_GRID]),
+    )
+
+
+def save_tables(path: str = TABLE_PATH) -> dict[str, np.ndarray]:
+    """
+    Build the tables and write them to `path`.
+
+    The file is written under a temporary name in the same directory and
+    then renamed onto `path`, so a killed process or a second worker writing
+    at the same time never leaves a truncated file behind.
+    """
+    tables = build_tables()
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=target.parent, prefix=target.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            np.savez_compressed(file, **tables)
+        os.replace(tmp, target)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    return tables
+
+# ----------------------------------
+# LOADING
+# ----------------------------------
+_tables     = None
+_generating = False
+_lock       = threading.Lock()
+
+
+def _read(path: str) -> dict[str, np.ndarray] | None:
+    """Tables from `path`, or None if the file is missing, corrupt or built for another grid."""
+    try:
+        with np.load(path) as npz:
+            tables = {name: npz[name] for name in npz.files}
+    except (OSError, ValueError, EOFError, KeyError, zipfile.BadZipFile):
+        return None
+    grids = (("p", TAIL_GRID), ("df", DF_GRID), ("f_df", F_DF_GRID))
+    if not all(name in tables and np.array_equal(tables[name], grid) for name, grid in grids):
+        return None
+    return tables
+
+
+def _generate(path: str) -> None:
+    global _tables, _generating
+    tables = None
+    try:
+        tables = save_tables(path)
+    except Exception as e:
+        # Lookups keep using scipy; the next load_tables call tries again.
+        warnings.warn(f"could not generate critical-value tables at {path}: {e}", RuntimeWarning)
+    finally:
+        with _lock:
+            _tables, _generating = tables, False
+
+
+def load_tables(path: str = TABLE_PATH) -> dict[str, np.ndarray] | None:
+    """
+    Load the tables once per process.
+
+    Returns None while a missing or outdated file is being regenerated in a
+    background thread; callers then compute the quantile exactly.
+    """
+    global _tables, _generating
+    if _tables is not None:
+        return _tables
+    with _lock:
+        if _tables is None and not _generating:
+            _tables = _read(path)
+            if _tables is None:
+                _generating = True
+                threading.Thread(target=_generate, args=(path,), daemon=True).start()
+    return _tables
+
+# ----------------------------------
+# LOOKUP
+# ----------------------------------
+def _node(p: float, grid: np.ndarray) -> int | None:
+    """Index of the grid node equal to p, or None if p lies between nodes."""
+    k = int(np.searchsorted(grid, p))
+    for i in (k - 1, k):
+        if 0 <= i < len(grid) and abs(grid[i] - p) <= NODE_RTOL * p:
+            return i
+    return None
+
+
+def _index(df: float, grid: np.ndarray) -> int | None:
+    if df != int(df) or not grid[0] <= df <= grid[-1]:
+        return None
+    return int(df) - int(grid[0])
+
+
+def _upper_tail(dist: Distribution, p: float, tables) -> float | None:
+    """x with P(X > x) = p for the standardized distribution, or None if off the grid."""
+    k = _node(p, tables["p"])
+    if k is None:
+        return None
+    if dist.name == "normal":
+        return float(tables["norm_upper"][k])
+    if dist.name == "t":
+        i = _index(dist.params[0], tables["df"])
+        return None if i is None else float(tables["t_upper"][i, k])
+    if dist.name == "chi2":
+        i = _index(dist.params[0], tables["df"])
+        return None if i is None else float(tables["chi2_upper"][i, k])
+    if dist.name == "f":
+        i, j = (_index(df, tables["f_df"]) for df in dist.params)
+        return None if i is None or j is None else float(tables["f_upper"][i, j, k])
+    return None
+
+
+def _lower_tail(dist: Distribution, p: float, tables) -> float | None:
+    """x with P(X <= x) = p for the standardized distribution, or None if off the grid."""
+    if dist.name in ("normal", "t"):
+        x = _upper_tail(dist, p, tables)
+        return None if x is None else -x
+    if dist.name == "chi2":
+        i, k = _index(dist.params[0], tables["df"]), _node(p, tables["p"])
+        return None if i is None or k is None else float(tables["chi2_lower"][i, k])
+    if dist.name == "f":
+        # F(d1, d2) lower quantile = 1 / F(d2, d1) upper quantile
+        x = _upper_tail(fisher_f(dist.params[1], dist.params[0]), p, tables)
+        return None if x is None else 1 / x
+    return None
+
+
+def quantile(dist: Distribution, q: float, tables=None) -> float:
+    """
+    Quantile of `dist` at probability q, from the precomputed tables when possible.
+
+    Supports the normal (any mu, sigma), t, chi-squared and F distributions;
+    everything else, and every input off the grid, is computed with scipy.
+    Both paths give the same value.
+    """
+    q = float(q)
+    p = min(q, 1 - q)
+    if dist.name not in ("normal", "t", "chi2", "f") or not TAIL_GRID[0] <= p <= TAIL_GRID[-1]:
+        return float(ppf(dist, q))
+
+    tables = tables or load_tables()
+    if tables is None:
+        return float(ppf(dist, q))
+    std = normal(0, 1) if dist.name == "normal" else dist
+    x   = _lower_tail(std, p, tables) if q < 0.5 else _upper_tail(std, p, tables)
+    if x is None:
+        return float(ppf(dist, q))
+    if dist.name == "normal":
+        mu, sigma = dist.params
+        x = mu + sigma * x
+    return x
+
+# ----------------------------------
+# CLI
+# ----------------------------------
+def check_error(tables) -> float:
+    """Largest relative difference between the table and scipy, over every node."""
+    p     = tables["p"]
+    worst = 0.0
+    dists = [normal(0, 1)]
+    dists += [student_t(df) for df in DF_GRID[::7]]
+    dists += [chi_squared(df) for df in DF_GRID[::7]]
+    dists += [fisher_f(d1, d2) for d1 in F_DF_GRID[::7] for d2 in F_DF_GRID[::7]]
+    for dist in dists:
+        for probs in (p, 1 - p):
+            exact  = ppf(dist, probs)
+            table  = np.array([quantile(dist, q, tables) for q in probs])
+            worst  = max(worst, float(np.max(np.abs(table / exact - 1))))
+    return worst
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate the critical-value tables.")
+    parser.add_argument("--path", default=TABLE_PATH)
+    parser.add_argument("--check", action="store_true", help="report the largest difference with scipy")
+    args = parser.parse_args()
+
+    save_tables(args.path)
+    size   = Path(args.path).stat().st_size
+    print(f"wrote {args.path} ({size / 1024:.0f} kB, {len(TAIL_GRID)} tail probabilities)")
+    if args.check:
+        print(f"max relative difference with scipy: {check_error(_read(args.path)):.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+import numpy as np
+import pytest
+
+import stats_core as sc
+
+
+@pytest.mark.parametrize("mu, sigma, n_bins, lattice", [
+    (6.0, 0.41, 31, 1 / 30),
+    (1.0, 0.18, 31, 1 / 30),
+    (10.0, 0.58, 44, 1 / 30),
+])
+def test_lattice_edges_keep_n_bins(mu, sigma, n_bins, lattice):
+    edges = sc.centered_edges(mu, sigma, n_bins, support=(0, np.inf), lattice=lattice)
+    steps = np.diff(edges) / lattice
+    assert len(edges) - 1 == n_bins
+    assert np.allclose(steps, np.round(steps[0])) and steps[0] >= 1
+    # Edges fall halfway between lattice points.
+    offsets = edges / lattice + 0.5
+    assert np.allclose(offsets, np.round(offsets))
+    assert edges[0] <= mu - 4 * sigma + lattice and edges[-1] >= mu + 4 * sigma - lattice
+
+
+def test_lattice_edges_stay_inside_support():
+    edges = sc.centered_edges(0.05, 0.05, 20, support=(0, 1), lattice=0.01)
+    assert len(edges) - 1 == 20
+    assert edges[0] == pytest.approx(-0.005)
+
+
+def test_lattice_edges_cap_at_attainable_values():
+    edges = sc.centered_edges(0.5, 0.5, 31, support=(0, 1), lattice=1.0)
+    assert edges.tolist() == [-0.5, 0.5, 1.5]
@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+import stats_core as sc
+
+
+def test_extend_encodes_codes_across_blocks():
+    store = sc.PointStore(capacity=2)
+    store.extend([1, 2, 3], [1, 2, 3], {"g": (np.array([0, 1, -1]), ["a", "b"])})
+    store.extend([4, 5], [4, 5], {"g": (np.array([0, 1]), ["c", "a"])})
+    assert store.labels("g") == ["a", "b", "c"]
+    assert store.codes("g").tolist() == [0, 1, -1, 2, 0]
+
+
+def test_points_without_a_column_get_no_group():
+    store = sc.PointStore()
+    store.append(0, 0)
+    store.extend([1, 2], [1, 2], {"g": (np.array([0, 0]), ["a"])})
+    store.append(3, 3)
+    store.extend([4], [4])
+    assert store.codes("g").tolist() == [-1, 0, 0, -1, -1]
+    store.pop()
+    assert store.codes("g").tolist() == [-1, 0, 0, -1]
+
+
+def test_extend_rejects_mismatched_codes():
+    with pytest.raises(ValueError):
+        sc.PointStore().extend([1, 2], [1, 2], {"g": (np.array([0]), ["a"])})
+
+
+def test_group_stats_ignore_ungrouped_points():
+    store = sc.PointStore()
+    store.append(100, -100)
+    store.extend([1, 2, 3, 4], [2, 4, 5, 9], {"g": (np.array([0, 0, 1, 1]), ["a", "b"])})
+    a, b = (stats.fit() for stats in store.group_stats("g"))
+    assert (a.n, a.slope) == (2, pytest.approx(2.0))
+    assert (b.n, b.slope) == (2, pytest.approx(4.0))
+
+
+def test_running_stats_follow_the_columns():
+    rng   = np.random.default_rng(1)
+    store = sc.PointStore()
+    store.extend(rng.normal(size=500), rng.normal(size=500))
+    for _ in range(100):
+        store.pop()
+    expected = sc.RegressionStats.from_arrays(store.x, store.y)
+    assert len(store) == 400
+    assert store.stats.sxy == pytest.approx(expected.sxy, rel=1e-9)
+    with pytest.raises(ValueError):
+        store.x[0] = 1.0
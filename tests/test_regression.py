@@ -0,0 +1,76 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import stats_core as sc
+
+DATASET = Path(__file__).resolve().parents[1] / "datasets" / "StudentsPerformance.csv"
+
+
+@pytest.fixture
+def data():
+    rng   = np.random.default_rng(0)
+    codes = rng.integers(-1, 5, 2_000)
+    x     = rng.normal(50, 10, codes.size)
+    return codes, x, (codes + 1) * x + rng.normal(0, 5, codes.size)
+
+
+def test_from_arrays_matches_polyfit(data):
+    _, x, y = data
+    fit     = sc.RegressionStats.from_arrays(x, y).fit()
+    slope, intercept = np.polyfit(x, y, 1)
+    assert fit.slope == pytest.approx(slope, rel=1e-10)
+    assert fit.intercept == pytest.approx(intercept, rel=1e-10)
+    assert fit.r == pytest.approx(np.corrcoef(x, y)[0, 1], rel=1e-10)
+
+
+def test_remove_undoes_add(data):
+    _, x, y = data
+    stats   = sc.RegressionStats.from_arrays(x[:100], y[:100])
+    for xi, yi in zip(x[100:150], y[100:150]):
+        stats.add(xi, yi)
+    for xi, yi in zip(x[149:99:-1], y[149:99:-1]):
+        stats.remove(xi, yi)
+    expected = sc.RegressionStats.from_arrays(x[:100], y[:100])
+    for name in ("n", "x_mean", "y_mean", "sxx", "syy", "sxy"):
+        assert getattr(stats, name) == pytest.approx(getattr(expected, name), rel=1e-9)
+
+
+def test_remove_last_point_clears():
+    stats = sc.RegressionStats()
+    stats.add(1.0, 2.0)
+    stats.remove(1.0, 2.0)
+    assert stats.n == 0 and stats.sxx == 0.0
+
+
+def test_grouped_regression_matches_per_group_fit(data):
+    codes, x, y = data
+    groups      = sc.grouped_regression(codes, x, y, 6)
+    assert [g.n for g in groups] == np.bincount(codes[codes >= 0], minlength=6).tolist()
+    for code in range(5):
+        expected = sc.RegressionStats.from_arrays(x[codes == code], y[codes == code])
+        for name in ("x_mean", "y_mean", "sxx", "syy", "sxy"):
+            assert getattr(groups[code], name) == pytest.approx(getattr(expected, name), rel=1e-9)
+    assert groups[5].n == 0
+
+
+def test_grouped_regression_on_students_performance():
+    df     = pd.read_csv(DATASET)
+    codes, labels = pd.factorize(df["race/ethnicity"])
+    groups = sc.grouped_regression(codes, df["X"], df["Y"], len(labels))
+    for label, stats in zip(labels, groups):
+        subset = df[df["race/ethnicity"] == label]
+        slope, intercept = np.polyfit(subset["X"], subset["Y"], 1)
+        fit    = stats.fit()
+        assert fit.n == len(subset)
+        assert fit.slope == pytest.approx(slope, rel=1e-9)
+        assert fit.intercept == pytest.approx(intercept, rel=1e-9, abs=1e-9)
+
+
+def test_bands_need_spread_in_x():
+    fit = sc.RegressionStats.from_arrays([2, 2, 2], [1, 2, 4]).fit()
+    assert not fit.has_bands
+    assert fit.confidence_band([1, 2], 0.05) is None
+    assert fit.prediction_band([1, 2], 0.05) is None
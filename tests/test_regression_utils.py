@@ -0,0 +1,26 @@
+import numpy as np
+
+from utils.regression_utils import group_sample, stratified_sample
+
+
+def test_stratified_sample_size_and_spread():
+    rng = np.random.default_rng(0)
+    x   = np.concatenate([rng.normal(0, 1, 100_000), [50.0, 60.0]])
+    idx = stratified_sample(x, 500)
+    assert 500 <= len(idx) <= 550
+    assert np.all(np.diff(idx) > 0)
+    assert {len(x) - 2, len(x) - 1} <= set(idx.tolist())     # the sparse tail is kept
+
+
+def test_stratified_sample_is_reproducible_and_small_input_is_kept():
+    x = np.random.default_rng(0).uniform(size=10_000)
+    assert np.array_equal(stratified_sample(x, 300), stratified_sample(x, 300))
+    assert np.array_equal(stratified_sample(x[:100], 300), np.arange(100))
+
+
+def test_group_sample_gives_each_group_the_same_quota():
+    codes = np.repeat([-1, 0, 1, 2], [10, 100_000, 3_000, 50])
+    idx   = group_sample(codes, 2_000)
+    counts = np.bincount(codes[idx] + 1)
+    assert counts[0] == 10 and counts[3] == 50
+    assert counts[1] == counts[2] >= 900
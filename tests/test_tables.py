@@ -0,0 +1,59 @@
+import time
+
+import numpy as np
+import pytest
+
+from stats_core import tables
+
+
+@pytest.mark.parametrize("content", [b"", b"PK\x03\x04 not really a zip archive", b"garbage"])
+def test_read_rejects_corrupt_file(tmp_path, content):
+    path = tmp_path / "critical_values.npz"
+    path.write_bytes(content)
+    assert tables._read(str(path)) is None
+
+
+@pytest.mark.parametrize("content", [b"", b"garbage"])
+def test_load_tables_regenerates_corrupt_file(tmp_path, monkeypatch, content):
+    path = tmp_path / "critical_values.npz"
+    path.write_bytes(content)
+    monkeypatch.setattr(tables, "_tables", None)
+    monkeypatch.setattr(tables, "_generating", False)
+    monkeypatch.setattr(tables, "build_tables", lambda: dict(p=tables.TAIL_GRID, df=tables.DF_GRID,
+                                                            f_df=tables.F_DF_GRID, norm_upper=np.ones(3)))
+
+    assert tables.load_tables(str(path)) is None
+    deadline = time.monotonic() + 10
+    while tables._generating and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert tables.load_tables(str(path)) is not None
+    assert tables._read(str(path)) is not None
+    assert [p.name for p in tmp_path.iterdir()] == [path.name]
+
+
+def test_failed_generation_warns_and_allows_retry(tmp_path, monkeypatch):
+    def fail():
+        raise OSError("read-only file system")
+
+    monkeypatch.setattr(tables, "_tables", None)
+    monkeypatch.setattr(tables, "_generating", True)
+    monkeypatch.setattr(tables, "build_tables", fail)
+
+    with pytest.warns(RuntimeWarning, match="read-only"):
+        tables._generate(str(tmp_path / "critical_values.npz"))
+    assert tables._tables is None
+    assert not tables._generating
+
+
+@pytest.fixture(scope="module")
+def table():
+    return tables.build_tables()
+
+
+@pytest.mark.parametrize("dist", [tables.normal(0, 1), tables.student_t(12), tables.chi_squared(1),
+                                  tables.chi_squared(30), tables.fisher_f(3, 7)])
+@pytest.mark.parametrize("alpha", [0.001, 0.05, 0.07, 0.15, 0.123, 0.2])
+def test_quantile_matches_scipy(table, dist, alpha):
+    for q in (alpha / 2, alpha, 1 - alpha, 1 - alpha / 2):
+        assert tables.quantile(dist, q, table) == pytest.approx(float(tables.ppf(dist, q)), rel=1e-12)
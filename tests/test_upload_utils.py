@@ -0,0 +1,75 @@
+import io
+import zipfile
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils import upload_utils as uu
+
+
+def csv_bytes(df: pd.DataFrame) -> bytes:
+    return df.to_csv(index=False).encode()
+
+
+def test_sniff_format():
+    assert uu.sniff_format(b"X,Y\n1,2\n") == uu.CSV
+    assert uu.sniff_format(b"PAR1....") == uu.PARQUET
+    assert uu.sniff_format(b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1rest") == uu.XLS
+
+    buffer = io.BytesIO()
+    pd.DataFrame({"X": [1], "Y": [2]}).to_excel(buffer, index=False)
+    assert uu.sniff_format(buffer.getvalue()) == uu.XLSX
+
+
+def test_sniff_format_rejects_other_zip_files():
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("word/document.xml", "<w/>")
+    with pytest.raises(uu.UnsupportedFormatError):
+        uu.sniff_format(buffer.getvalue())
+
+
+def test_iter_xy_chunks_drops_missing_rows_and_factorizes():
+    df = pd.DataFrame({"X": [1, 2, None, 4, 5], "Y": [1, None, 3, 4, 5], "g": ["a", "b", "a", None, "b"]})
+    chunks = list(uu.iter_xy_chunks(csv_bytes(df), chunk_rows=2))
+    x      = np.concatenate([c[0] for c in chunks])
+    labels = [c[2]["g"] for c in chunks]
+    assert x.tolist() == [1.0, 4.0, 5.0]
+    assert [u[c] if c >= 0 else None for codes, u in labels for c in codes] == ["a", None, "b"]
+    assert chunks[-1][3] == pytest.approx(1.0)
+
+
+def test_iter_xy_chunks_drops_high_cardinality_columns():
+    n  = 3 * uu.MAX_GROUPS
+    df = pd.DataFrame({"X": np.arange(n), "Y": np.arange(n), "g": ["a", "b", "c"] * uu.MAX_GROUPS,
+                       "id": np.arange(n), "late": ["k"] * (n - 60) + [str(i) for i in range(60)]})
+    chunks = list(uu.iter_xy_chunks(csv_bytes(df), chunk_rows=n - 60))
+    assert set(chunks[0][2]) == {"g", "late"}
+    assert set(chunks[1][2]) == {"g"}
+    store = uu.ingest_upload(csv_bytes(df), chunk_rows=n - 60)
+    assert store.categories == ["g"] and len(store) == n
+
+
+@pytest.mark.parametrize("fmt", ["csv", "xlsx", "parquet"])
+def test_formats_give_the_same_points(fmt):
+    df = pd.DataFrame({"X": [1.5, 2.0, 3.0], "Y": [2.0, 4.5, 6.0], "g": ["a", "b", "a"]})
+    buffer = io.BytesIO()
+    if fmt == "csv":
+        buffer.write(csv_bytes(df))
+    elif fmt == "xlsx":
+        df.to_excel(buffer, index=False)
+    else:
+        df.to_parquet(buffer, index=False)
+    store = uu.ingest_upload(buffer.getvalue())
+    assert store.x.tolist() == [1.5, 2.0, 3.0]
+    assert store.y.tolist() == [2.0, 4.5, 6.0]
+    assert store.labels("g") == ["a", "b"] and store.codes("g").tolist() == [0, 1, 0]
+
+
+def test_errors_name_the_problem():
+    with pytest.raises(uu.MissingColumnsError):
+        list(uu.iter_xy_chunks(b"A,Y\n1,2\n"))
+    with pytest.raises(uu.NonNumericColumnError) as error:
+        list(uu.iter_xy_chunks(b"X,Y\n1,2\n2,abc\n"))
+    assert error.value.column == "Y"
@@ -1,9 +1,12 @@
 import tomllib
-from matplotlib.colors import to_rgb
+
+from stats_core.lazy import lazy_import
+
+_mpl_colors = lazy_import("matplotlib.colors")
 
 def css_to_rgba(css_color, alpha = 0.4) -> str:
     """Converteert een CSS-kleur naar een rgba-string voor Plotly."""
-    r, g, b = [int(c * 255) for c in to_rgb(css_color)]
+    r, g, b = [int(c * 255) for c in _mpl_colors.to_rgb(css_color)]
     if PLOT_TYPE == "plt":
         return (r/255, g/255, b/255, alpha)
     else:
@@ -86,6 +89,9 @@ REGRESSION_COLOR = ACCEPTABLE_COLOR
 RESIDUAL_COLOR   = CRITICAL_COLOR
 CI_COLOR         = H0_COLOR
 PI_COLOR         = H1_COLOR
+NO_GROUP_COLOR   = "gray"
+GROUP_COLORS     = ["lightblue", "springgreen", "gold", "magenta", "tomato", "orange",
+                    "turquoise", "violet", "yellowgreen", "hotpink", "deepskyblue", "khaki"]
 
 PLOT_TYPE="plotly"
 
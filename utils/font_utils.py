@@ -0,0 +1,33 @@
+import os
+
+from stats_core.lazy import lazy_import
+
+fm = lazy_import("matplotlib.font_manager")
+
+# ----------------------------------
+# FONT REGISTRATION
+# ----------------------------------
+FONT_PATH = "./styles/JetBrainsMono-Regular.ttf"
+
+_registered = set()
+
+
+def register_fonts(font_path: str = FONT_PATH) -> None:
+    """
+    Registreert het meegeleverde font één keer bij de Matplotlib font manager.
+
+    Het font wordt met `addfont` toegevoegd aan de bestaande font manager; er
+    wordt nooit een volledige herscan van de systeemfonts gedaan.
+
+    Args:
+        font_path: Pad naar het TTF-bestand.
+    """
+    font_path = os.path.abspath(font_path)
+    if font_path in _registered:
+        return
+
+    manager = fm.fontManager
+    if not any(entry.fname == font_path for entry in manager.ttflist):
+        manager.addfont(font_path)
+
+    _registered.add(font_path)
@@ -0,0 +1,241 @@
+import numpy as np
+
+import stats_core as sc
+from utils.constants import *
+
+go = sc.lazy_import("plotly.graph_objects")
+
+# ----------------------------------
+# REGRESSION FIGURE
+# ----------------------------------
+# Above this many points the points and residuals are drawn with WebGL
+# (Scattergl), which stays smooth for 10^5+ markers where SVG does not.
+WEBGL_THRESHOLD = 2_000
+
+# From DENSITY_THRESHOLD points on the points are binned into a DENSITY_BINS²
+# heatmap and residuals are drawn for a stratified sample of RESIDUAL_SAMPLE
+# points. The regression line and bands always come from the full data.
+DENSITY_THRESHOLD = 20_000
+DENSITY_BINS      = 150
+RESIDUAL_SAMPLE   = 500
+GROUP_SAMPLE      = 2_000   # coloured points drawn over the heatmap when grouping
+
+
+def residual_segments(x, y, y_hat):
+    """
+    All residuals as one polyline: (x_i, y_i) -> (x_i, ŷ_i), separated by gaps.
+
+    Returns the x and y coordinates of a single trace; NaN breaks the line
+    between segments, like None in a list, but keeps the arrays numeric so
+    Plotly can ship them base64-encoded.
+    """
+    x, y, y_hat = (np.asarray(a, dtype=float) for a in (x, y, y_hat))
+    seg_x = np.column_stack([x, x, np.full_like(x, np.nan)]).ravel()
+    seg_y = np.column_stack([y, y_hat, np.full_like(y, np.nan)]).ravel()
+    return seg_x, seg_y
+
+
+def stratified_sample(x, size: int, n_strata: int = 50, seed: int = 0) -> np.ndarray:
+    """
+    Indices of about `size` points, spread evenly over the range of x.
+
+    x is cut into `n_strata` equal-width strata and each contributes at most
+    the same number of points, drawn at random, so the sparse tails, where
+    the residuals matter most, are not drowned out by the dense middle. That
+    per-stratum quota is the smallest that still yields `size` points. The
+    fixed seed keeps the sample the same between reruns.
+    """
+    x = np.asarray(x, dtype=float)
+    if len(x) <= size:
+        return np.arange(len(x))
+    lo, hi = x.min(), x.max()
+    strata = np.minimum(((x - lo) / (hi - lo or 1) * n_strata).astype(np.intp), n_strata - 1)
+    return _quota_sample(strata, n_strata, size, seed)
+
+
+def group_sample(codes, size: int, seed: int = 0) -> np.ndarray:
+    """
+    Indices of about `size` points with every group equally represented.
+
+    Like stratified_sample, with the groups as strata, so a small group keeps
+    all its points while a large one is thinned. Code -1 (no group) is a
+    stratum of its own.
+    """
+    codes = np.asarray(codes, dtype=np.intp)
+    if len(codes) <= size:
+        return np.arange(len(codes))
+    strata = codes + 1
+    return _quota_sample(strata, int(strata.max()) + 1, size, seed)
+
+
+def _quota_sample(strata: np.ndarray, n_strata: int, size: int, seed: int) -> np.ndarray:
+    counts = np.bincount(strata, minlength=n_strata)
+
+    q_lo, q_hi = 1, int(counts.max())
+    while q_lo < q_hi:
+        q = (q_lo + q_hi) // 2
+        if np.minimum(counts, q).sum() >= size:
+            q_hi = q
+        else:
+            q_lo = q + 1
+
+    order  = np.lexsort((np.random.default_rng(seed).random(len(strata)), strata))
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    rank   = np.arange(len(strata)) - starts[strata[order]]
+    return np.sort(order[rank < q_lo])
+
+
+def density_trace(x, y, bins: int = DENSITY_BINS) -> "go.Heatmap":
+    """Points binned into a bins × bins count heatmap; empty cells stay transparent."""
+    counts, x_edges, y_edges = np.histogram2d(x, y, bins=bins)
+    z = np.where(counts > 0, counts, np.nan).T.astype(np.float32)
+    return go.Heatmap(
+        x=(x_edges[:-1] + x_edges[1:]) / 2,
+        y=(y_edges[:-1] + y_edges[1:]) / 2,
+        z=z,
+        colorscale=[[0, css_to_rgba(POINT_COLOR, 0.25)], [1, POINT_COLOR]],
+        showscale=False,
+        hovertemplate="<i>X</i> ≈ %{x:.4g}<br><i>Y</i> ≈ %{y:.4g}<br>%{z:.0f} punten<extra></extra>",
+        name="Datapunten",
+    )
+
+
+def band_trace(x, lower, upper, fillcolor, line, name):
+    """Closed polygon between `lower` and `upper` over x."""
+    return go.Scatter(
+        x=np.concatenate([x, x[::-1]]),
+        y=np.concatenate([upper, lower[::-1]]),
+        fill="toself",
+        fillcolor=fillcolor,
+        line=line,
+        name=name,
+        showlegend=False,
+    )
+
+
+def regression_traces(x, y, fit: sc.LinearFit, x_range, conf_pct, ci=None, pi=None,
+                      webgl_threshold=WEBGL_THRESHOLD, density_threshold=DENSITY_THRESHOLD,
+                      residual_sample=RESIDUAL_SAMPLE):
+    """
+    Traces of the regression plot, back to front: PI band, CI band, residuals,
+    regression line and data points.
+
+    The trace count is at most five, whatever the number of points. From
+    `density_threshold` points on the data points become a density heatmap
+    (drawn first) and only a stratified sample of `residual_sample` residuals
+    is shown, so the figure size no longer grows with the data.
+
+    Args:
+        ci, pi:            (lower, upper) over x_range, or None to leave the band out.
+        webgl_threshold:   Draw points and residuals with Scattergl from this many points on.
+        density_threshold: Switch to the aggregated display from this many points on.
+    """
+    x       = np.asarray(x, dtype=float)
+    y       = np.asarray(y, dtype=float)
+    dense   = len(x) >= density_threshold
+    scatter = go.Scattergl if len(x) >= webgl_threshold else go.Scatter
+    traces  = [density_trace(x, y)] if dense else []
+
+    if pi is not None:
+        traces.append(band_trace(x_range, *pi, PI_FILL_COLOR, dict(color=PI_COLOR, width=1, dash="dot"),
+                                 f"{conf_pct}% voorspellingsinterval"))
+    if ci is not None:
+        traces.append(band_trace(x_range, *ci, CI_FILL_COLOR, dict(color=CI_COLOR, width=1, dash="dash"),
+                                 f"{conf_pct}% betrouwbaarheidsinterval voor E[Y|X]"))
+
+    shown        = stratified_sample(x, residual_sample) if dense else slice(None)
+    seg_x, seg_y = residual_segments(x[shown], y[shown], fit.predict(x[shown]))
+    traces.append(scatter(
+        x=seg_x, y=seg_y,
+        mode="lines",
+        line=dict(color=RESIDUAL_COLOR, width=1.5, dash="dash"),
+        showlegend=False,
+    ))
+
+    traces.append(go.Scatter(
+        x=x_range, y=fit.predict(x_range),
+        mode="lines",
+        line=dict(color=REGRESSION_COLOR, width=3),
+        name=f"Ŷ = {fit.slope:.4f}X {'+' if fit.intercept >= 0 else '-'} {abs(fit.intercept):.4f}",
+        showlegend=False,
+    ))
+
+    if not dense:
+        traces.append(scatter(
+            x=x, y=y,
+            mode="markers",
+            marker=dict(color=POINT_COLOR, size=12, line=dict(color="white", width=1)),
+            name="Datapunten",
+            showlegend=False,
+        ))
+    return traces
+
+
+# ----------------------------------
+# GROUPED REGRESSION FIGURE
+# ----------------------------------
+def group_color(code: int) -> str:
+    return GROUP_COLORS[code % len(GROUP_COLORS)]
+
+
+def group_traces(x, y, codes, labels, fits, x_range, conf_pct, alpha=None,
+                 webgl_threshold=WEBGL_THRESHOLD, density_threshold=DENSITY_THRESHOLD,
+                 group_sample_size=GROUP_SAMPLE):
+    """
+    Traces of the grouped regression plot: per group a CI band and a line,
+    and all points in one trace coloured by group.
+
+    The points stay a single trace whatever the number of groups: the group
+    code is the marker colour value on a stepped colour scale, so it ships
+    as one numeric array. From `density_threshold` points on all points
+    become a density heatmap as in regression_traces, and only a
+    group_sample of `group_sample_size` coloured points is drawn on top, so
+    the groups stay distinguishable. Groups with fewer than two points get
+    no line, groups without LinearFit.has_bands no band.
+
+    Args:
+        fits:  One LinearFit per label.
+        alpha: Significance level of the CI bands, or None to leave them out.
+    """
+    x       = np.asarray(x, dtype=float)
+    y       = np.asarray(y, dtype=float)
+    dense   = len(x) >= density_threshold
+    scatter = go.Scattergl if len(x) >= webgl_threshold else go.Scatter
+    traces  = [density_trace(x, y)] if dense else []
+
+    for code, (label, fit) in enumerate(zip(labels, fits)):
+        if fit.n < 2:
+            continue
+        color = group_color(code)
+        ci = fit.confidence_band(x_range, alpha) if alpha is not None else None
+        if ci is not None:
+            band = band_trace(x_range, *ci, css_to_rgba(color, 0.15),
+                              dict(color=color, width=1, dash="dash"), f"{conf_pct}% betrouwbaarheidsinterval")
+            band.update(legendgroup=label, hoverinfo="skip")
+            traces.append(band)
+        traces.append(go.Scatter(
+            x=x_range, y=fit.predict(x_range),
+            mode="lines",
+            line=dict(color=color, width=3),
+            name=f"{label} (n = {fit.n})",
+            legendgroup=label,
+        ))
+
+    codes = np.asarray(codes)
+    if dense:
+        shown = group_sample(codes, group_sample_size)
+        x, y, codes = x[shown], y[shown], codes[shown]
+
+    # Colour value 0 is "no group" (code -1); value g + 1 is group g.
+    n_steps    = len(labels) + 1
+    steps      = [NO_GROUP_COLOR] + [group_color(code) for code in range(len(labels))]
+    colorscale = [[(i + edge) / n_steps, color] for i, color in enumerate(steps) for edge in (0, 1)]
+    traces.append(scatter(
+        x=x, y=y,
+        mode="markers",
+        marker=dict(color=codes + 1, colorscale=colorscale, cmin=-0.5, cmax=n_steps - 0.5,
+                    size=6 if dense else 10, line=dict(color="white", width=1)),
+        name="Datapunten",
+        showlegend=False,
+    ))
+    return traces
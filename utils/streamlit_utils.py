@@ -1,10 +1,14 @@
 import streamlit as st
+import numpy as np
+import stats_core as sc
 from utils.constants import *
-from matplotlib.pyplot import rcParams
+from utils.font_utils import register_fonts
 
-import matplotlib.font_manager as fm
-fm.fontManager.addfont("./styles/JetBrainsMono-Regular.ttf")  # only if shipping the .ttf
-fm._load_fontmanager(try_read_cache=False)
+# Matplotlib is only needed by pages that draw with it; the Plotly pages
+# never import it.
+mpl_collections = sc.lazy_import("matplotlib.collections")
+mpl_colors      = sc.lazy_import("matplotlib.colors")
+plt             = sc.lazy_import("matplotlib.pyplot")
 
 def load_css(path = "./styles/style.css"):
     """Laadt de gedeelde CSS-stylesheet in de Streamlit-app."""
@@ -32,7 +36,8 @@ def page_header(title: str, subtitle: str = "") -> None:
 # MATPLOTLIB HELPERS
 # ----------------------------------
 def apply_dark_style(fig, ax, title=None, suptitle=None, xlabel=None, ylabel=None):
-    rcParams.update({
+    register_fonts()
+    plt.rcParams.update({
         "font.family": "monospace",
         "font.monospace": ["JetBrains Mono", "Courier New", "monospace"],
     })
@@ -73,21 +78,76 @@ def apply_dark_style(fig, ax, title=None, suptitle=None, xlabel=None, ylabel=Non
         label.set_fontfamily(FONT_FAMILY)
 
 def stem_plot(ax, k, y, color, highlighted=None, highlight_color=None):
-    """Draw a stem (needle) plot, optionally highlighting a subset of k values."""
-    for xi, yi in zip(k, y):
-        c = highlight_color if (highlighted is not None and xi in highlighted) else color
-        ax.plot([xi, xi], [0, yi], color=c, linewidth=1.8)
-        ax.scatter(xi, yi, color=c, s=40, zorder=3)
+    """
+    Draw a stem (needle) plot, optionally highlighting a subset of k values.
+
+    All stems are drawn as a single LineCollection and all heads as a single
+    scatter, so the number of artists does not grow with len(k).
+
+    Args:
+        highlighted: Boolean mask over k (see get_highlighted), or None.
+    """
+    k = np.asarray(k, dtype=float)
+    y = np.asarray(y, dtype=float)
+
+    colors = np.tile(mpl_colors.to_rgba(color), (len(k), 1))
+    if highlighted is not None:
+        colors[highlighted] = mpl_colors.to_rgba(highlight_color)
+
+    segments = np.zeros((len(k), 2, 2))
+    segments[:, :, 0] = k[:, None]
+    segments[:, 1, 1] = y
+
+    ax.add_collection(mpl_collections.LineCollection(segments, colors=colors, linewidths=1.8))
+    ax.scatter(k, y, c=colors, s=40, zorder=3)
+    ax.autoscale_view()
+
+
+def step_cdf_plot(ax, k, cdf_y, color, label=None, marker_size=30):
+    """
+    Draw the CDF of a discrete distribution as a step function.
+
+    The solid horizontal steps and the dotted jumps between them share a single
+    LineCollection; the closed (left) and open (right) endpoints of each step
+    share a single scatter. The artist count therefore stays at two, however
+    long k is.
+    """
+    k     = np.asarray(k, dtype=float)
+    cdf_y = np.asarray(cdf_y, dtype=float)
+    n     = len(k)
+
+    steps = np.empty((n - 1, 2, 2))
+    steps[:, 0, 0], steps[:, 1, 0] = k[:-1], k[1:]
+    steps[:, :, 1] = cdf_y[:-1, None]
+
+    jumps = np.empty((n - 1, 2, 2))
+    jumps[:, :, 0] = k[1:, None]
+    jumps[:, 0, 1], jumps[:, 1, 1] = cdf_y[:-1], cdf_y[1:]
+
+    ax.add_collection(mpl_collections.LineCollection(
+        np.concatenate([steps, jumps]),
+        colors=color,
+        linewidths=2.5,
+        linestyles=["solid"] * (n - 1) + ["dotted"] * (n - 1),
+        label=label,
+    ))
+
+    # Open dots where a step ends, closed dots (drawn on top) where one starts.
+    face = np.tile(mpl_colors.to_rgba(color), (2 * n - 1, 1))
+    face[:n - 1] = mpl_colors.to_rgba(BG_COLOR)
+    ax.scatter(np.concatenate([k[1:], k]), np.concatenate([cdf_y[:-1], cdf_y]),
+               s=marker_size, facecolors=face, edgecolors=color, linewidths=1.5, zorder=3)
+    ax.autoscale_view()
 
 
 def get_highlighted(mode, lo, hi, k):
-    """Return the set of k values that fall inside the selected region."""
+    """Return a boolean mask of the k values that fall inside the selected region."""
     if mode == r"P(X ≤ b)" and hi is not None:
-        return set(k[k <= hi])
+        return k <= hi
     elif mode == r"P(X ≥ a)" and lo is not None:
-        return set(k[k >= lo])
+        return k >= lo
     elif mode == r"P(a ≤ X ≤ b)" and lo is not None and hi is not None and lo <= hi:
-        return set(k[(k >= lo) & (k <= hi)])
+        return (k >= lo) & (k <= hi)
     return None
 
 
@@ -99,4 +159,35 @@ def add_cdf_markers(ax, k, cdf_y, mode, lo, hi):
     elif mode == r"P(X ≥ a)" and lo is not None:
         points = [(lo, cdf_y[lo])]
     elif mode == r"P(a ≤ X ≤ b)" and lo is not None and hi is not None:
-        points = [(lo, cdf_y[lo]), (hi, cdf_y[hi])]
\ No newline at end of file
+        points = [(lo, cdf_y[lo]), (hi, cdf_y[hi])]
+
+# ----------------------------------
+# SEEDS
+# ----------------------------------
+def _reseed(key):
+    st.session_state[key] = sc.new_seed()
+
+
+def seed_input(key: str = "seed") -> int:
+    """
+    Toont de seed van de sessie in de sidebar en houdt die gelijk aan de URL.
+
+    Bij het eerste bezoek wordt de seed uit de queryparameter `?seed=` gelezen
+    (of willekeurig gekozen); elke wijziging wordt teruggeschreven naar de URL,
+    zodat een gedeelde link precies dezelfde simulatie oplevert.
+
+    Returns:
+        De seed als int, bedoeld voor sc.generator / sc.derive_seed.
+    """
+    if key not in st.session_state:
+        param = st.query_params.get(key, "")
+        st.session_state[key] = int(param) if param.isdigit() and int(param) <= sc.MAX_SEED else sc.new_seed()
+
+    seed = st.number_input(
+        "Seed:", min_value=0, max_value=sc.MAX_SEED, step=1, key=key,
+        help="Dezelfde seed en parameters geven altijd dezelfde steekproeven. "
+             "De seed staat ook in de URL, zodat je een simulatie kunt delen.",
+    )
+    st.button("🎲 Nieuwe seed", on_click=_reseed, args=(key,))
+    st.query_params[key] = str(seed)
+    return int(seed)
@@ -0,0 +1,265 @@
+import hashlib
+import io
+import zipfile
+
+import numpy as np
+
+import stats_core as sc
+
+# Each reader and writer is only imported for the format that is actually used.
+pd       = sc.lazy_import("pandas")
+openpyxl = sc.lazy_import("openpyxl")
+pa       = sc.lazy_import("pyarrow")
+parquet  = sc.lazy_import("pyarrow.parquet")
+
+# ----------------------------------
+# UPLOADS
+# ----------------------------------
+XY_COLUMNS = ["X", "Y"]
+CHUNK_ROWS = 100_000
+MAX_GROUPS = 50     # most distinct values a column may have to be offered as grouping
+
+CSV, XLSX, XLS, PARQUET = "csv", "xlsx", "xls", "parquet"
+
+# Leading bytes of each binary format; anything else is read as CSV. A zip
+# archive is only an .xlsx file if it holds a workbook (.docx and plain .zip
+# files start with the same bytes).
+_MAGIC = [
+    (b"PAR1",                              PARQUET),
+    (b"PK\x03\x04",                        XLSX),
+    (b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1",  XLS),
+]
+_XLSX_WORKBOOK = "xl/workbook.xml"
+
+
+class MissingColumnsError(ValueError):
+    """Het bestand heeft geen kolom X of geen kolom Y."""
+
+
+class UnsupportedFormatError(ValueError):
+    """Het bestand is geen CSV-, Excel- of Parquet-bestand dat hier gelezen kan worden."""
+
+
+class NonNumericColumnError(ValueError):
+    """Kolom X of Y bevat een waarde die geen getal is."""
+
+    def __init__(self, column: str):
+        super().__init__(f"kolom {column} bevat waarden die geen getal zijn")
+        self.column = column
+
+
+def upload_digest(data: bytes) -> str:
+    """Inhoudshash van een bestand: gelijke inhoud geeft dezelfde digest, ongeacht de naam."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def sniff_format(data: bytes) -> str:
+    """
+    Bestandsformaat op basis van de eerste bytes, niet van de bestandsnaam.
+
+    Raises:
+        UnsupportedFormatError: voor een zip-archief zonder Excel-werkmap.
+    """
+    for magic, fmt in _MAGIC:
+        if data.startswith(magic):
+            if fmt == XLSX and not _is_workbook(data):
+                raise UnsupportedFormatError("het zip-bestand is geen Excel-werkmap (.xlsx)")
+            return fmt
+    return CSV
+
+
+def _is_workbook(data: bytes) -> bool:
+    try:
+        with zipfile.ZipFile(io.BytesIO(data)) as archive:
+            return _XLSX_WORKBOOK in archive.namelist()
+    except zipfile.BadZipFile:
+        return False
+
+
+def _check_columns(columns) -> list:
+    columns = list(columns)
+    missing = [c for c in XY_COLUMNS if c not in columns]
+    if missing:
+        raise MissingColumnsError(f"kolom(men) {', '.join(missing)} ontbreken")
+    return [columns.index(c) for c in XY_COLUMNS]
+
+
+def _other_columns(columns) -> list:
+    return [str(c) for c in columns if c not in XY_COLUMNS]
+
+
+def _to_float(values, column: str) -> np.ndarray:
+    """Waarden van kolom X of Y als float64; ontbrekende waarden (None) worden NaN."""
+    try:
+        return np.asarray(values, dtype=float)
+    except (ValueError, TypeError):
+        raise NonNumericColumnError(column) from None
+
+
+# Every reader gets the set `skip` of columns that iter_xy_chunks has dropped
+# for having more than MAX_GROUPS values. It is consulted per block, so a
+# dropped column is no longer read where the format allows it, and never
+# converted again.
+def _csv_chunks(data: bytes, chunk_rows: int, skip: set):
+    columns = pd.read_csv(io.BytesIO(data), nrows=0).columns
+    _check_columns(columns)
+    others  = _other_columns(columns)
+    if others:
+        # The column selection of a CSV reader is fixed once it runs, so the
+        # columns that already have too many values in the first block (ids,
+        # scores) are found up front and never parsed by the main reader.
+        head = pd.read_csv(io.BytesIO(data), usecols=others, dtype=str, nrows=chunk_rows)
+        skip.update(c for c in others if head[c].nunique() > MAX_GROUPS)
+        others = [c for c in others if c not in skip]
+    buffer  = io.BytesIO(data)
+    reader  = pd.read_csv(buffer, usecols=XY_COLUMNS + others, dtype={c: str for c in others}, chunksize=chunk_rows)
+    with reader:
+        for chunk in reader:
+            yield (_to_float(chunk["X"].to_numpy(), "X"), _to_float(chunk["Y"].to_numpy(), "Y"),
+                   {c: chunk[c].to_numpy() for c in others if c not in skip}, buffer.tell() / max(len(data), 1))
+
+
+def _xlsx_chunks(data: bytes, chunk_rows: int, skip: set):
+    # Read-only mode streams the sheet row by row instead of building it in memory.
+    workbook = openpyxl.load_workbook(io.BytesIO(data), read_only=True, data_only=True)
+    try:
+        sheet  = workbook.active
+        rows   = sheet.iter_rows(values_only=True)
+        header = next(rows, ())
+        ix, iy = _check_columns(header)
+        others = [(str(c), i) for i, c in enumerate(header) if c is not None and c not in XY_COLUMNS]
+        total  = max(sheet.max_row or 0, 1)
+        done   = 1
+
+        def block_arrays(block):
+            x      = _to_float([row[ix] for row in block], "X")
+            y      = _to_float([row[iy] for row in block], "Y")
+            labels = {c: np.array([row[i] for row in block], dtype=object) for c, i in others if c not in skip}
+            return x, y, labels
+
+        block = []
+        for row in rows:
+            block.append(row)
+            if len(block) == chunk_rows:
+                done += len(block)
+                yield *block_arrays(block), min(done / total, 1.0)
+                block = []
+        if block:
+            yield *block_arrays(block), 1.0
+    finally:
+        workbook.close()
+
+
+def _xls_chunks(data: bytes, chunk_rows: int, skip: set):
+    # The legacy .xls format cannot be streamed; it is read in one go.
+    try:
+        df = pd.read_excel(io.BytesIO(data))
+    except ImportError:
+        # pandas reads .xls with the optional package xlrd.
+        raise UnsupportedFormatError("oude .xls-bestanden vereisen het pakket xlrd; "
+                                     "sla het bestand op als .xlsx of CSV") from None
+    _check_columns(df.columns)
+    # The whole sheet is one block, so the cardinality check runs on all of it
+    # before any column is converted or factorized.
+    others = {str(c): c for c in df.columns if c not in XY_COLUMNS}
+    skip.update(name for name, c in others.items() if df[c].nunique() > MAX_GROUPS)
+    labels = {name: df[c].to_numpy(dtype=object) for name, c in others.items() if name not in skip}
+    yield _to_float(df["X"].to_numpy(), "X"), _to_float(df["Y"].to_numpy(), "Y"), labels, 1.0
+
+
+def _parquet_chunks(data: bytes, chunk_rows: int, skip: set):
+    file   = parquet.ParquetFile(io.BytesIO(data))
+    names  = file.schema_arrow.names
+    _check_columns(names)
+    others = _other_columns(names)
+    total  = max(file.metadata.num_rows, 1)
+    done   = 0
+    # Parquet is columnar: from the next row group on, dropped columns are not read.
+    for group in range(file.num_row_groups):
+        columns = XY_COLUMNS + [c for c in others if c not in skip]
+        for batch in file.iter_batches(batch_size=chunk_rows, row_groups=[group], columns=columns):
+            done  += batch.num_rows
+            x, y   = (_to_float(batch.column(c).to_numpy(zero_copy_only=False), c) for c in XY_COLUMNS)
+            labels = {c: batch.column(c).to_numpy(zero_copy_only=False) for c in columns[2:] if c not in skip}
+            yield x, y, labels, done / total
+
+
+_READERS = {CSV: _csv_chunks, XLSX: _xlsx_chunks, XLS: _xls_chunks, PARQUET: _parquet_chunks}
+
+
+def iter_xy_chunks(data: bytes, chunk_rows: int = CHUNK_ROWS):
+    """
+    Leest een CSV-, Excel- of Parquet-bestand in blokken.
+
+    De kolommen X en Y worden als float64 ingelezen; rijen waarin een van
+    beide ontbreekt vallen weg. De overige kolommen komen mee in
+    gefactoriseerde vorm (codes, labels), met code -1 voor een ontbrekende
+    waarde, zodat ze als groepering kunnen dienen. Een kolom met meer dan
+    MAX_GROUPS verschillende waarden (zoals een score of een id) valt weg:
+    vanaf dat blok ontbreekt hij in de uitvoer en wordt hij, waar het
+    formaat dat toelaat, niet meer ingelezen. Zo staat nooit het hele
+    bestand als DataFrame in het geheugen.
+
+    Yields:
+        (x, y, categories, fraction): de arrays van één blok, een dict met
+        per nog aanwezige overige kolom (codes, labels) van dat blok en het
+        deel van het bestand dat tot dan toe is gelezen (0 tot 1).
+
+    Raises:
+        MissingColumnsError:    als kolom X of Y ontbreekt.
+        NonNumericColumnError:  als kolom X of Y iets anders dan getallen bevat.
+        UnsupportedFormatError: als het formaat niet gelezen kan worden.
+    """
+    skip = set()
+    seen = {}   # column -> distinct labels so far, at most MAX_GROUPS
+    for x, y, labels, fraction in _READERS[sniff_format(data)](data, chunk_rows, skip):
+        keep       = ~(np.isnan(x) | np.isnan(y))
+        categories = {}
+        for column, values in labels.items():
+            if column in skip:
+                continue
+            codes, uniques = pd.factorize(values[keep])
+            seen.setdefault(column, set()).update(map(str, uniques))
+            if len(seen[column]) > MAX_GROUPS:
+                skip.add(column)
+                del seen[column]
+            else:
+                categories[column] = (codes, uniques)
+        yield x[keep], y[keep], categories, fraction
+
+
+def ingest_upload(data: bytes, on_progress=None, chunk_rows: int = CHUNK_ROWS) -> sc.PointStore:
+    """
+    Leest de punten van een bestand in een nieuwe PointStore.
+
+    Elk blok wordt direct aan de store toegevoegd, die daarbij ook de
+    regressiestatistieken bijwerkt. Bij een fout blijven de huidige punten
+    van de pagina dus ongemoeid. De overige kolommen komen als categorische
+    kolommen in de store; een kolom die iter_xy_chunks onderweg laat vallen,
+    verdwijnt ook uit de store.
+
+    Args:
+        on_progress: Wordt na elk blok aangeroepen met (fraction, rows).
+    """
+    store = sc.PointStore()
+    for x, y, categories, fraction in iter_xy_chunks(data, chunk_rows):
+        store.extend(x, y, categories)
+        for column in set(store.categories) - set(categories):
+            store.drop_category(column)
+        if on_progress is not None:
+            on_progress(fraction, len(store))
+    return store
+
+# ----------------------------------
+# DOWNLOADS
+# ----------------------------------
+def points_csv(x, y) -> bytes:
+    """De punten als CSV met kolommen X en Y, zoals de upload ze verwacht."""
+    return pd.DataFrame({"X": x, "Y": y}).to_csv(index=False).encode()
+
+
+def points_parquet(x, y) -> bytes:
+    """De punten als Parquet-bestand met float64-kolommen X en Y."""
+    buffer = io.BytesIO()
+    parquet.write_table(pa.table({"X": np.asarray(x, dtype=float), "Y": np.asarray(y, dtype=float)}), buffer)
+    return buffer.getvalue()